@@ -1,8 +1,10 @@
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import csv
+import json
 import os
 from AutoGradeSystem import AutoGradeSystem  # Import the class
+from compression import dynamic_response
 
 app = Flask(__name__, static_folder='frontend')
 CORS(app)  # Enable CORS for all routes
@@ -33,11 +35,12 @@ def add_grade():
         else:
             avg = 'N/A'
             
-        return jsonify({
+        # The grade list grows with every entry, so send it compressed when allowed
+        return dynamic_response(json.dumps({
             'message': 'Grade added',
             'average': f"{avg:.2f}" if avg != 'N/A' else 'N/A',
             'grades': [{'name': g['name'], 'score': g['score'], 'grade': g['grade']} for g in grade_system.grades]
-        })
+        }).encode('utf-8'))
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
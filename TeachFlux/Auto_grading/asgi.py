@@ -0,0 +1,25 @@
+# Async (ASGI) serving mode for the auto-grading API
+# Run with: uvicorn asgi:application --host 0.0.0.0 --port 5001
+#
+# Same routes and handlers as app.py, in one process as grades live in its
+# memory. Client connections are multiplexed on the event loop, handlers
+# (including the grades.csv write of /save_to_csv) run in a thread pool.
+#
+#   ASGI_THREADS   threads running request handlers (4)
+#   ASGI_MAX_BODY  largest request body accepted, in bytes (1048576)
+
+import os
+import sys
+
+# The bridge is shared with the other app
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'shared'))
+
+from asgi_bridge import MAX_BODY_SIZE, WSGIBridge
+from app import app
+
+
+application = WSGIBridge(
+    app,
+    max_threads=int(os.environ.get('ASGI_THREADS', '4')),
+    max_body_size=int(os.environ.get('ASGI_MAX_BODY', str(MAX_BODY_SIZE))),
+)
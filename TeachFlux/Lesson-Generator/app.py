@@ -1,8 +1,87 @@
-from flask import Flask, render_template, request, jsonify
-from syllabus_db import syllabus_db
-import random
+from flask import Flask, render_template, request, jsonify, redirect
+from flask_cors import CORS
+from syllabus_db import syllabus_db, SYLLABUS_FILE, SYLLABUS_STAMP
+from syllabus_reload import build_syllabus, SyllabusWatcher
+from lesson_cache import LessonCache, TinyLFUCache, TopicStats, CachedLesson, make_etag
+from lesson_text import count_words, strip_tags, WordCounter
+from search_index import SearchIndex
+from topic_equivalence import TopicEquivalents
+from catalog import build_catalog
+from compression import CompressedBody, compressed_response
+from lesson_store import LessonStore
+from lesson_bundle import LessonBundle
+from lesson_sections import LessonSections
+from single_flight import SingleFlight
+from poller import Poller
+from lessons import get_registry, last_modified, content_version, use_store, refresh as refresh_registries
+from content_store import ContentStore, FALLBACK_TOPIC
+from functools import lru_cache
+from urllib.parse import quote
+import hashlib
+import json
+import os
+import threading
+import time
 
 app = Flask(__name__)
+CORS(app)  # The React app loads lesson sections from another origin
+# Memory budget of the rendered lesson cache, in bytes
+LESSON_CACHE_BYTES = int(os.environ.get('LESSON_CACHE_BYTES', 16 * 1024 * 1024))
+
+# Syllabus lessons come from the bundle or the warm store first, so this cache
+# only sees traffic with LESSON_WARM_START=off or before warm-up finishes
+lesson_cache = TinyLFUCache(max_bytes=LESSON_CACHE_BYTES)
+# How often each topic is asked for, and which tier served it
+topic_stats = TopicStats()
+# Rendered template bodies by (exam, template), shared by topics that use the same lesson
+lesson_bodies = LessonCache(maxsize=128)
+# Lessons split into sections, checked against the lesson's ETag on every use
+lesson_sections = LessonCache(maxsize=256)
+# Concurrent cache misses for one lesson wait for a single render
+lesson_renders = SingleFlight()
+lesson_store = LessonStore()
+# Warm-up, syllabus swaps and content refreshes all republish lessons into the
+# store, bundle and search index from their own threads, one at a time
+lesson_reload_lock = threading.Lock()
+
+# Render every syllabus lesson at startup: 'sync' (default), 'background' or 'off'
+LESSON_WARM_START = os.environ.get('LESSON_WARM_START', 'sync')
+
+# Lessons shorter than this are padded by padding_parts
+MIN_LESSON_WORDS = 500
+
+# How long browsers and proxies may reuse a lesson from /api/lessons
+LESSON_MAX_AGE = 300
+
+# Upper bound on lessons rendered by one /api/generate_notes request
+MAX_BATCH_LESSONS = 200
+
+# Size of the pieces a ?stream=1 lesson is sent in
+STREAM_CHUNK_BYTES = 4096
+
+# Upper bound on results returned by one /api/search request
+MAX_SEARCH_RESULTS = 50
+
+# Upper bound on topics returned by one /api/topics/suggest request
+MAX_SUGGESTIONS = 25
+
+# SQLite content store built by import_lessons.py, lessons/ modules are used when unset
+LESSON_DB = os.environ.get('LESSON_DB')
+
+# How often a worker checks the content store for edited lessons, in seconds
+LESSON_POLL_SECONDS = float(os.environ.get('LESSON_POLL_SECONDS', '2'))
+
+if LESSON_DB:
+    use_store(ContentStore(LESSON_DB))
+
+# Prebuilt bundle from build_bundle.py, mapped read-only and shared by every worker
+LESSON_BUNDLE = os.environ.get('LESSON_BUNDLE')
+
+# When the lesson bodies last changed
+LESSONS_MODIFIED = last_modified()
+
+# How often each worker checks the syllabus file for edits, 0 disables reloading
+SYLLABUS_POLL_SECONDS = float(os.environ.get('SYLLABUS_POLL_SECONDS', '5'))
 
 # Enhanced error handling
 @app.errorhandler(404)
@@ -20,26 +99,87 @@ def get_topics():
     try:
         exam = request.args.get('exam')
         subject = request.args.get('subject')
+        tree = syllabus.tree
         
         if not exam or not subject:
             return jsonify(error="Both exam and subject parameters are required"), 400
             
-        if exam not in syllabus_db:
+        if exam not in tree:
             return jsonify(error=f"Exam body '{exam}' not found"), 404
             
-        if subject not in syllabus_db[exam]:
+        if subject not in tree[exam]:
             return jsonify(error=f"Subject '{subject}' not found for {exam}"), 404
             
         return jsonify({
             'exam': exam,
             'subject': subject,
-            'topics': syllabus_db[exam][subject]
+            'topics': tree[exam][subject]
         })
         
     except Exception as e:
         app.logger.error(f"Error getting topics: {str(e)}")
         return jsonify(error="Could not retrieve topics"), 500
 
+# Topic autocomplete across every exam body, one request per keystroke
+@app.route('/api/topics/suggest', methods=['GET'])
+def suggest_topics():
+    try:
+        prefix = request.args.get('prefix', '').strip()
+        if not prefix:
+            return jsonify(error="Query parameter 'prefix' is required"), 400
+        try:
+            limit = int(request.args.get('limit', 10))
+        except ValueError:
+            return jsonify(error="'limit' must be a number"), 400
+        if not 1 <= limit <= MAX_SUGGESTIONS:
+            return jsonify(error=f"'limit' must be between 1 and {MAX_SUGGESTIONS}"), 400
+
+        keys = syllabus.suggester.suggest(
+            prefix, limit, exam=request.args.get('exam') or None, subject=request.args.get('subject') or None)
+        return jsonify({
+            'prefix': prefix,
+            'suggestions': [
+                {'exam': exam, 'subject': subject, 'topic': topic, 'url': lesson_url(exam, subject, topic)}
+                for exam, subject, topic in keys
+            ]
+        })
+
+    except Exception as e:
+        app.logger.error(f"Error suggesting topics: {str(e)}")
+        return jsonify(error="Could not suggest topics"), 500
+
+# Other exam bodies' versions of a topic, from the precomputed equivalence matrix
+@app.route('/api/topics/<exam>/<subject>/<topic>/equivalents', methods=['GET'])
+def topic_equivalents(exam, subject, topic):
+    try:
+        current = syllabus
+        key = current.canonical.get((exam.casefold(), subject.casefold(), topic.casefold()))
+        if not key:
+            return jsonify(error=f"Topic '{topic}' not found in {exam} {subject} syllabus"), 404
+
+        template = current.index.lookup(*key)
+        return jsonify({
+            'exam': key[0],
+            'subject': key[1],
+            'topic': key[2],
+            'equivalents': [
+                {
+                    'exam': other[0],
+                    'subject': other[1],
+                    'topic': other[2],
+                    'score': round(score, 4),
+                    # Same authored lesson, only the exam name filled into it differs
+                    'same_lesson': template is not None and current.index.lookup(*other) is template,
+                    'url': lesson_url(*other)
+                }
+                for other, score in load_equivalents().equivalents(key)
+            ]
+        })
+
+    except Exception as e:
+        app.logger.error(f"Error finding equivalent topics: {str(e)}")
+        return jsonify(error="Could not find equivalent topics"), 500
+
 # Lesson note generation endpoint
 @app.route('/api/generate_note', methods=['POST'])
 def generate_note():
@@ -57,31 +197,409 @@ def generate_note():
             return jsonify(error="Exam, subject and topic are all required"), 400
             
         # Verify the topic exists
-        try:
-            if topic not in syllabus_db[exam][subject]:
-                return jsonify(error=f"Topic '{topic}' not found in {exam} {subject} syllabus"), 404
-        except KeyError:
+        tree = syllabus.tree
+        if exam not in tree or subject not in tree[exam]:
             return jsonify(error="Invalid exam or subject specified"), 400
+        if not tree.has_topic(exam, subject, topic):
+            return jsonify(error=f"Topic '{topic}' not found in {exam} {subject} syllabus"), 404
             
-        # Generate comprehensive lesson note
-        lesson_note = generate_complete_lesson(exam, subject, topic)
-        if not lesson_note:
+        if request.args.get('stream'):
+            # Streaming mode sends a lesson that was not cached yet in chunks, once rendered
+            lesson = find_cached_lesson(exam, subject, topic)
+            if lesson is None:
+                lesson = render_once(exam, subject, topic)
+                if lesson:
+                    return app.response_class(lesson_chunks(lesson), mimetype='application/json')
+        else:
+            # Generate comprehensive lesson note
+            lesson = get_lesson(exam, subject, topic)
+        if not lesson:
             return jsonify(error="Failed to generate lesson content"), 500
-            
-        return jsonify({
+
+        return lesson_response(lesson)
+
+    except Exception as e:
+        app.logger.error(f"Error generating note: {str(e)}")
+        return jsonify(error="Error generating lesson note"), 500
+
+# Cacheable lesson resource, same note as /api/generate_note
+@app.route('/api/lessons/<exam>/<subject>/<topic>', methods=['GET'])
+def lesson_resource(exam, subject, topic):
+    try:
+        canonical = syllabus.canonical.get((exam.casefold(), subject.casefold(), topic.casefold()))
+        if not canonical:
+            return jsonify(error=f"Topic '{topic}' not found in {exam} {subject} syllabus"), 404
+
+        # One URL per lesson so caches in front of us are not fragmented
+        if canonical != (exam, subject, topic):
+            return redirect(lesson_url(*canonical), code=301)
+
+        lesson = get_lesson(exam, subject, topic)
+        if not lesson:
+            return jsonify(error="Failed to generate lesson content"), 500
+
+        return public_response(lesson.payload, lesson.etag, lesson.last_modified)
+
+    except Exception as e:
+        app.logger.error(f"Error serving lesson: {str(e)}")
+        return jsonify(error="Error generating lesson note"), 500
+
+# Table of contents of a lesson, its sections are fetched one at a time
+@app.route('/api/lessons/<exam>/<subject>/<topic>/toc', methods=['GET'])
+def lesson_toc(exam, subject, topic):
+    try:
+        sections, error = find_lesson_sections(exam, subject, topic, '/toc')
+        if error:
+            return error
+        return public_response(sections.toc, sections.etag + '-toc', sections.last_modified)
+
+    except Exception as e:
+        app.logger.error(f"Error serving lesson contents: {str(e)}")
+        return jsonify(error="Error generating lesson note"), 500
+
+# One section of a lesson, numbered as in its table of contents
+@app.route('/api/lessons/<exam>/<subject>/<topic>/sections/<int:index>', methods=['GET'])
+def lesson_section(exam, subject, topic, index):
+    try:
+        sections, error = find_lesson_sections(exam, subject, topic, f'/sections/{index}')
+        if error:
+            return error
+        if index >= len(sections):
+            return jsonify(error=f"Lesson has {len(sections)} sections, there is no section {index}"), 404
+        return public_response(sections.payloads[index], f"{sections.etag}-s{index}", sections.last_modified)
+
+    except Exception as e:
+        app.logger.error(f"Error serving lesson section: {str(e)}")
+        return jsonify(error="Error generating lesson note"), 500
+
+def find_lesson_sections(exam, subject, topic, path):
+    """(LessonSections, None) for a lesson, or (None, response) for a 404, redirect or failure"""
+    canonical = syllabus.canonical.get((exam.casefold(), subject.casefold(), topic.casefold()))
+    if not canonical:
+        return None, (jsonify(error=f"Topic '{topic}' not found in {exam} {subject} syllabus"), 404)
+    if canonical != (exam, subject, topic):
+        return None, redirect(lesson_url(*canonical) + path, code=301)
+
+    lesson = get_lesson(exam, subject, topic)
+    if not lesson:
+        return None, (jsonify(error="Failed to generate lesson content"), 500)
+
+    # Split once per rendered version of the lesson
+    sections = lesson_sections.get(canonical)
+    if sections is None or sections.etag != lesson.etag:
+        sections = LessonSections(
+            canonical, lesson.note, lesson.etag, lesson.last_modified,
+            lambda index: f"{lesson_url(*canonical)}/sections/{index}")
+        lesson_sections.put(canonical, sections)
+    return sections, None
+
+def public_response(compressed, etag, last_modified):
+    """Precompressed JSON that browsers and shared caches may reuse for LESSON_MAX_AGE"""
+    response = compressed_response(compressed, etag=etag, last_modified=last_modified)
+    response.cache_control.public = True
+    response.cache_control.max_age = LESSON_MAX_AGE
+    return response
+
+def lesson_url(exam, subject, topic):
+    """Canonical, percent-encoded URL of a lesson resource"""
+    return '/api/lessons/' + '/'.join(quote(part, safe='') for part in (exam, subject, topic))
+
+def lesson_response(lesson):
+    """JSON response for a lesson, or an empty 304 if the client already has it"""
+    return compressed_response(lesson.payload, etag=lesson.etag, last_modified=lesson.last_modified)
+
+# Batch lesson generation, streamed back one lesson per NDJSON line
+@app.route('/api/generate_notes', methods=['POST'])
+def generate_notes():
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify(error="No data received"), 400
+
+        if 'lessons' in data:
+            # Explicit list of {exam, subject, topic} objects or [exam, subject, topic] triples
+            items = data['lessons']
+            if not isinstance(items, list) or not items:
+                return jsonify(error="'lessons' must be a non-empty list"), 400
+            keys = []
+            for item in items:
+                if isinstance(item, dict):
+                    item = (item.get('exam'), item.get('subject'), item.get('topic'))
+                if not isinstance(item, (list, tuple)) or len(item) != 3:
+                    return jsonify(error="Each lesson needs an exam, subject and topic"), 400
+                if not all(isinstance(part, str) and part for part in item):
+                    return jsonify(error="Exam, subject and topic are all required"), 400
+                keys.append(tuple(item))
+        else:
+            # Whole subject
+            exam = data.get('exam')
+            subject = data.get('subject')
+            if not exam or not subject:
+                return jsonify(error="Either a lessons list or an exam and subject are required"), 400
+            try:
+                keys = [(exam, subject, topic) for topic in syllabus.tree[exam][subject]]
+            except (KeyError, TypeError):
+                return jsonify(error="Invalid exam or subject specified"), 400
+
+        if len(keys) > MAX_BATCH_LESSONS:
+            return jsonify(error=f"At most {MAX_BATCH_LESSONS} lessons per request"), 400
+
+        return app.response_class(stream_lessons(keys), mimetype='application/x-ndjson')
+
+    except Exception as e:
+        app.logger.error(f"Error generating notes: {str(e)}")
+        return jsonify(error="Error generating lesson notes"), 500
+
+def stream_lessons(keys):
+    """Yield one NDJSON line per lesson, rendering through the lesson cache"""
+    index = syllabus.index
+    for exam, subject, topic in keys:
+        if (exam, subject, topic) not in index:
+            error = f"Topic '{topic}' not found in {exam} {subject} syllabus"
+        else:
+            # Each line is sent as soon as its lesson is ready, misses render one at a time
+            lesson = get_lesson(exam, subject, topic)
+            if lesson:
+                # Bundled payloads are memoryviews, WSGI servers only accept bytes
+                yield bytes(lesson.payload.body) + b'\n'
+                continue
+            error = "Failed to generate lesson content"
+
+        yield json.dumps({
             'exam': exam,
             'subject': subject,
             'topic': topic,
-            'note': lesson_note
+            'error': error
+        }, ensure_ascii=False).encode('utf-8') + b'\n'
+
+# Whole syllabus in one response, cached by clients and revalidated by ETag
+@app.route('/api/catalog', methods=['GET'])
+def get_catalog():
+    catalog = load_catalog()
+    response = compressed_response(catalog.payload, etag=catalog.version)
+    response.cache_control.public = True
+    response.cache_control.max_age = LESSON_MAX_AGE
+    return response
+
+# Syllabus topics that still serve the placeholder lesson
+@app.route('/api/coverage', methods=['GET'])
+def lesson_coverage():
+    return jsonify(syllabus.index.coverage())
+
+# Full-text search over every syllabus lesson, BM25-ranked with highlighted snippets
+@app.route('/api/search', methods=['GET'])
+def search_lessons():
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify(error="Query parameter 'q' is required"), 400
+        try:
+            limit = int(request.args.get('limit', 10))
+        except ValueError:
+            return jsonify(error="'limit' must be a number"), 400
+        if not 1 <= limit <= MAX_SEARCH_RESULTS:
+            return jsonify(error=f"'limit' must be between 1 and {MAX_SEARCH_RESULTS}"), 400
+
+        index = load_search_index()
+        started = time.perf_counter()
+        total, results = index.search(query, limit)
+        return jsonify({
+            'query': query,
+            'total': total,
+            'took_ms': round((time.perf_counter() - started) * 1000, 3),
+            'results': [
+                {
+                    'exam': exam,
+                    'subject': subject,
+                    'topic': topic,
+                    'score': round(score, 4),
+                    'snippet': snippet,
+                    'url': lesson_url(exam, subject, topic)
+                }
+                for (exam, subject, topic), score, snippet in results
+            ]
         })
-        
+
     except Exception as e:
-        app.logger.error(f"Error generating note: {str(e)}")
-        return jsonify(error="Error generating lesson note"), 500
+        app.logger.error(f"Error searching lessons: {str(e)}")
+        return jsonify(error="Could not search lessons"), 500
+
+# Lesson cache statistics
+@app.route('/api/cache_stats', methods=['GET'])
+def cache_stats():
+    # hits and misses of the LRU cache alone, 'tiers' and 'topics' cover every lookup
+    stats = lesson_cache.stats()
+    stats['tiers'] = topic_stats.totals()
+    stats['topics'] = []
+    for (exam, subject, topic), tiers in topic_stats.top():
+        misses = tiers.get('misses', 0)
+        stats['topics'].append({
+            'exam': exam, 'subject': subject, 'topic': topic,
+            'hits': sum(tiers.values()) - misses, 'misses': misses, 'tiers': tiers,
+            'frequency': lesson_cache.estimate((exam, subject, topic)),
+        })
+    stats['bodies'] = lesson_bodies.stats()
+    # 'coalesced' counts the renders saved by waiting on one already in progress
+    stats['renders'] = lesson_renders.stats()
+    return jsonify(stats)
+
+# Readiness probe, 503 until the lesson store is warm
+@app.route('/api/ready', methods=['GET'])
+def readiness():
+    status = lesson_store.status()
+    status['warm_start'] = LESSON_WARM_START
+    status['syllabus_version'] = syllabus.version
+    status['bundle'] = len(lesson_bundle) if lesson_bundle is not None else 0
+    if lesson_bundle is None and LESSON_WARM_START != 'off' and not status['ready']:
+        return jsonify(status), 503
+    return jsonify(status)
 
 def generate_complete_lesson(exam, subject, topic):
     """Generate comprehensive lesson notes with minimum 500 words"""
+    lesson = get_lesson(exam, subject, topic)
+    return lesson.note if lesson else None
+
+def get_lesson(exam, subject, topic):
+    """Return the cached lesson for a topic, rendering it on a miss"""
+    lesson = find_cached_lesson(exam, subject, topic)
+    if lesson is None:
+        lesson = render_once(exam, subject, topic)
+    return lesson
+
+def render_once(exam, subject, topic):
+    """Render and cache a lesson, sharing the render with concurrent requests for it"""
+    # 40 students opening the same cold topic at once cost one render, not 40.
+    # Only the render is shared, each response is then sent on its own, so a
+    # slow client never holds up the others.
+    return lesson_renders.do((exam, subject, topic), render_and_cache_lesson, exam, subject, topic)
+
+def lesson_chunks(lesson):
+    """Yield a lesson's JSON body in STREAM_CHUNK_BYTES pieces"""
+    body = lesson.payload.body
+    for start in range(0, len(body), STREAM_CHUNK_BYTES):
+        yield bytes(body[start:start + STREAM_CHUNK_BYTES])
+
+def render_and_cache_lesson(exam, subject, topic):
+    """Render a lesson and add it to the LRU cache, None if rendering failed"""
+    note = build_lesson(exam, subject, topic)
+    return cache_lesson(exam, subject, topic, note) if note else None
+
+def find_cached_lesson(exam, subject, topic, record=True):
+    """Lesson from the bundle, the warm store or the LRU cache, without rendering
+
+    Lookups are counted per topic in topic_stats unless record is false.
+    """
+    key = (exam, subject, topic)
+    tier, lesson = 'bundle', lesson_bundle.get(key) if lesson_bundle is not None else None
+    if lesson is None:
+        tier, lesson = 'store', lesson_store.get(key)
+    if lesson is None:
+        tier, lesson = 'cache', lesson_cache.get(key)
+    if record:
+        topic_stats.record(key, tier if lesson is not None else None)
+    return lesson
+
+def package_lesson(exam, subject, topic, note):
+    """Wrap a rendered note as a CachedLesson"""
+    # Serialize and compress once, every hit then just picks a variant
+    payload = CompressedBody(json.dumps({
+        'exam': exam,
+        'subject': subject,
+        'topic': topic,
+        'note': note
+    }, ensure_ascii=False).encode('utf-8'))
+    return CachedLesson(note, make_etag(exam, subject, topic, note), LESSONS_MODIFIED, payload)
+
+def cache_lesson(exam, subject, topic, note):
+    """Wrap a rendered note as a CachedLesson and store it"""
+    lesson = package_lesson(exam, subject, topic, note)
+    lesson_cache.put((exam, subject, topic), lesson)
+    return lesson
+
+def render_lesson(exam, subject, topic):
+    """Render and package a lesson without touching any cache"""
+    note = build_lesson(exam, subject, topic)
+    return package_lesson(exam, subject, topic, note) if note else None
+
+def refresh_lesson_content():
+    """Apply edits from the content store, dropping only the lessons they affect"""
+    global LESSONS_MODIFIED
+    with lesson_reload_lock:
+        changes = refresh_registries()
+        if not changes:
+            return 0
+        index = syllabus.index
+        affected = set()
+        for subject, (old, new, changed) in changes.items():
+            for key in index.subjects.get(subject, ()):
+                before = old.topic_for(key[2]) if old else None
+                after = new.topic_for(key[2]) if new else None
+                # A topic is stale if it now resolves elsewhere or the lesson it uses was edited
+                if before != after or (FALLBACK_TOPIC if after is None else after) in changed:
+                    affected.add(key)
+            index.invalidate(subject)
+        LESSONS_MODIFIED = last_modified()
+        # Off-syllabus topics of a changed subject are cheap to re-render, drop them all
+        lesson_cache.discard_where(lambda key: key in affected or (key[1] in changes and key not in index))
+        publish_lessons({key: render_lesson(*key) for key in affected})
+        load_catalog.cache_clear()
+        load_equivalents.cache_clear()
+        app.logger.info(f"Lesson content reloaded: {', '.join(sorted(changes))}, {len(affected)} topics invalidated")
+        return len(affected)
+
+def warm_lesson_store():
+    """Render every syllabus lesson into the frozen store and log what it cost"""
+    with lesson_reload_lock:
+        seconds = lesson_store.warm(list(syllabus.index), render_lesson)
+        load_catalog()
+        load_search_index()
+        load_equivalents()
+        app.logger.info(f"Lesson store warm: {len(lesson_store)} lessons in {seconds * 1000:.1f} ms")
+
+def publish_lessons(lessons):
+    """Push re-rendered lessons into the warm store and search index, a None lesson is dropped
+
+    Callers hold lesson_reload_lock, the updates below are read-copy-replace.
+    """
+    if lesson_bundle is not None:
+        # The bundle is read-only, its stale copies stop being served
+        lesson_bundle.discard(lessons)
+    if lesson_store.ready.is_set():
+        lesson_store.update(lessons)
+    if load_search_index.cache_info().currsize:
+        index = load_search_index()
+        for key, lesson in lessons.items():
+            if lesson is None:
+                index.remove(key)
+            else:
+                index.update(key, strip_tags(lesson.note))
+
+def build_lesson(exam, subject, topic):
+    """Render a lesson note without going through the cache"""
     try:
+        return ''.join(iter_lesson(exam, subject, topic)) or None
+        
+    except Exception as e:
+        app.logger.error(f"Content generation error: {str(e)}")
+        return None
+
+def iter_lesson(exam, subject, topic):
+    """Yield a lesson note section by section, as it is rendered"""
+    # Syllabus topics were resolved to their template at startup
+    template = syllabus.index.lookup(exam, subject, topic)
+    body_key = body = None
+    if template is not None and 'topic' not in template.fields:
+        # Equivalent topics in one exam (Differentiation and Integration) share one render of the body
+        body_key = (exam, template)
+        body = lesson_bodies.get(body_key)
+    if body is not None:
+        pieces, words = body
+        yield from pieces
+        yield from padding_parts(words, topic, exam, seed=lesson_seed(exam, subject, topic))
+        return
+    if template is not None:
+        pieces = template.iter_render(exam=exam, topic=topic)
+    else:
         # Get subject-specific generator
         generator = {
             "Mathematics": generate_math_lesson,
@@ -92,25 +610,41 @@ def generate_complete_lesson(exam, subject, topic):
         }.get(subject)
         
         if not generator:
-            return None
+            return
             
         # Generate content
-        content = generator(exam, topic)
-        if not content:
-            return None
-            
-        # Ensure minimum length
-        if len(content.split()) < 500:
-            content = enhance_content(content, topic, exam)
-            
-        return content
-        
-    except Exception as e:
-        app.logger.error(f"Content generation error: {str(e)}")
-        return None
+        pieces = [generator(exam, topic)]
+
+    counter = WordCounter()
+    rendered = []
+    for piece in pieces:
+        counter.feed(piece)
+        rendered.append(piece)
+        yield piece
+    words = counter.close()
+    if body_key is not None:
+        lesson_bodies.put(body_key, (tuple(rendered), words))
+        
+    # Ensure minimum length
+    yield from padding_parts(words, topic, exam, seed=lesson_seed(exam, subject, topic))
+
+def lesson_seed(exam, subject, topic):
+    """Stable padding seed for one lesson"""
+    return f"{exam}/{subject}/{topic}"
+
+def seeded_indexes(seed, count):
+    """Endless sequence of indexes below count, fixed by seed"""
+    counter = 0
+    while True:
+        digest = hashlib.sha256(f"{seed}#{counter}".encode('utf-8')).digest()
+        yield int.from_bytes(digest[:4], 'big') % count
+        counter += 1
 
-def enhance_content(base_content, topic, exam):
-    """Enhance content to meet minimum length requirements"""
+def padding_parts(words, topic, exam, seed):
+    """Yield the enhancements that take a lesson of `words` words to the minimum length
+
+    The same seed always picks the same enhancements, see lesson_seed.
+    """
     enhancements = [
         f"\n\n## Detailed Explanation\nThis section provides an in-depth analysis of {topic} as required by the {exam} syllabus.",
         "\n\n## Practical Applications\n1. Real-world use case 1\n2. Industry application\n3. Everyday examples",
@@ -119,2748 +653,133 @@ def enhance_content(base_content, topic, exam):
         f"\n\n## {exam} Exam Focus\n- Frequently tested aspects\n- Marking scheme considerations\n- Time management tips"
     ]
     
-    while len(base_content.split()) < 500:
-        base_content += random.choice(enhancements)
-        
-    return base_content
+    picks = seeded_indexes(seed, len(enhancements))
+
+    # Add each enhancement's words as it is appended instead of recounting
+    enhancement_words = [count_words(text) for text in enhancements]
+    for index in picks:
+        if words >= MIN_LESSON_WORDS:
+            break
+        yield enhancements[index]
+        words += enhancement_words[index]
+
+# ===== SUBJECT LESSONS =====
+# Lesson bodies live in lessons/<subject>.py and are only imported when needed
 
-# ===== CHEMISTRY LESSONS =====
 def generate_chemistry_lesson(exam, topic):
-    chemistry_notes = {
-        "Atomic Structure": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Atomic Structure - Complete Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-atom"></i> Fundamental Concepts</h2>
-        <div class="concept-box">
-            <h3>Subatomic Particles</h3>
-            <table class="particle-table">
-                <thead>
-                    <tr>
-                        <th>Particle</th>
-                        <th>Charge</th>
-                        <th>Mass (amu)</th>
-                        <th>Location</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td>Proton</td>
-                        <td>+1</td>
-                        <td>1</td>
-                        <td>Nucleus</td>
-                    </tr>
-                    <tr>
-                        <td>Neutron</td>
-                        <td>0</td>
-                        <td>1</td>
-                        <td>Nucleus</td>
-                    </tr>
-                    <tr>
-                        <td>Electron</td>
-                        <td>-1</td>
-                        <td>0.0005</td>
-                        <td>Orbitals</td>
-                    </tr>
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="concept-box">
-            <h3>Electron Configuration Rules</h3>
-            <div class="rule-cards">
-                <div class="rule-card">
-                    <div class="rule-number">1</div>
-                    <h4>Aufbau Principle</h4>
-                    <p>Orbitals fill from lowest to highest energy</p>
-                </div>
-                <div class="rule-card">
-                    <div class="rule-number">2</div>
-                    <h4>Pauli Exclusion</h4>
-                    <p>Max 2 electrons per orbital with opposite spins</p>
-                </div>
-                <div class="rule-card">
-                    <div class="rule-number">3</div>
-                    <h4>Hund's Rule</h4>
-                    <p>Degenerate orbitals fill singly before pairing</p>
-                </div>
-            </div>
-            
-            <div class="example-box">
-                <h4>Example Configurations:</h4>
-                <ul>
-                    <li>Oxygen (8e⁻): 1s² 2s² 2p⁴</li>
-                    <li>Iron (26e⁻): 1s² 2s² 2p⁶ 3s² 3p⁶ 4s² 3d⁶</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-atom"></i> Quantum Mechanical Model</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Key Concepts</h3>
-                <ul class="concept-list">
-                    <li>Schrödinger's wave equation (ψ² = probability density)</li>
-                    <li>Orbital shapes: s (spherical), p (dumbbell), d (cloverleaf)</li>
-                    <li>Quantum numbers: n, l, mₗ, mₛ</li>
-                    <li>Heisenberg Uncertainty Principle</li>
-                </ul>
-            </div>
-            <div class="column">
-                <div class="orbital-diagram">
-                    <!-- Orbital shapes diagram would go here -->
-                    <div class="orbital s-orbital"></div>
-                    <div class="orbital p-orbital"></div>
-                    <div class="orbital d-orbital"></div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-flask"></i> {exam} Exam Focus</h2>
-        <div class="exam-focus-box">
-            <ul>
-                <li>Writing configurations for ions (Fe³⁺ = [Ar]3d⁵)</li>
-                <li>Calculating subatomic particles</li>
-                <li>Interpreting emission spectra</li>
-                <li>Comparing atomic models' limitations</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>How many unpaired electrons in ground state oxygen?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">2 unpaired electrons (2p⁴ configuration)</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Explain three evidences for quantum mechanical model</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Chemical Bonding": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Chemical Bonding Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-link"></i> Bond Types</h2>
-        <table class="bond-table">
-            <thead>
-                <tr>
-                    <th>Bond Type</th>
-                    <th>Formation</th>
-                    <th>Properties</th>
-                    <th>Examples</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Ionic</td>
-                    <td>Electron transfer</td>
-                    <td>High MP/BP, conducts when molten</td>
-                    <td>NaCl</td>
-                </tr>
-                <tr>
-                    <td>Covalent</td>
-                    <td>Electron sharing</td>
-                    <td>Low MP/BP, poor conductor</td>
-                    <td>H₂O</td>
-                </tr>
-                <tr>
-                    <td>Metallic</td>
-                    <td>Delocalized e⁻</td>
-                    <td>Malleable, excellent conductor</td>
-                    <td>Cu</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-shapes"></i> Molecular Geometry</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>VSEPR Theory</h3>
-                <p>Predicts shapes based on electron pair repulsion:</p>
-                <ul class="geometry-list">
-                    <li>Linear (180°): CO₂</li>
-                    <li>Trigonal planar (120°): BF₃</li>
-                    <li>Tetrahedral (109.5°): CH₄</li>
-                    <li>Octahedral (90°): SF₆</li>
-                </ul>
-            </div>
-            <div class="column">
-                <div class="molecule-diagram">
-                    <!-- Molecular geometry diagrams would go here -->
-                    <div class="molecule linear"></div>
-                    <div class="molecule tetrahedral"></div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-water"></i> Intermolecular Forces</h2>
-        <div class="forces-cards">
-            <div class="force-card">
-                <h3>Hydrogen Bonding</h3>
-                <p>Between H and F/O/N</p>
-                <p>Strongest IMF</p>
-            </div>
-            <div class="force-card">
-                <h3>Dipole-Dipole</h3>
-                <p>Between polar molecules</p>
-                <p>Medium strength</p>
-            </div>
-            <div class="force-card">
-                <h3>London Dispersion</h3>
-                <p>Between all molecules</p>
-                <p>Weakest IMF</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023</div>
-            <p>Why does ice float on water?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Hydrogen bonding creates open lattice structure with lower density</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC</div>
-            <p>Predict the shape of NH₃</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Trigonal pyramidal (107° bond angle)</div>
-        </div>
-    </div>
-</div>
-""",
-
-        "Stoichiometry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Stoichiometry Complete Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-balance-scale"></i> Key Laws</h2>
-        <div class="law-cards">
-            <div class="law-card">
-                <h3>Conservation of Mass</h3>
-                <p>2H₂ + O₂ → 2H₂O</p>
-                <p>4g + 32g → 36g</p>
-            </div>
-            <div class="law-card">
-                <h3>Definite Proportions</h3>
-                <p>H₂O always 1:8 H:O mass ratio</p>
-            </div>
-            <div class="law-card">
-                <h3>Multiple Proportions</h3>
-                <p>CO vs CO₂ (1:1 vs 1:2 O ratios)</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-calculator"></i> Calculations</h2>
-        <div class="concept-box">
-            <h3>Mole Roadmap</h3>
-            <div class="mole-roadmap">
-                <div class="roadmap-step">Mass</div>
-                <div class="roadmap-arrow">↔</div>
-                <div class="roadmap-step">Moles</div>
-                <div class="roadmap-arrow">↔</div>
-                <div class="roadmap-step">Particles</div>
-                <div class="roadmap-arrow">↔</div>
-                <div class="roadmap-step">Volume (gas at STP)</div>
-            </div>
-        </div>
-        
-        <div class="formula-box">
-            <h3>Titration Formula</h3>
-            <p class="formula">M₁V₁/n₁ = M₂V₂/n₂</p>
-        </div>
-        
-        <div class="formula-box">
-            <h3>Yield Calculations</h3>
-            <p class="formula">% Yield = (Actual/Theoretical) × 100</p>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-flask"></i> {exam} Problems</h2>
-        <div class="problem-types">
-            <div class="problem-card">
-                <h3>Limiting Reactant</h3>
-                <p>Identify which reactant runs out first</p>
-            </div>
-            <div class="problem-card">
-                <h3>Empirical Formula</h3>
-                <p>Determine simplest ratio of elements</p>
-            </div>
-            <div class="problem-card">
-                <h3>Gas Volume</h3>
-                <p>Calculate volumes at STP or other conditions</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB</div>
-            <p>What mass of CaO from 50g CaCO₃?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">28g (CaCO₃ → CaO + CO₂, molar mass ratio 100:56)</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Explain stoichiometric calculations in industry</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "States of Matter": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">States of Matter Compendium ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-solid fa-ice-cream"></i> Characteristics</h2>
-        <table class="states-table">
-            <thead>
-                <tr>
-                    <th>State</th>
-                    <th>Shape</th>
-                    <th>Volume</th>
-                    <th>Particle Motion</th>
-                    <th>Examples</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Solid</td>
-                    <td>Fixed</td>
-                    <td>Fixed</td>
-                    <td>Vibrational</td>
-                    <td>Ice</td>
-                </tr>
-                <tr>
-                    <td>Liquid</td>
-                    <td>Variable</td>
-                    <td>Fixed</td>
-                    <td>Rotational/Translational</td>
-                    <td>Water</td>
-                </tr>
-                <tr>
-                    <td>Gas</td>
-                    <td>Variable</td>
-                    <td>Variable</td>
-                    <td>Free random motion</td>
-                    <td>Steam</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-exchange-alt"></i> Phase Changes</h2>
-        <div class="phase-change-diagram">
-            <!-- Phase change diagram would go here -->
-            <div class="phase-change melting">
-                <p>Melting: Solid → Liquid (Endothermic)</p>
-            </div>
-            <div class="phase-change vaporization">
-                <p>Vaporization: Liquid → Gas (Endothermic)</p>
-            </div>
-            <div class="phase-change sublimation">
-                <p>Sublimation: Solid → Gas (Endothermic)</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO</div>
-            <p>Why does steam cause worse burns than boiling water?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Additional heat of vaporization released when steam condenses</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC (5 marks)</div>
-            <p>Sketch the heating curve for ice to steam</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Acids, bases and salts": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Acid-Base Chemistry Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-vial"></i> Theories</h2>
-        <div class="theory-cards">
-            <div class="theory-card">
-                <h3>Arrhenius</h3>
-                <ul>
-                    <li>Acids release H⁺</li>
-                    <li>Bases release OH⁻</li>
-                </ul>
-            </div>
-            <div class="theory-card">
-                <h3>Bronsted-Lowry</h3>
-                <ul>
-                    <li>Acids donate H⁺</li>
-                    <li>Bases accept H⁺</li>
-                </ul>
-            </div>
-            <div class="theory-card">
-                <h3>Lewis</h3>
-                <ul>
-                    <li>Acids accept e⁻ pairs</li>
-                    <li>Bases donate e⁻ pairs</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-chart-line"></i> pH Calculations</h2>
-        <div class="formula-box">
-            <p class="formula">pH = -log[H⁺]</p>
-            <p class="formula">pOH = -log[OH⁻]</p>
-            <p class="formula">pH + pOH = 14 (at 25°C)</p>
-        </div>
-        
-        <div class="concept-box">
-            <h3>Buffer Systems</h3>
-            <ul>
-                <li>Weak acid + conjugate base</li>
-                <li>Resist pH change</li>
-                <li>Example: CH₃COOH/CH₃COO⁻</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB</div>
-            <p>Calculate pH of 0.01M HCl</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">pH = -log(0.01) = 2</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Compare three acid-base theories</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Redox reactions": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Redox Chemistry Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-exchange-alt"></i> Fundamentals</h2>
-        <div class="redox-concepts">
-            <div class="concept-card">
-                <h3>Oxidation</h3>
-                <ul>
-                    <li>Loss of electrons</li>
-                    <li>Increase in oxidation number</li>
-                </ul>
-            </div>
-            <div class="concept-card">
-                <h3>Reduction</h3>
-                <ul>
-                    <li>Gain of electrons</li>
-                    <li>Decrease in oxidation number</li>
-                </ul>
-            </div>
-        </div>
-        
-        <div class="example-box">
-            <h3>Oxidizing Agents</h3>
-            <ul>
-                <li>Accept electrons (get reduced)</li>
-                <li>Examples: KMnO₄, K₂Cr₂O₇</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-balance-scale"></i> Balancing</h2>
-        <div class="step-box">
-            <h3>Half-Reaction Method</h3>
-            <ol>
-                <li>Split into oxidation/reduction</li>
-                <li>Balance atoms then charges</li>
-                <li>Equalize electron transfer</li>
-                <li>Combine half-reactions</li>
-            </ol>
-        </div>
-        
-        <div class="example-box">
-            <h4>Example:</h4>
-            <p>MnO₄⁻ + Fe²⁺ → Mn²⁺ + Fe³⁺ (acidic)</p>
-            <p>Balanced: MnO₄⁻ + 5Fe²⁺ + 8H⁺ → Mn²⁺ + 5Fe³⁺ + 4H₂O</p>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO</div>
-            <p>Balance: MnO₄⁻ + Fe²⁺ → Mn²⁺ + Fe³⁺ (acidic)</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">MnO₄⁻ + 5Fe²⁺ + 8H⁺ → Mn²⁺ + 5Fe³⁺ + 4H₂O</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC</div>
-            <p>Calculate E°cell for Zn|Zn²⁺||Cu²⁺|Cu</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">+1.10V (E°Cu - E°Zn = 0.34 - (-0.76))</div>
-        </div>
-    </div>
-</div>
-""",
-
-        "Organic chemistry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Organic Chemistry Compendium ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-oil-can"></i> Hydrocarbon Classes</h2>
-        <div class="hydrocarbon-types">
-            <div class="type-card">
-                <h3>Alkanes</h3>
-                <ul>
-                    <li>General formula: CₙH₂ₙ₊₂</li>
-                    <li>sp³ hybridization</li>
-                    <li>Example: CH₄ (methane)</li>
-                </ul>
-            </div>
-            <div class="type-card">
-                <h3>Arenes</h3>
-                <ul>
-                    <li>Benzene rings</li>
-                    <li>Delocalized π-electrons</li>
-                    <li>Example: C₆H₆</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-atom"></i> Functional Groups</h2>
-        <table class="functional-groups">
-            <thead>
-                <tr>
-                    <th>Group</th>
-                    <th>Prefix/Suffix</th>
-                    <th>Example</th>
-                    <th>Properties</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Alcohol</td>
-                    <td>-ol</td>
-                    <td>CH₃CH₂OH</td>
-                    <td>Hydrogen bonding</td>
-                </tr>
-                <tr>
-                    <td>Carboxylic acid</td>
-                    <td>-oic acid</td>
-                    <td>CH₃COOH</td>
-                    <td>Acidic</td>
-                </tr>
-                <tr>
-                    <td>Ester</td>
-                    <td>-yl -oate</td>
-                    <td>CH₃COOCH₃</td>
-                    <td>Fruity smells</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB</div>
-            <p>Name CH₃CH₂CH₂CH₂OH</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Butan-1-ol</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Compare addition and substitution reactions</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Environmental chemistry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Environmental Chemistry Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-smog"></i> Pollution Types</h2>
-        <div class="pollution-types">
-            <div class="pollution-card">
-                <h3>Air Pollution</h3>
-                <ul>
-                    <li>Greenhouse gases (CO₂, CH₄)</li>
-                    <li>Acid rain (SO₂, NOₓ)</li>
-                    <li>Ozone depletion (CFCs)</li>
-                </ul>
-            </div>
-            <div class="pollution-card">
-                <h3>Water Pollution</h3>
-                <ul>
-                    <li>Eutrophication (PO₄³⁻)</li>
-                    <li>Heavy metals (Pb²⁺, Hg²⁺)</li>
-                    <li>Oil spills</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-leaf"></i> Green Chemistry</h3>
-        <div class="principles-box">
-            <p>12 Principles including:</p>
-            <ul>
-                <li>Atom economy</li>
-                <li>Renewable feedstocks</li>
-                <li>Catalysis over stoichiometric reagents</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO</div>
-            <p>Explain two effects of acid rain</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Corrodes buildings, kills aquatic life</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Discuss three green chemistry principles</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Industrial chemistry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Industrial Chemistry Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-industry"></i> Major Processes</h2>
-        <div class="process-cards">
-            <div class="process-card">
-                <h3>Haber Process</h3>
-                <p>N₂ + 3H₂ ⇌ 2NH₃</p>
-                <ul>
-                    <li>Fe catalyst</li>
-                    <li>450°C, 200atm</li>
-                    <li>Ammonia production</li>
-                </ul>
-            </div>
-            <div class="process-card">
-                <h3>Contact Process</h3>
-                <p>2SO₂ + O₂ ⇌ 2SO₃ → H₂SO₄</p>
-                <ul>
-                    <li>V₂O₅ catalyst</li>
-                    <li>Sulfuric acid production</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB</div>
-            <p>Why 450°C in Haber process?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Balance rate/yield (compromise conditions)</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (6 marks)</div>
-            <p>Compare batch vs continuous processes</p>
-        </div>
-    </div>
-</div>
-"""
-    }
-    
-    return chemistry_notes.get(topic, f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">{topic} - Chemistry ({exam})</h1>
-    <div class="lesson-content">
-        <p>Comprehensive chemistry notes for {topic} are currently being developed.</p>
-        <p>Please check back soon or select another chemistry topic.</p>
-    </div>
-</div>
-""")
-
-# ===== BIOLOGY LESSONS =====
+    return get_registry("Chemistry").render(exam, topic)
+
 def generate_biology_lesson(exam, topic):
-    biology_notes = {
-        "Cell Biology": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Cell Structure and Function ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-microscope"></i> Cell Theory</h2>
-        <div class="theory-principles">
-            <div class="principle-card">
-                <div class="number-circle">1</div>
-                <p>All living organisms are composed of cells</p>
-            </div>
-            <div class="principle-card">
-                <div class="number-circle">2</div>
-                <p>Cells are the basic unit of life</p>
-            </div>
-            <div class="principle-card">
-                <div class="number-circle">3</div>
-                <p>New cells arise from pre-existing cells</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-border-style"></i> Cell Types Comparison</h2>
-        <table class="cell-comparison">
-            <thead>
-                <tr>
-                    <th>Feature</th>
-                    <th>Prokaryotic</th>
-                    <th>Eukaryotic</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Nucleus</td>
-                    <td class="no">Absent</td>
-                    <td class="yes">Present</td>
-                </tr>
-                <tr>
-                    <td>Organelles</td>
-                    <td class="no">Few</td>
-                    <td class="yes">Membrane-bound</td>
-                </tr>
-                <tr>
-                    <td>Example</td>
-                    <td>Bacteria</td>
-                    <td>Plant/Animal cells</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-puzzle-piece"></i> Organelle Functions</h2>
-        <div class="organelle-grid">
-            <div class="organelle-card">
-                <div class="organelle-icon nucleus"></div>
-                <h3>Nucleus</h3>
-                <p>Controls cell activities, contains DNA</p>
-            </div>
-            <div class="organelle-card">
-                <div class="organelle-icon mitochondria"></div>
-                <h3>Mitochondria</h3>
-                <p>Powerhouse of cell (ATP production)</p>
-            </div>
-            <div class="organelle-card">
-                <div class="organelle-icon chloroplast"></div>
-                <h3>Chloroplast</h3>
-                <p>Site of photosynthesis (plant cells)</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-flask"></i> Practice Questions</h2>
-        <div class="question">
-            <p><strong>JAMB 2023:</strong> Which organelle contains digestive enzymes?</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Lysosome</div>
-        </div>
-    </div>
-</div>
-""",
-        "Genetics": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Genetics and Inheritance ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-dna"></i> Mendelian Genetics</h2>
-        <div class="genetics-principles">
-            <div class="law-card">
-                <h3>Law of Segregation</h3>
-                <p>Alleles separate during gamete formation</p>
-            </div>
-            <div class="law-card">
-                <h3>Law of Independent Assortment</h3>
-                <p>Genes for different traits sort independently</p>
-            </div>
-        </div>
-        
-        <div class="punnett-square-example">
-            <h3>Monohybrid Cross (Tt × Tt)</h3>
-            <div class="punnett-grid">
-                <div class="grid-header">T</div>
-                <div class="grid-header">t</div>
-                <div class="grid-header">T</div>
-                <div class="genotype">TT</div>
-                <div class="genotype">Tt</div>
-                <div class="grid-header">t</div>
-                <div class="genotype">Tt</div>
-                <div class="genotype">tt</div>
-            </div>
-            <p class="ratio">Phenotypic ratio: 3:1 (Tall:Short)</p>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-helix-dna"></i> DNA Structure</h2>
-        <div class="dna-model">
-            <div class="dna-diagram">
-                <!-- DNA double helix diagram would go here -->
-            </div>
-            <div class="dna-components">
-                <h3>Key Components:</h3>
-                <ul>
-                    <li><strong>Phosphate group</strong></li>
-                    <li><strong>Deoxyribose sugar</strong></li>
-                    <li><strong>Nitrogenous bases:</strong> A,T,C,G</li>
-                </ul>
-                <p class="pairing">Base Pairing: A-T, C-G</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Ecology": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Ecology and Ecosystems ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-tree"></i> Ecosystem Components</h2>
-        <div class="ecosystem-pyramid">
-            <div class="pyramid-level producers">
-                <h3>Producers</h3>
-                <p>Plants, algae (autotrophs)</p>
-            </div>
-            <div class="pyramid-level consumers">
-                <h3>Consumers</h3>
-                <p>Herbivores, carnivores, omnivores</p>
-            </div>
-            <div class="pyramid-level decomposers">
-                <h3>Decomposers</h3>
-                <p>Bacteria, fungi</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-recycle"></i> Nutrient Cycles</h2>
-        <div class="cycle-tabs">
-            <div class="tab active" data-tab="carbon">Carbon Cycle</div>
-            <div class="tab" data-tab="nitrogen">Nitrogen Cycle</div>
-        </div>
-        
-        <div class="cycle-content active" id="carbon">
-            <div class="cycle-diagram">
-                <!-- Carbon cycle diagram would go here -->
-            </div>
-            <div class="cycle-key">
-                <p><strong>Key Processes:</strong></p>
-                <ul>
-                    <li>Photosynthesis (CO₂ → organic compounds)</li>
-                    <li>Respiration (organic compounds → CO₂)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Human Physiology": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Human Body Systems ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-heartbeat"></i> Circulatory System</h2>
-        <div class="system-diagram">
-            <!-- Heart and blood vessels diagram would go here -->
-        </div>
-        <div class="blood-components">
-            <h3>Blood Composition:</h3>
-            <ul>
-                <li><strong>Red blood cells:</strong> Carry oxygen (hemoglobin)</li>
-                <li><strong>White blood cells:</strong> Immune defense</li>
-                <li><strong>Platelets:</strong> Blood clotting</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-lungs"></i> Respiratory System</h2>
-        <div class="gas-exchange">
-            <div class="exchange-step">
-                <div class="step-number">1</div>
-                <p>Oxygen inhaled → alveoli</p>
-            </div>
-            <div class="exchange-step">
-                <div class="step-number">2</div>
-                <p>Diffuses into blood (high to low concentration)</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Plant Biology": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Plant Structure and Function ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-leaf"></i> Photosynthesis</h2>
-        <div class="photo-equation">
-            <p class="chemical-equation">6CO₂ + 6H₂O + light → C₆H₁₂O₆ + 6O₂</p>
-            <div class="photo-factors">
-                <h3>Factors Affecting Rate:</h3>
-                <ul>
-                    <li>Light intensity</li>
-                    <li>CO₂ concentration</li>
-                    <li>Temperature</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-seedling"></i> Plant Transport</h2>
-        <div class="transport-comparison">
-            <div class="vessel-card">
-                <h3>Xylem</h3>
-                <p>Transports water and minerals (upward)</p>
-            </div>
-            <div class="vessel-card">
-                <h3>Phloem</h3>
-                <p>Transports sugars (bidirectional)</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Reproduction": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Reproduction and Development ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-dna"></i> Asexual vs Sexual</h2>
-        <table class="reproduction-table">
-            <thead>
-                <tr>
-                    <th>Type</th>
-                    <th>Advantages</th>
-                    <th>Disadvantages</th>
-                    <th>Examples</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Asexual</td>
-                    <td>Rapid, no mate needed</td>
-                    <td>No genetic variation</td>
-                    <td>Bacteria, some plants</td>
-                </tr>
-                <tr>
-                    <td>Sexual</td>
-                    <td>Genetic diversity</td>
-                    <td>Energy intensive</td>
-                    <td>Most animals, flowering plants</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-baby"></i> Human Reproduction</h2>
-        <div class="reproductive-systems">
-            <div class="system-card male">
-                <h3>Male System</h3>
-                <ul>
-                    <li>Testes produce sperm</li>
-                    <li>Testosterone production</li>
-                </ul>
-            </div>
-            <div class="system-card female">
-                <h3>Female System</h3>
-                <ul>
-                    <li>Ovaries produce eggs</li>
-                    <li>Menstrual cycle (~28 days)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Evolution": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Evolution and Biodiversity ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-fish"></i> Evidence for Evolution</h2>
-        <div class="evidence-cards">
-            <div class="evidence-card">
-                <h3>Fossil Record</h3>
-                <p>Shows transitional forms (e.g., Archaeopteryx)</p>
-            </div>
-            <div class="evidence-card">
-                <h3>Comparative Anatomy</h3>
-                <p>Homologous vs analogous structures</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-dove"></i> Natural Selection</h2>
-        <div class="selection-steps">
-            <div class="step">
-                <div class="step-number">1</div>
-                <p>Variation exists in populations</p>
-            </div>
-            <div class="step">
-                <div class="step-number">2</div>
-                <p>Competition for limited resources</p>
-            </div>
-            <div class="step">
-                <div class="step-number">3</div>
-                <p>Best adapted survive and reproduce</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Health and Disease": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Human Health and Diseases ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-virus"></i> Disease Types</h2>
-        <div class="disease-types">
-            <div class="disease-card infectious">
-                <h3>Infectious Diseases</h3>
-                <ul>
-                    <li>Caused by pathogens</li>
-                    <li>Example: Malaria (Plasmodium)</li>
-                </ul>
-            </div>
-            <div class="disease-card non-infectious">
-                <h3>Non-infectious Diseases</h3>
-                <ul>
-                    <li>Not caused by pathogens</li>
-                    <li>Example: Diabetes</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-shield-virus"></i> Immune System</h2>
-        <div class="immunity-types">
-            <div class="immunity-card">
-                <h3>Active Immunity</h3>
-                <p>Body produces antibodies (vaccination)</p>
-            </div>
-            <div class="immunity-card">
-                <h3>Passive Immunity</h3>
-                <p>Antibodies transferred (mother to baby)</p>
-            </div>
-        </div>
-    </div>
-</div>
-"""
-    }
-    
-    return biology_notes.get(topic, f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">{topic} - Biology ({exam})</h1>
-    <div class="lesson-content">
-        <p>Comprehensive biology notes for {topic} are currently being developed.</p>
-        <p>Please check back soon or select another biology topic.</p>
-    </div>
-</div>
-""")
-
-# ===== PHYSICS LESSONS =====
+    return get_registry("Biology").render(exam, topic)
+
 def generate_physics_lesson(exam, topic):
-    physics_notes = {
-        "Measurements and units": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Measurements and Units ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-ruler"></i> Fundamental Quantities</h2>
-        <table class="units-table">
-            <thead>
-                <tr>
-                    <th>Quantity</th>
-                    <th>SI Unit</th>
-                    <th>Symbol</th>
-                    <th>Measuring Instrument</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Length</td>
-                    <td>meter</td>
-                    <td>m</td>
-                    <td>Ruler, micrometer</td>
-                </tr>
-                <tr>
-                    <td>Time</td>
-                    <td>second</td>
-                    <td>s</td>
-                    <td>Stopwatch</td>
-                </tr>
-                <tr>
-                    <td>Current</td>
-                    <td>ampere</td>
-                    <td>A</td>
-                    <td>Ammeter</td>
-                </tr>
-            </tbody>
-        </table>
-        
-        <div class="concept-box">
-            <h3>Derived Quantities</h3>
-            <ul class="derived-units">
-                <li><strong>Velocity</strong>: m/s (meters per second)</li>
-                <li><strong>Force</strong>: N (newton) = kg·m/s²</li>
-                <li><strong>Energy</strong>: J (joule) = N·m</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-balance-scale"></i> Measurement Tools</h2>
-        <div class="instrument-cards">
-            <div class="instrument-card">
-                <h3>Vernier Calipers</h3>
-                <p>Measures small lengths (0.1mm precision)</p>
-                <div class="reading-example">
-                    <p>Main scale: 1.2 cm</p>
-                    <p>Vernier scale: 0.05 cm</p>
-                    <p class="result">Total: 1.25 cm</p>
-                </div>
-            </div>
-            <div class="instrument-card">
-                <h3>Micrometer Screw Gauge</h3>
-                <p>Measures very small lengths (0.01mm precision)</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <p><strong>WAEC 2023:</strong> Convert 72 km/h to m/s</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">20 m/s (72 × 1000/3600)</div>
-        </div>
-    </div>
-</div>
-""",
-        "Motion": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Motion and Mechanics ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-running"></i> Kinematic Equations</h2>
-        <div class="formula-grid">
-            <div class="formula-card">
-                <p class="formula">v = u + at</p>
-                <p>Final velocity</p>
-            </div>
-            <div class="formula-card">
-                <p class="formula">s = ut + ½at²</p>
-                <p>Displacement</p>
-            </div>
-        </div>
-        
-        <div class="example-problem">
-            <h3>Sample Problem</h3>
-            <p>A car accelerates from rest at 3 m/s² for 5 seconds. Calculate its final velocity.</p>
-            <div class="solution-steps">
-                <p>Given: u = 0, a = 3 m/s², t = 5 s</p>
-                <p>Using v = u + at</p>
-                <p>v = 0 + (3 × 5) = 15 m/s</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-project-diagram"></i> Projectile Motion</h2>
-        <div class="projectile-diagram">
-            <!-- Diagram would be inserted here -->
-            <p class="diagram-caption">Projectile trajectory showing maximum height and range</p>
-        </div>
-        
-        <div class="formula-box">
-            <h3>Key Equations</h3>
-            <ul>
-                <li>Time of flight: <span class="formula">t = (2u sinθ)/g</span></li>
-                <li>Maximum height: <span class="formula">H = (u² sin²θ)/2g</span></li>
-                <li>Range: <span class="formula">R = (u² sin2θ)/g</span></li>
-            </ul>
-        </div>
-    </div>
-</div>
-""",
-        "Forces": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Forces and Dynamics ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-weight-hanging"></i> Newton's Laws</h2>
-        <div class="law-cards">
-            <div class="law-card">
-                <h3>First Law (Inertia)</h3>
-                <p>An object remains at rest or in uniform motion unless acted upon by a net force</p>
-            </div>
-            <div class="law-card">
-                <h3>Second Law (F=ma)</h3>
-                <p>Force equals mass times acceleration</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-bolt"></i> Types of Forces</h2>
-        <table class="forces-table">
-            <tr>
-                <th>Force Type</th>
-                <th>Description</th>
-                <th>Example</th>
-            </tr>
-            <tr>
-                <td>Gravitational</td>
-                <td>Attraction between masses</td>
-                <td>Weight of objects</td>
-            </tr>
-            <tr>
-                <td>Frictional</td>
-                <td>Opposes motion</td>
-                <td>Sliding a book</td>
-            </tr>
-        </table>
-    </div>
-</div>
-""",
-        "Energy": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Work, Energy and Power ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-battery-three-quarters"></i> Energy Forms</h2>
-        <div class="energy-types">
-            <div class="energy-card kinetic">
-                <h3>Kinetic Energy</h3>
-                <p class="formula">KE = ½mv²</p>
-            </div>
-            <div class="energy-card potential">
-                <h3>Potential Energy</h3>
-                <p class="formula">PE = mgh</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-tachometer-alt"></i> Power Calculations</h2>
-        <p class="formula">Power = Work/Time = Energy/Time</p>
-        <div class="example-problem">
-            <p>A 60kg student climbs 3m in 5 seconds. Calculate power output.</p>
-            <div class="solution-steps">
-                <p>Work = mgh = 60 × 10 × 3 = 1800J</p>
-                <p>Power = 1800J/5s = 360W</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Waves": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Waves and Optics ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-water"></i> Wave Properties</h2>
-        <div class="wave-diagram">
-            <!-- Wave diagram would go here -->
-            <p class="diagram-label">Amplitude (A), Wavelength (λ), Frequency (f)</p>
-        </div>
-        
-        <div class="formula-box">
-            <h3>Wave Equation</h3>
-            <p class="formula">v = fλ</p>
-            <p>Where: v = velocity, f = frequency, λ = wavelength</p>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-lightbulb"></i> Light Waves</h2>
-        <div class="light-spectrum">
-            <div class="spectrum-color" style="background-color: #ff0000;">Red (700nm)</div>
-            <div class="spectrum-color" style="background-color: #0000ff;">Violet (400nm)</div>
-        </div>
-    </div>
-</div>
-""",
-        "Electricity": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Electricity and Circuits ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-bolt"></i> Ohm's Law</h2>
-        <div class="formula-highlight">
-            <p class="formula">V = IR</p>
-            <p>Where: V = voltage, I = current, R = resistance</p>
-        </div>
-        
-        <div class="circuit-diagram">
-            <!-- Circuit diagram would go here -->
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-sitemap"></i> Circuit Types</h2>
-        <div class="circuit-comparison">
-            <div class="circuit-type">
-                <h3>Series</h3>
-                <p>Same current through all components</p>
-                <p class="formula">R<sub>total</sub> = R<sub>1</sub> + R<sub>2</sub> + ...</p>
-            </div>
-            <div class="circuit-type">
-                <h3>Parallel</h3>
-                <p>Same voltage across all components</p>
-                <p class="formula">1/R<sub>total</sub> = 1/R<sub>1</sub> + 1/R<sub>2</sub> + ...</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-        "Magnetism": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Magnetism and Electromagnetism ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-magnet"></i> Magnetic Fields</h2>
-        <div class="magnetic-field-diagram">
-            <!-- Field line diagram would go here -->
-        </div>
-        
-        <div class="concept-box">
-            <h3>Right-Hand Rules</h3>
-            <ol>
-                <li>Grip rule for solenoid field direction</li>
-                <li>Fleming's rules for motors/generators</li>
-            </ol>
-        </div>
-    </div>
-</div>
-""",
-        "Modern Physics": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Modern Physics ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-atom"></i> Quantum Physics</h2>
-        <div class="quantum-concepts">
-            <div class="concept-card">
-                <h3>Photoelectric Effect</h3>
-                <p class="formula">E = hf</p>
-                <p>Where h = Planck's constant</p>
-            </div>
-            <div class="concept-card">
-                <h3>Wave-Particle Duality</h3>
-                <p>Light exhibits both wave and particle properties</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-radiation"></i> Nuclear Physics</h2>
-        <table class="radiation-table">
-            <tr>
-                <th>Radiation Type</th>
-                <th>Symbol</th>
-                <th>Penetration</th>
-            </tr>
-            <tr>
-                <td>Alpha</td>
-                <td>α</td>
-                <td>Low (paper stops it)</td>
-            </tr>
-            <tr>
-                <td>Beta</td>
-                <td>β</td>
-                <td>Medium (aluminum stops it)</td>
-            </tr>
-        </table>
-    </div>
-</div>
-"""
-    }
-    
-    return physics_notes.get(topic, f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">{topic} - Physics ({exam})</h1>
-    <div class="lesson-content">
-        <p>Comprehensive lesson notes for {topic} are currently being developed.</p>
-        <p>Please check back soon or select another physics topic.</p>
-    </div>
-</div>
-""")
+    return get_registry("Physics").render(exam, topic)
 
 def generate_math_lesson(exam, topic):
-    math_notes = {
-        "Number bases": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Number Bases - Complete Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-calculator"></i> Base Systems</h2>
-        <p>Number bases represent numbers using different radix values:</p>
-        
-        <table class="concept-table">
-            <thead>
-                <tr>
-                    <th>Base</th>
-                    <th>Name</th>
-                    <th>Digits</th>
-                    <th>Example</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>2</td>
-                    <td>Binary</td>
-                    <td>0-1</td>
-                    <td>101₁₂ = 5₁₀</td>
-                </tr>
-                <tr>
-                    <td>8</td>
-                    <td>Octal</td>
-                    <td>0-7</td>
-                    <td>12₈ = 10₁₀</td>
-                </tr>
-                <tr>
-                    <td>10</td>
-                    <td>Decimal</td>
-                    <td>0-9</td>
-                    <td>15₁₀</td>
-                </tr>
-                <tr>
-                    <td>16</td>
-                    <td>Hexadecimal</td>
-                    <td>0-F</td>
-                    <td>1F₁₆ = 31₁₀</td>
-                </tr>
-            </tbody>
-        </table>
-        
-        <div class="concept-box">
-            <h3>Conversion Methods</h3>
-            <ol class="concept-list">
-                <li><strong>Other base → Decimal</strong>: Expand using place values
-                    <div class="example">101₁₂ = 1×2² + 0×2¹ + 1×2⁰ = 5₁₀</div>
-                </li>
-                <li><strong>Decimal → Other base</strong>: Division-remainder method
-                    <div class="example">25 ÷ 2 = 12 R1 → 11001₂</div>
-                </li>
-                <li><strong>Between non-decimal bases</strong>: Use decimal as intermediate</li>
-            </ol>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-plus-circle"></i> Operations in Different Bases</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Addition</h3>
-                <p>Same as decimal but with base-specific carrying</p>
-                <div class="math-example">
-                    <p>Binary Example:</p>
-                    <pre>
-  1011₂
-+ 1101₂
---------
- 11000₂
-                    </pre>
-                </div>
-            </div>
-            <div class="column">
-                <h3>Subtraction</h3>
-                <p>Borrowing based on the base value</p>
-                <div class="math-example">
-                    <p>Hexadecimal Example:</p>
-                    <pre>
-  1A5₁₆
--  F7₁₆
---------
-   AE₁₆
-                    </pre>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="exam-focus">
-        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
-        <ul class="focus-list">
-            <li>Converting between bases (especially binary ↔ decimal ↔ hexadecimal)</li>
-            <li>Solving equations in different bases</li>
-            <li>Performing arithmetic operations in non-decimal bases</li>
-            <li>Applications in computing and digital systems</li>
-        </ul>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>Convert 37₁₀ to base 5</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">122₅</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (6 marks)</div>
-            <p>Explain how to perform multiplication in base 8 with examples</p>
-        </div>
-    </div>
-</div>
-""",
-        "Algebra": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Algebra Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-superscript"></i> Polynomial Operations</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Addition/Subtraction</h3>
-                <p>Combine like terms</p>
-                <div class="math-example">
-                    <p>(3x² + 2x - 5) + (x² - 4x + 7) = 4x² - 2x + 2</p>
-                </div>
-            </div>
-            <div class="column">
-                <h3>Multiplication</h3>
-                <p>Use distributive property</p>
-                <div class="math-example">
-                    <p>(x + 3)(2x - 5) = 2x² - 5x + 6x - 15 = 2x² + x - 15</p>
-                </div>
-            </div>
-        </div>
-        
-        <div class="concept-box">
-            <h3>Factorization Techniques</h3>
-            <ul class="concept-list">
-                <li><strong>Common factor</strong>: 6x² + 9x = 3x(2x + 3)</li>
-                <li><strong>Difference of squares</strong>: a² - b² = (a+b)(a-b)</li>
-                <li><strong>Quadratic trinomials</strong>: x² + 5x + 6 = (x+2)(x+3)</li>
-                <li><strong>Grouping method</strong>: ax + ay + bx + by = a(x+y) + b(x+y) = (a+b)(x+y)</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-equals"></i> Equations and Inequalities</h2>
-        <div class="formula-highlight">
-            <h3>Quadratic Formula</h3>
-            <p class="formula">x = <div class="fraction"><span>-b ± √(b² - 4ac)</span><span>2a</span></div></p>
-        </div>
-        
-        <div class="columns">
-            <div class="column">
-                <h3>Linear Equations</h3>
-                <p>Solve for x: 3(x + 5) = 2x - 7</p>
-                <div class="step-by-step">
-                    <p>3x + 15 = 2x - 7</p>
-                    <p>3x - 2x = -7 - 15</p>
-                    <p>x = -22</p>
-                </div>
-            </div>
-            <div class="column">
-                <h3>Inequalities</h3>
-                <p>Solve: 2x - 5 < 7</p>
-                <div class="step-by-step">
-                    <p>2x < 12</p>
-                    <p>x < 6</p>
-                </div>
-                <p class="note">Remember to reverse inequality when multiplying/dividing by negative</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023</div>
-            <p>Factorize completely: 2x³ - 8x² - 10x</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">2x(x² - 4x - 5) = 2x(x - 5)(x + 1)</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Solve the quadratic equation 2x² - 5x - 3 = 0 using three different methods</p>
-        </div>
-    </div>
-</div>
-""",
-        "Geometry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Geometry Complete Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-shapes"></i> Plane Geometry</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Circle Theorems</h3>
-                <div class="theorem-box">
-                    <div class="theorem-diagram">[Diagram]</div>
-                    <p><strong>Theorem 1:</strong> Angle at center = 2 × angle at circumference</p>
-                </div>
-                <div class="theorem-box">
-                    <div class="theorem-diagram">[Diagram]</div>
-                    <p><strong>Theorem 2:</strong> Angles in same segment are equal</p>
-                </div>
-            </div>
-            <div class="column">
-                <h3>Triangle Properties</h3>
-                <ul class="concept-list">
-                    <li><strong>Area</strong>: ½ × base × height</li>
-                    <li><strong>Pythagoras</strong>: a² + b² = c² (right triangles)</li>
-                    <li><strong>Similarity</strong>: AA, SAS, SSS conditions</li>
-                    <li><strong>Congruency</strong>: SSS, SAS, ASA, RHS</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-cube"></i> Solid Geometry</h2>
-        <table class="solid-geometry-table">
-            <thead>
-                <tr>
-                    <th>Shape</th>
-                    <th>Volume</th>
-                    <th>Surface Area</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Cube</td>
-                    <td>V = s³</td>
-                    <td>SA = 6s²</td>
-                </tr>
-                <tr>
-                    <td>Cylinder</td>
-                    <td>V = πr²h</td>
-                    <td>SA = 2πr² + 2πrh</td>
-                </tr>
-                <tr>
-                    <td>Sphere</td>
-                    <td>V = ⁴⁄₃πr³</td>
-                    <td>SA = 4πr²</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="exam-focus">
-        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
-        <ul class="focus-list">
-            <li>Circle theorem proofs and applications</li>
-            <li>3D geometry problems involving volume and surface area</li>
-            <li>Geometric constructions with compass and straightedge</li>
-            <li>Coordinate geometry problems</li>
-        </ul>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>Calculate the volume of a cone with radius 7cm and height 12cm</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">V = ⅓πr²h = ⅓ × ²²⁄₇ × 7² × 12 = 616cm³</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Prove that the angle in a semicircle is a right angle and state two applications of this theorem</p>
-        </div>
-    </div>
-</div>
-""",
-        "Trigonometry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Trigonometry Compendium ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-project-diagram"></i> Fundamental Concepts</h2>
-        <div class="trig-ratios">
-            <div class="ratio-box">
-                <h3>sinθ = <div class="fraction"><span>opposite</span><span>hypotenuse</span></div></h3>
-            </div>
-            <div class="ratio-box">
-                <h3>cosθ = <div class="fraction"><span>adjacent</span><span>hypotenuse</span></div></h3>
-            </div>
-            <div class="ratio-box">
-                <h3>tanθ = <div class="fraction"><span>opposite</span><span>adjacent</span></div></h3>
-            </div>
-        </div>
-        
-        <div class="identity-box">
-            <h3>Pythagorean Identities</h3>
-            <ol class="concept-list">
-                <li>sin²θ + cos²θ = 1</li>
-                <li>1 + tan²θ = sec²θ</li>
-                <li>1 + cot²θ = cosec²θ</li>
-            </ol>
-        </div>
-        
-        <table class="special-angles">
-            <thead>
-                <tr>
-                    <th>θ</th>
-                    <th>sinθ</th>
-                    <th>cosθ</th>
-                    <th>tanθ</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>0°</td>
-                    <td>0</td>
-                    <td>1</td>
-                    <td>0</td>
-                </tr>
-                <tr>
-                    <td>30°</td>
-                    <td>½</td>
-                    <td>√3/2</td>
-                    <td>√3/3</td>
-                </tr>
-                <tr>
-                    <td>45°</td>
-                    <td>√2/2</td>
-                    <td>√2/2</td>
-                    <td>1</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-ruler-combined"></i> Applications</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Solving Triangles</h3>
-                <p><strong>Sine Rule:</strong> <div class="fraction"><span>a</span><span>sinA</span></div> = <div class="fraction"><span>b</span><span>sinB</span></div> = <div class="fraction"><span>c</span><span>sinC</span></div></p>
-                <p><strong>Cosine Rule:</strong> a² = b² + c² - 2bc cosA</p>
-            </div>
-            <div class="column">
-                <h3>Real-world Problems</h3>
-                <ul class="concept-list">
-                    <li>Height of buildings (angle of elevation)</li>
-                    <li>Navigation problems (bearings)</li>
-                    <li>Waveform analysis</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023</div>
-            <p>If sinθ = 3/5, find tanθ</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">tanθ = sinθ/cosθ = (3/5)/(4/5) = 3/4</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Solve the equation 2cos²x - 3cosx + 1 = 0 for 0° ≤ x ≤ 360°</p>
-        </div>
-    </div>
-</div>
-""",
-        "Calculus": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Calculus Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-function"></i> Differentiation</h2>
-        <table class="rules-table">
-            <thead>
-                <tr>
-                    <th>Function</th>
-                    <th>Derivative</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>xⁿ</td>
-                    <td>nxⁿ⁻¹</td>
-                </tr>
-                <tr>
-                    <td>sinx</td>
-                    <td>cosx</td>
-                </tr>
-                <tr>
-                    <td>eˣ</td>
-                    <td>eˣ</td>
-                </tr>
-            </tbody>
-        </table>
-        
-        <div class="columns">
-            <div class="column">
-                <h3>Applications</h3>
-                <ul class="concept-list">
-                    <li>Tangent/normal equations</li>
-                    <li>Maxima/minima problems</li>
-                    <li>Rates of change</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Example</h3>
-                <p>Find the derivative of y = (2x + 1)³</p>
-                <div class="step-by-step">
-                    <p>Let u = 2x + 1 ⇒ y = u³</p>
-                    <p>dy/du = 3u², du/dx = 2</p>
-                    <p>dy/dx = dy/du × du/dx = 3(2x+1)² × 2 = 6(2x+1)²</p>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-integral"></i> Integration</h2>
-        <table class="rules-table">
-            <thead>
-                <tr>
-                    <th>Function</th>
-                    <th>Integral</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>xⁿ (n≠-1)</td>
-                    <td>xⁿ⁺¹/(n+1) + C</td>
-                </tr>
-                <tr>
-                    <td>cosx</td>
-                    <td>sinx + C</td>
-                </tr>
-                <tr>
-                    <td>1/x</td>
-                    <td>ln|x| + C</td>
-                </tr>
-            </tbody>
-        </table>
-        
-        <div class="application-box">
-            <h3>Area Under Curve</h3>
-            <p>∫<sub>a</sub><sup>b</sup> f(x) dx = F(b) - F(a)</p>
-            <div class="example">
-                <p>Find area between y = x² and x-axis from x=0 to x=2</p>
-                <p>∫<sub>0</sub><sup>2</sup> x² dx = [x³/3]<sub>0</sub><sup>2</sup> = 8/3 - 0 = 8/3 units²</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>Find the derivative of y = x² sinx</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Using product rule: dy/dx = 2x sinx + x² cosx</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Find the area bounded by the curve y = x³ - 4x and the x-axis between x=0 and x=2</p>
-        </div>
-    </div>
-</div>
-""",
-        "Statistics": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Statistics Complete Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-chart-bar"></i> Data Analysis</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Measures of Central Tendency</h3>
-                <ul class="concept-list">
-                    <li><strong>Mean</strong>: Σx/n</li>
-                    <li><strong>Median</strong>: Middle value when ordered</li>
-                    <li><strong>Mode</strong>: Most frequent value</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Measures of Dispersion</h3>
-                <ul class="concept-list">
-                    <li><strong>Range</strong>: Max - Min</li>
-                    <li><strong>Variance</strong>: Σ(x - x̄)²/n</li>
-                    <li><strong>Standard Deviation</strong>: √Variance</li>
-                </ul>
-            </div>
-        </div>
-        
-        <div class="example-box">
-            <h3>Example Calculation</h3>
-            <p>Data: 2, 4, 6, 8, 10</p>
-            <p>Mean = (2+4+6+8+10)/5 = 6</p>
-            <p>Standard Deviation = √[(16+4+0+4+16)/5] = √8 ≈ 2.83</p>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-dice"></i> Probability</h2>
-        <div class="probability-box">
-            <h3>Basic Rules</h3>
-            <ul class="concept-list">
-                <li>0 ≤ P(A) ≤ 1</li>
-                <li>P(A') = 1 - P(A)</li>
-                <li>P(A∪B) = P(A) + P(B) - P(A∩B)</li>
-            </ul>
-        </div>
-        
-        <div class="columns">
-            <div class="column">
-                <h3>Binomial Distribution</h3>
-                <p>P(X=r) = <sup>n</sup>C<sub>r</sub> pʳ qⁿ⁻ʳ</p>
-                <p>Where p = success probability, q = 1-p</p>
-            </div>
-            <div class="column">
-                <h3>Normal Distribution</h3>
-                <div class="normal-curve">[Bell curve diagram]</div>
-                <p>68-95-99.7 rule</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023</div>
-            <p>Find the median of: 12, 7, 15, 10, 18, 5, 21</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">Ordered: 5,7,10,12,15,18,21 → Median = 12</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Explain three uses of standard deviation in statistical analysis</p>
-        </div>
-    </div>
-</div>
-""",
-        "Vectors": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Vectors Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-arrow-alt-circle-right"></i> Vector Operations</h2>
-        <div class="vector-representation">
-            <div class="vector-notation">
-                <h3>Notation</h3>
-                <p>a = (x₁, y₁) or xi + yj</p>
-                <p>|a| = √(x² + y²) (magnitude)</p>
-            </div>
-            <div class="vector-diagram">[Vector diagram]</div>
-        </div>
-        
-        <table class="vector-ops-table">
-            <thead>
-                <tr>
-                    <th>Operation</th>
-                    <th>Formula</th>
-                    <th>Example</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Addition</td>
-                    <td>a + b = (x₁+x₂, y₁+y₂)</td>
-                    <td>(2,3) + (1,-1) = (3,2)</td>
-                </tr>
-                <tr>
-                    <td>Scalar Multiplication</td>
-                    <td>ka = (kx, ky)</td>
-                    <td>3(1,2) = (3,6)</td>
-                </tr>
-                <tr>
-                    <td>Dot Product</td>
-                    <td>a·b = |a||b|cosθ = x₁x₂ + y₁y₂</td>
-                    <td>(1,2)·(3,4) = 1×3 + 2×4 = 11</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-location-arrow"></i> Applications</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Physics Applications</h3>
-                <ul class="concept-list">
-                    <li>Force resolution</li>
-                    <li>Relative velocity</li>
-                    <li>Displacement problems</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Geometry Proofs</h3>
-                <ul class="concept-list">
-                    <li>Proving parallel lines</li>
-                    <li>Collinearity proofs</li>
-                    <li>Geometric theorems</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>If a = 2i + 3j and b = 5i - j, find a + b</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">(2+5)i + (3-1)j = 7i + 2j</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Prove that the diagonals of a parallelogram bisect each other using vectors</p>
-        </div>
-    </div>
-</div>
-""",
-        "Coordinate geometry": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Coordinate Geometry Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-map-marked-alt"></i> Key Concepts</h2>
-        <div class="formula-grid">
-            <div class="formula-card">
-                <h3>Distance Formula</h3>
-                <p>d = √[(x₂ - x₁)² + (y₂ - y₁)²]</p>
-            </div>
-            <div class="formula-card">
-                <h3>Midpoint Formula</h3>
-                <p>M = ((x₁+x₂)/2, (y₁+y₂)/2)</p>
-            </div>
-            <div class="formula-card">
-                <h3>Gradient</h3>
-                <p>m = (y₂ - y₁)/(x₂ - x₁)</p>
-            </div>
-        </div>
-        
-        <div class="line-equations">
-            <h3>Line Equation Forms</h3>
-            <ul class="concept-list">
-                <li><strong>Point-slope</strong>: y - y₁ = m(x - x₁)</li>
-                <li><strong>General form</strong>: ax + by + c = 0</li>
-                <li><strong>Two-point form</strong>: (y-y₁)/(y₂-y₁) = (x-x₁)/(x₂-x₁)</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-shapes"></i> Conic Sections</h2>
-        <div class="conic-sections">
-            <div class="conic-card">
-                <h3>Circle</h3>
-                <p>(x - h)² + (y - k)² = r²</p>
-                <div class="conic-diagram">[Circle diagram]</div>
-            </div>
-            <div class="conic-card">
-                <h3>Parabola</h3>
-                <p>y² = 4ax</p>
-                <div class="conic-diagram">[Parabola diagram]</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023</div>
-            <p>Find the distance between (1,2) and (4,6)</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">√[(4-1)² + (6-2)²] = √(9 + 16) = 5 units</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>Find the equation of the perpendicular bisector of the line joining (2,3) and (4,7)</p>
-        </div>
-    </div>
-</div>
-""",
-        "Financial mathematics": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Financial Mathematics Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-coins"></i> Interest Calculations</h2>
-        <div class="interest-types">
-            <div class="interest-card">
-                <h3>Simple Interest</h3>
-                <p>I = PRT/100</p>
-                <p>A = P(1 + RT/100)</p>
-                <div class="example">
-                    <p>₦5000 at 8% for 3 years:</p>
-                    <p>I = (5000×8×3)/100 = ₦1200</p>
-                </div>
-            </div>
-            <div class="interest-card">
-                <h3>Compound Interest</h3>
-                <p>A = P(1 + r/n)<sup>nt</sup></p>
-                <div class="example">
-                    <p>₦5000 at 8% compounded quarterly for 3 years:</p>
-                    <p>A = 5000(1 + 0.08/4)<sup>12</sup> ≈ ₦6341</p>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-chart-line"></i> Annuities and Amortization</h2>
-        <div class="formula-box">
-            <h3>Future Value of Annuity</h3>
-            <p>FV = PMT[((1 + r)ⁿ - 1)/r]</p>
-        </div>
-        <div class="formula-box">
-            <h3>Present Value</h3>
-            <p>PV = FV/(1 + r)ⁿ</p>
-        </div>
-        
-        <div class="example-box">
-            <h3>Loan Repayment Example</h3>
-            <p>₦1,000,000 loan at 12% for 5 years:</p>
-            <p>Monthly payment = ₦22,244</p>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024</div>
-            <p>Calculate the simple interest on ₦8000 at 5% for 4 years</p>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">I = (8000×5×4)/100 = ₦1600</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>Compare simple and compound interest with examples and explain which is better for investments</p>
-        </div>
-    </div>
-</div>
-"""
-    }
-    
-    return math_notes.get(topic, f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">{topic} - Mathematics ({exam})</h1>
-    <div class="lesson-content">
-        <p>Detailed lesson notes for {topic} are currently being developed.</p>
-        <p>Please check back later or try another topic.</p>
-    </div>
-</div>
-""")
+    return get_registry("Mathematics").render(exam, topic)
 
 def generate_english_lesson(exam, topic):
-    english_notes = {
-        "Reading comprehension": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Reading Comprehension Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-book-reader"></i> Comprehension Strategies</h2>
-        <div class="strategy-cards">
-            <div class="strategy-card">
-                <h3>Active Reading Techniques</h3>
-                <ul>
-                    <li><strong>Skimming</strong>: Quickly identify main ideas</li>
-                    <li><strong>Scanning</strong>: Locate specific information</li>
-                    <li><strong>Close Reading</strong>: Analyze details and language</li>
-                    <li><strong>Context Clues</strong>: Infer meaning from surrounding text</li>
-                </ul>
-            </div>
-            <div class="strategy-card">
-                <h3>Question Types</h3>
-                <ul>
-                    <li><strong>Literal</strong>: Direct answers in text</li>
-                    <li><strong>Inferential</strong>: Require interpretation</li>
-                    <li><strong>Evaluative</strong>: Judge author's purpose</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-highlighter"></i> Passage Analysis</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Structure Elements</h3>
-                <ul class="structure-list">
-                    <li><strong>Introduction</strong>: Thesis/main idea</li>
-                    <li><strong>Body</strong>: Supporting arguments/examples</li>
-                    <li><strong>Conclusion</strong>: Summary/final thoughts</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Language Devices</h3>
-                <ul class="devices-list">
-                    <li>Figurative language (simile, metaphor)</li>
-                    <li>Tone (author's attitude)</li>
-                    <li>Diction (word choice)</li>
-                    <li>Syntax (sentence structure)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
-        <div class="focus-box">
-            <ul>
-                <li>Main idea identification</li>
-                <li>Vocabulary-in-context questions</li>
-                <li>Author's purpose analysis</li>
-                <li>Passage organization</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB 2024 Example</div>
-            <p>"What is the dominant tone in the passage?"</p>
-            <div class="options">
-                <p>a) Sarcastic</p>
-                <p>b) Nostalgic</p>
-                <p>c) Humorous</p>
-                <p>d) Indifferent</p>
-            </div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (8 marks)</div>
-            <p>"Analyze how the author uses imagery to convey mood in the passage"</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Summary writing": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Summary Writing Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-file-contract"></i> Effective Techniques</h2>
-        <div class="step-box">
-            <h3>The 5-Step Process</h3>
-            <ol>
-                <li>Read for overall understanding</li>
-                <li>Identify key points (usually 5-7 per paragraph)</li>
-                <li>Paraphrase using your own words</li>
-                <li>Maintain logical flow</li>
-                <li>Adhere to word limit</li>
-            </ol>
-        </div>
-        
-        <div class="warning-box">
-            <h3>Common Mistakes</h3>
-            <ul>
-                <li>Including examples/illustrations</li>
-                <li>Copying verbatim from passage</li>
-                <li>Adding personal opinions</li>
-                <li>Exceeding word count</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-clipboard-check"></i> {exam} Requirements</h2>
-        <div class="exam-cards">
-            <div class="exam-card">
-                <h3>JAMB</h3>
-                <ul>
-                    <li>60-70 word limit</li>
-                    <li>Objective summary style</li>
-                    <li>Focus on main points only</li>
-                </ul>
-            </div>
-            <div class="exam-card">
-                <h3>WAEC/NECO</h3>
-                <ul>
-                    <li>90-100 word limit</li>
-                    <li>May require section summaries</li>
-                    <li>Often needs paragraph organization</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-pencil-alt"></i> Practice Exercises</h2>
-        <div class="question">
-            <div class="question-header">NECO 2023 Format</div>
-            <p>"Summarize the writer's arguments for renewable energy in 90 words"</p>
-        </div>
-        <div class="self-check">
-            <h3>Self-Check Rubric</h3>
-            <ul>
-                <li><input type="checkbox"> Covers all main points</li>
-                <li><input type="checkbox"> Uses own words</li>
-                <li><input type="checkbox"> Within word limit</li>
-                <li><input type="checkbox"> Cohesive flow</li>
-            </ul>
-        </div>
-    </div>
-</div>
-""",
-
-        "Lexis and structure": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Lexis & Structure Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-book-open"></i> Vocabulary Building</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Word Formation Processes</h3>
-                <ul>
-                    <li><strong>Affixation</strong>: prefixes/suffixes</li>
-                    <li><strong>Compounding</strong>: blackboard</li>
-                    <li><strong>Conversion</strong>: verbing nouns</li>
-                    <li><strong>Borrowing</strong>: linguistic loans</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Contextual Usage</h3>
-                <ul>
-                    <li>Denotation vs connotation</li>
-                    <li>Register (formal/informal)</li>
-                    <li>Collocations (natural word pairings)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-spell-check"></i> Grammar Essentials</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Common Error Areas</h3>
-                <ul>
-                    <li>Subject-verb agreement</li>
-                    <li>Pronoun reference</li>
-                    <li>Tense consistency</li>
-                    <li>Modifier placement</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Sentence Types</h3>
-                <ul>
-                    <li><strong>Simple</strong>: one independent clause</li>
-                    <li><strong>Compound</strong>: two+ independent clauses</li>
-                    <li><strong>Complex</strong>: independent + dependent clause</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
-        <div class="question">
-            <div class="question-header">JAMB Example</div>
-            <p>"Choose the word opposite in meaning: 'EPHEMERAL'"</p>
-            <div class="options">
-                <p>a) Eternal</p>
-                <p>b) Fragile</p>
-                <p>c) Temporary</p>
-                <p>d) Partial</p>
-            </div>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">a) Eternal</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Exercise</div>
-            <p>"Identify and correct five errors in the given paragraph"</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Essay writing": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Essay Writing Compendium ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-edit"></i> Essay Types</h2>
-        <table class="essay-types">
-            <thead>
-                <tr>
-                    <th>Type</th>
-                    <th>Purpose</th>
-                    <th>Structure</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Narrative</td>
-                    <td>Tell a story</td>
-                    <td>Chronological order</td>
-                </tr>
-                <tr>
-                    <td>Descriptive</td>
-                    <td>Paint a picture</td>
-                    <td>Spatial/sensory details</td>
-                </tr>
-                <tr>
-                    <td>Argumentative</td>
-                    <td>Persuade</td>
-                    <td>Thesis-evidence-conclusion</td>
-                </tr>
-                <tr>
-                    <td>Expository</td>
-                    <td>Explain</td>
-                    <td>Definition-examples</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-pen-fancy"></i> Writing Process</h2>
-        <div class="process-steps">
-            <div class="process-step">
-                <h3>Pre-Writing</h3>
-                <ul>
-                    <li>Brainstorming techniques</li>
-                    <li>Outline creation</li>
-                    <li>Thesis formulation</li>
-                </ul>
-            </div>
-            <div class="process-step">
-                <h3>Drafting</h3>
-                <ul>
-                    <li>Introduction (hook, thesis)</li>
-                    <li>Body paragraphs (topic sentence, evidence)</li>
-                    <li>Conclusion (summary, final thought)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-clipboard-list"></i> {exam} Requirements</h2>
-        <div class="marking-scheme">
-            <h3>WAEC/NECO Marking Scheme</h3>
-            <ul>
-                <li>Content (10 marks)</li>
-                <li>Organization (5 marks)</li>
-                <li>Accuracy (5 marks)</li>
-                <li>Mechanical Accuracy (5 marks)</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-tasks"></i> Practice Prompts</h2>
-        <div class="prompt-cards">
-            <div class="prompt-card">
-                <h3>Argumentative</h3>
-                <p>"Should school uniforms be mandatory? Discuss"</p>
-            </div>
-            <div class="prompt-card">
-                <h3>Descriptive</h3>
-                <p>"Describe your most memorable childhood experience"</p>
-            </div>
-        </div>
-    </div>
-</div>
-""",
-
-        "Oral English": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Oral English Masterclass ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-volume-up"></i> Phonetics & Phonology</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Sound Patterns</h3>
-                <ul>
-                    <li>Vowels (monophthongs/diphthongs)</li>
-                    <li>Consonants (plosives, fricatives)</li>
-                    <li>Stress patterns (word/sentence)</li>
-                    <li>Intonation (rising/falling)</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Pronunciation Challenges</h3>
-                <ul>
-                    <li>/θ/ vs /ð/ (thin vs then)</li>
-                    <li>/ɪ/ vs /i:/ (ship vs sheep)</li>
-                    <li>/æ/ vs /ɑ:/ (cat vs cart)</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-comments"></i> Speech Features</h2>
-        <div class="speech-features">
-            <div class="feature-card">
-                <h3>Conversational Devices</h3>
-                <ul>
-                    <li>Turn-taking cues</li>
-                    <li>Back-channeling ("uh-huh")</li>
-                    <li>Discourse markers ("well", "so")</li>
-                </ul>
-            </div>
-            <div class="feature-card">
-                <h3>Public Speaking</h3>
-                <ul>
-                    <li>Audience engagement</li>
-                    <li>Pace and pausing</li>
-                    <li>Body language</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-microphone-alt"></i> Practice</h2>
-        <div class="question">
-            <div class="question-header">JAMB Example</div>
-            <p>"Which word has a different stress pattern?"</p>
-            <div class="options">
-                <p>a) REcord</p>
-                <p>b) preSENT</p>
-                <p>c) PROgress</p>
-                <p>d) CONduct</p>
-            </div>
-            <button class="show-answer">Show Answer</button>
-            <div class="answer">a) REcord (others have stress on second syllable)</div>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Oral Test</div>
-            <p>"Read the passage aloud observing correct stress and intonation"</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Literature analysis": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Literature Analysis Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-book"></i> Literary Devices</h2>
-        <div class="columns">
-            <div class="column">
-                <h3>Language Techniques</h3>
-                <ul>
-                    <li><strong>Imagery</strong>: sensory language</li>
-                    <li><strong>Symbolism</strong>: deeper meanings</li>
-                    <li><strong>Irony</strong>: contrast between expectation/reality</li>
-                    <li><strong>Foreshadowing</strong>: hints of future events</li>
-                </ul>
-            </div>
-            <div class="column">
-                <h3>Narrative Elements</h3>
-                <ul>
-                    <li><strong>Plot structure</strong>: exposition to resolution</li>
-                    <li><strong>Characterization</strong>: direct/indirect</li>
-                    <li><strong>Point of view</strong>: 1st/3rd person</li>
-                    <li><strong>Setting</strong>: time and place</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-search"></i> Textual Analysis</h2>
-        <div class="analysis-types">
-            <div class="analysis-card">
-                <h3>Poetry Analysis</h3>
-                <ul>
-                    <li>Form (sonnet, ballad)</li>
-                    <li>Meter (iambic pentameter)</li>
-                    <li>Rhyme scheme</li>
-                    <li>Poetic devices</li>
-                </ul>
-            </div>
-            <div class="analysis-card">
-                <h3>Prose Analysis</h3>
-                <ul>
-                    <li>Theme identification</li>
-                    <li>Character development</li>
-                    <li>Social context</li>
-                    <li>Author's style</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-quote-right"></i> Practice</h2>
-        <div class="question">
-            <div class="question-header">NECO Example</div>
-            <p>"Analyze the use of metaphor in the given poem"</p>
-        </div>
-        <div class="question">
-            <div class="question-header">WAEC Essay (10 marks)</div>
-            <p>"Compare the themes of love and betrayal in two prescribed texts"</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Report writing": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Report Writing Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-file-alt"></i> Report Structure</h2>
-        <div class="report-structure">
-            <ol>
-                <li><strong>Title</strong></li>
-                <li><strong>Introduction</strong>: purpose/scope</li>
-                <li><strong>Methodology</strong>: how information was gathered</li>
-                <li><strong>Findings</strong>: main results</li>
-                <li><strong>Conclusion</strong>: summary</li>
-                <li><strong>Recommendations</strong>: suggested actions</li>
-            </ol>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-language"></i> Language Features</h2>
-        <div class="language-features">
-            <h3>Characteristics</h3>
-            <ul>
-                <li>Formal tone</li>
-                <li>Objective presentation</li>
-                <li>Passive voice usage</li>
-                <li>Technical vocabulary</li>
-                <li>Bullet points/numbering</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-tasks"></i> Practice</h2>
-        <div class="question">
-            <div class="question-header">School Report</div>
-            <p>"Write a report on the recent science fair"</p>
-        </div>
-        <div class="question">
-            <div class="question-header">Official Report</div>
-            <p>"Report on the causes of poor performance in English"</p>
-        </div>
-    </div>
-</div>
-""",
-
-        "Formal letter writing": f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">Formal Letter Guide ({exam})</h1>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-envelope"></i> Letter Structure</h2>
-        <div class="letter-structure">
-            <ol>
-                <li><strong>Sender's Address</strong></li>
-                <li><strong>Date</strong></li>
-                <li><strong>Recipient's Address</strong></li>
-                <li><strong>Salutation</strong></li>
-                <li><strong>Subject Line</strong></li>
-                <li><strong>Body</strong> (introduction, main content, conclusion)</li>
-                <li><strong>Complimentary Close</strong></li>
-                <li><strong>Signature</strong></li>
-            </ol>
-        </div>
-    </div>
-    
-    <div class="lesson-section">
-        <h2><i class="fas fa-keyboard"></i> Language Register</h2>
-        <div class="register-features">
-            <h3>Formal Features</h3>
-            <ul>
-                <li>Polite tone</li>
-                <li>Complex sentence structures</li>
-                <li>Avoid contractions</li>
-                <li>Precise vocabulary</li>
-                <li>Passive constructions</li>
-            </ul>
-        </div>
-    </div>
-    
-    <div class="practice-section">
-        <h2><i class="fas fa-edit"></i> Practice</h2>
-        <div class="question">
-            <div class="question-header">WAEC Example</div>
-            <p>"Write a letter to the editor about environmental pollution"</p>
-        </div>
-        <div class="question">
-            <div class="question-header">NECO Format</div>
-            <p>"Apply for a teaching position at a secondary school"</p>
-        </div>
-    </div>
-</div>
-"""
+    return get_registry("English").render(exam, topic)
+
+# Current syllabus snapshot, replaced whole by swap_syllabus when the file changes.
+# Its index resolves every topic to its lesson, one subject at a time on first use.
+syllabus = build_syllabus(syllabus_db, get_registry)
+
+def bundle_meta():
+    """What a bundle must have been built from to be served as is"""
+    return {
+        'syllabus_version': syllabus.version,
+        # A content hash, checkouts and deploys change file times but not lessons
+        'content_version': content_version(),
     }
-    
-    return english_notes.get(topic, f"""
-<div class="lesson-container">
-    <h1 class="lesson-title">{topic} - English ({exam})</h1>
-    <div class="lesson-content">
-        <p>Comprehensive English notes for {topic} are currently being developed.</p>
-        <p>Please check back soon or select another English topic.</p>
-    </div>
-</div>
-""")
 
+def load_lesson_bundle():
+    """Map LESSON_BUNDLE, or None if unset, unreadable or built from other content"""
+    if not LESSON_BUNDLE:
+        return None
+    try:
+        bundle = LessonBundle(LESSON_BUNDLE)
+    except (OSError, ValueError) as e:
+        app.logger.error(f"Error loading lesson bundle: {str(e)}")
+        return None
+    if bundle.meta != bundle_meta():
+        app.logger.warning(f"Lesson bundle {LESSON_BUNDLE} is out of date, rebuild it with build_bundle.py")
+        return None
+    app.logger.info(f"Lesson bundle: {len(bundle)} lessons, {bundle.size} bytes mapped")
+    return bundle
+
+lesson_bundle = load_lesson_bundle()
+
+@lru_cache(maxsize=None)
+def load_catalog():
+    """Catalog built on first use, it needs every subject's lessons loaded"""
+    current = syllabus
+    return build_catalog(current.tree, current.index.has_lesson, lesson_url)
+
+@lru_cache(maxsize=None)
+def load_equivalents():
+    """Cross-exam topic similarity, computed once per syllabus and lesson content"""
+    current = syllabus
+
+    def lesson_text(key):
+        template = current.index.lookup(*key)
+        # Rendered without the exam name so it does not pull same-exam lessons together
+        return strip_tags(template.render(exam='', topic=key[2])) if template else None
+
+    return TopicEquivalents(current.index, lesson_text)
+
+@lru_cache(maxsize=None)
+def load_search_index():
+    """Search index over every syllabus lesson, built once and then updated per lesson"""
+    index = SearchIndex()
+    for key in syllabus.index:
+        lesson = find_cached_lesson(*key, record=False) or render_lesson(*key)
+        if lesson:
+            index.update(key, strip_tags(lesson.note))
+    return index
+
+def swap_syllabus(snapshot):
+    """Install a rebuilt syllabus, then drop and re-render only the topics it changed"""
+    global syllabus
+    with lesson_reload_lock:
+        old, syllabus = syllabus, snapshot
+        removed = set(old.index) - set(snapshot.index)
+        added = set(snapshot.index) - set(old.index)
+        lesson_cache.discard_where(lambda key: key in removed)
+        updates = {key: None for key in removed}
+        updates.update((key, render_lesson(*key)) for key in added)
+        publish_lessons(updates)
+        load_catalog.cache_clear()
+        load_equivalents.cache_clear()
+        load_catalog()
+        load_equivalents()
+        app.logger.info(f"Syllabus reloaded: version {snapshot.version}, {len(added)} topics added, {len(removed)} removed")
+
+syllabus_watcher = SyllabusWatcher(
+    SYLLABUS_FILE, SYLLABUS_STAMP,
+    lambda tree: build_syllabus(tree, get_registry), swap_syllabus,
+    interval=SYLLABUS_POLL_SECONDS, logger=app.logger,
+)
+
+@app.before_request
+def start_syllabus_watcher():
+    syllabus_watcher.start()
+
+# Edited lessons are re-rendered on this thread, requests keep being served meanwhile
+content_poller = Poller(
+    refresh_lesson_content, LESSON_POLL_SECONDS if LESSON_DB else 0,
+    name='content-poller', logger=app.logger,
+)
+
+@app.before_request
+def start_content_poller():
+    content_poller.start()
+
+# With a bundle every syllabus lesson is already rendered, there is nothing to warm
+if lesson_bundle is None and LESSON_WARM_START == 'sync':
+    warm_lesson_store()
+elif lesson_bundle is None and LESSON_WARM_START == 'background':
+    threading.Thread(target=warm_lesson_store, name='lesson-warmup', daemon=True).start()
 
 @app.route('/')
 def index():
@@ -0,0 +1,87 @@
+# Lesson generation benchmarks
+# Run with: python bench_lessons.py [--number N]
+
+import argparse
+import timeit
+
+import importlib
+
+import app
+from lessons import SUBJECT_MODULES
+
+
+SUBJECT_NOTES = {
+    subject: importlib.import_module(module).NOTES
+    for subject, module in SUBJECT_MODULES.items()
+}
+
+SUBJECT_GENERATORS = {
+    "Mathematics": app.generate_math_lesson,
+    "English": app.generate_english_lesson,
+    "Physics": app.generate_physics_lesson,
+    "Chemistry": app.generate_chemistry_lesson,
+    "Biology": app.generate_biology_lesson,
+}
+
+
+def format_every_note(notes, exam, topic):
+    """The old behaviour: evaluate every f-string, then pick one"""
+    rendered = {key: body.format(exam=exam, topic=topic) for key, body in notes.items()}
+    return rendered.get(topic)
+
+
+def bench_registry(number):
+    print("Registry: format whole dict per call vs precompiled template")
+    print(f"{'subject':<12} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for subject, notes in SUBJECT_NOTES.items():
+        topic = next(iter(notes))
+        generator = SUBJECT_GENERATORS[subject]
+        before = timeit.timeit(lambda: format_every_note(notes, "WAEC", topic), number=number)
+        after = timeit.timeit(lambda: generator("WAEC", topic), number=number)
+        before_us = before / number * 1e6
+        after_us = after / number * 1e6
+        print(f"{subject:<12} {before_us:>12.2f} {after_us:>12.2f} {before_us / after_us:>7.1f}x")
+
+
+def bench_cache(number):
+    print("Lesson cache: uncached render vs cache hit")
+    exam, subject, topic = "WAEC", "Chemistry", "Stoichiometry"
+    app.get_lesson(exam, subject, topic)
+    cold = timeit.timeit(lambda: app.build_lesson(exam, subject, topic), number=number)
+    warm = timeit.timeit(lambda: app.get_lesson(exam, subject, topic), number=number)
+    print(f"render {cold / number * 1e6:.2f} us, hit {warm / number * 1e6:.2f} us")
+
+
+def bench_streaming(number):
+    print("Streaming: first chunk vs whole JSON body, uncached")
+    exam, subject, topic = "WAEC", "Chemistry", "Stoichiometry"
+
+    def first_chunk():
+        stream = app.stream_lesson_json(exam, subject, topic)
+        next(stream)
+        next(stream)
+        next(stream)
+        stream.close()
+
+    def whole_body():
+        note = app.build_lesson(exam, subject, topic)
+        app.json.dumps({'exam': exam, 'subject': subject, 'topic': topic, 'note': note})
+
+    first = timeit.timeit(first_chunk, number=number)
+    whole = timeit.timeit(whole_body, number=number)
+    print(f"first section {first / number * 1e6:.2f} us, whole body {whole / number * 1e6:.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lesson generation")
+    parser.add_argument('--number', type=int, default=2000, help="iterations per measurement")
+    args = parser.parse_args()
+    bench_registry(args.number)
+    print()
+    bench_cache(args.number)
+    print()
+    bench_streaming(args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# HTTP throughput benchmark for a running lesson server
+# Run with: python bench_server.py [--url http://127.0.0.1:5000] [--concurrency 16] [--seconds 10]
+#           python bench_server.py --url http://127.0.0.1:5001 --path /     # any other server
+#
+# Start the server under test first, either the development server
+# (python app.py) or the production one (gunicorn -c gunicorn.conf.py app:app),
+# and compare the requests per second and latencies this prints.
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from urllib.parse import quote
+
+
+def lesson_paths(syllabus_file):
+    """/api/lessons path of every syllabus topic"""
+    with open(syllabus_file, encoding='utf-8') as f:
+        syllabus = json.load(f)
+    return [
+        '/api/lessons/' + '/'.join(quote(part, safe='') for part in (exam, subject, topic))
+        for exam, subjects in syllabus.items()
+        for subject, topics in subjects.items()
+        for topic in topics
+    ]
+
+
+def client(base_url, paths, offset, deadline, latencies, errors):
+    """Request lessons round-robin until the deadline, recording each latency"""
+    position = offset
+    while time.perf_counter() < deadline:
+        request = urllib.request.Request(
+            base_url + paths[position % len(paths)], headers={'Accept-Encoding': 'gzip'})
+        position += 1
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                response.read()
+        except OSError:
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure lesson requests per second against a running server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--concurrency', type=int, default=16, help="simultaneous clients")
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--syllabus', default='syllabus.json')
+    parser.add_argument('--path', action='append', help="request these paths instead of every syllabus lesson")
+    args = parser.parse_args()
+
+    paths = args.path or lesson_paths(args.syllabus)
+    latencies, errors = [], []
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=client, args=(args.url, paths, i * 7, deadline, latencies, errors))
+        for i in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not latencies:
+        print(f"No successful requests, {len(errors)} errors")
+        return
+    latencies.sort()
+    print(f"{len(latencies) / args.seconds:.0f} requests/s over {args.seconds:g} s, "
+          f"{args.concurrency} clients, {len(errors)} errors")
+    print(f"latency p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# Build the read-only lesson bundle
+# Run with: python build_bundle.py lessons.bundle
+#
+# Renders every syllabus lesson once and writes the payloads to one file.
+# Serve it with LESSON_BUNDLE=lessons.bundle (and the same LESSON_DB, if
+# any). Workers ignore a bundle built from another syllabus or lesson
+# content, rebuild it after either changes (or after changing how lessons
+# are rendered).
+
+import argparse
+import os
+import sys
+import time
+
+# The build renders everything itself, the app must not warm up or map an old bundle
+os.environ['LESSON_WARM_START'] = 'off'
+os.environ.pop('LESSON_BUNDLE', None)
+
+import app
+from lesson_bundle import write_bundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write every rendered lesson to a bundle file")
+    parser.add_argument('bundle')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    lessons = {}
+    for key in app.syllabus.index:
+        lesson = app.render_lesson(*key)
+        if lesson is None:
+            print(f"Skipped {' / '.join(key)}: could not be rendered", file=sys.stderr)
+        else:
+            lessons[key] = lesson
+    count = write_bundle(args.bundle, lessons, app.bundle_meta())
+    seconds = time.perf_counter() - start
+    print(f"{count} lessons, {os.path.getsize(args.bundle)} bytes written to {args.bundle} in {seconds:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+# Whole-syllabus catalog
+# The exam -> subject -> topic tree is serialized and compressed once so
+# /api/catalog only has to hand out bytes.
+
+import hashlib
+import json
+
+from compression import CompressedBody
+
+
+class Catalog:
+    """Pre-serialized catalog payload with its version hash"""
+
+    def __init__(self, tree):
+        tree_json = json.dumps(tree, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        self.version = hashlib.sha256(tree_json.encode('utf-8')).hexdigest()[:16]
+        self.payload = CompressedBody(json.dumps(
+            {'version': self.version, 'exams': tree},
+            ensure_ascii=False,
+            separators=(',', ':'),
+        ).encode('utf-8'))
+
+
+def build_catalog(syllabus, has_lesson, lesson_url):
+    """Build the catalog for a syllabus
+
+    has_lesson(exam, subject, topic) says whether an authored lesson exists,
+    lesson_url(exam, subject, topic) gives the lesson's resource URL.
+    """
+    tree = {}
+    for exam, subjects in syllabus.items():
+        tree[exam] = {}
+        for subject, topics in subjects.items():
+            tree[exam][subject] = [
+                {
+                    'name': topic,
+                    'has_lesson': has_lesson(exam, subject, topic),
+                    'url': lesson_url(exam, subject, topic),
+                }
+                for topic in topics
+            ]
+    return Catalog(tree)
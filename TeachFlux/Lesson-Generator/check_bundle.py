@@ -0,0 +1,92 @@
+# End-to-end check of serving from a lesson bundle
+# Run with: python check_bundle.py
+#
+# Builds a bundle into a temporary directory, serves the app from it with a
+# real WSGI server (the Flask test client accepts bodies a server rejects)
+# and fetches lessons plain, gzipped, revalidated and batched. Exits
+# non-zero on the first failure.
+
+import gzip
+import http.client
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import quote
+
+from werkzeug.serving import make_server
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def fetch(url, data=None, headers=None):
+    """(status, headers, body) of one request, HTTP errors included"""
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def check(base, key):
+    url = base + '/api/lessons/' + '/'.join(quote(part, safe='') for part in key)
+
+    status, headers, body = fetch(url)
+    assert status == 200, f"lesson: status {status}"
+    assert json.loads(body)['topic'] == key[2], "lesson: wrong topic"
+
+    status, _, _ = fetch(url, headers={'If-None-Match': headers['ETag']})
+    assert status == 304, f"revalidated lesson: status {status}"
+
+    status, headers, compressed = fetch(url, headers={'Accept-Encoding': 'gzip'})
+    assert status == 200, f"gzip lesson: status {status}"
+    if headers.get('Content-Encoding') == 'gzip':
+        compressed = gzip.decompress(compressed)
+    assert compressed == body, "gzip lesson: body differs"
+
+    status, _, _ = fetch(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': headers['ETag']})
+    assert status == 304, f"revalidated lesson: status {status}"
+
+    status, _, body = fetch(
+        base + '/api/generate_notes',
+        data=json.dumps({'lessons': [list(key), list(key)]}).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+    )
+    lines = body.splitlines()
+    assert status == 200 and len(lines) == 2, f"batch: status {status}, {len(lines)} lines"
+    assert all(json.loads(line)['topic'] == key[2] for line in lines), "batch: wrong topic"
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        bundle = os.path.join(directory, 'lessons.bundle')
+        subprocess.run([sys.executable, 'build_bundle.py', bundle], cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        os.environ.update(LESSON_BUNDLE=bundle, LESSON_WARM_START='off')
+        import app
+
+        if app.lesson_bundle is None:
+            print("FAIL: bundle was not loaded")
+            return 1
+        logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        server = make_server('127.0.0.1', 0, app.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            check(f"http://127.0.0.1:{server.server_port}", next(iter(app.lesson_bundle.lessons)))
+        except (AssertionError, OSError, http.client.HTTPException) as e:
+            print(f"FAIL: {e}")
+            return 1
+        finally:
+            server.shutdown()
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# Import-time budget for the Lesson-Generator
+# Run with: python check_import_time.py [--budget-ms N] [--runs N]
+#
+# Imports app under `python -X importtime` with warm start off and sums the
+# self time of this project's own modules (Flask and other third-party
+# imports are reported but not counted). Exits non-zero when that sum goes
+# over budget or when a subject's lesson module is imported eagerly.
+
+import argparse
+import os
+import subprocess
+import sys
+
+from lessons import SUBJECT_MODULES
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Own-module import budget in milliseconds
+DEFAULT_BUDGET_MS = 50
+
+
+def local_modules():
+    names = {name[:-3] for name in os.listdir(HERE) if name.endswith('.py')}
+    names.add('lessons')
+    names.update(SUBJECT_MODULES.values())
+    return names
+
+
+def measure():
+    """{module: (self_us, cumulative_us)} for one fresh `import app`"""
+    env = dict(os.environ, LESSON_WARM_START='off')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=HERE, env=env, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the Lesson-Generator import-time budget")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=5, help="best of N fresh interpreters")
+    args = parser.parse_args()
+
+    own = local_modules()
+    best = None
+    for _ in range(args.runs):
+        timings = measure()
+        own_us = sum(self_us for name, (self_us, _) in timings.items() if name in own)
+        if best is None or own_us < best[0]:
+            best = (own_us, timings)
+    own_us, timings = best
+
+    total_ms = timings['app'][1] / 1000
+    own_ms = own_us / 1000
+    print(f"import app: {total_ms:.1f} ms total, {own_ms:.1f} ms in own modules (budget {args.budget_ms:.0f} ms)")
+
+    eager = sorted(module for module in SUBJECT_MODULES.values() if module in timings)
+    if eager:
+        print(f"FAIL: lesson modules imported eagerly: {', '.join(eager)}")
+        return 1
+    if own_ms > args.budget_ms:
+        print("FAIL: own-module import time over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# Checks of the TinyLFU lesson cache
+# Run with: python check_lesson_cache.py
+#
+# CountMinSketch never undercounts, keeps its rows independent and ages
+# its counts. TinyLFUCache keeps the hot topics through a bulk pass over
+# every lesson (where a plain LRU of the same size loses them all) and
+# never holds more bytes than its budget, oversized entries included. Exits non-zero on the first failure.
+
+import random
+import sys
+
+from lesson_cache import CountMinSketch, LessonCache, TinyLFUCache
+
+
+LESSON_BYTES = 8192
+BUDGET_LESSONS = 30
+HOT_TOPICS = 20
+ALL_TOPICS = 145
+# Keys are ints, whose hash is not randomized, so every run sees the same collisions
+COLD = 10_000
+
+
+def check_sketch():
+    sketch = CountMinSketch(1024, sample_size=10 ** 9)
+    rng = random.Random(7)
+    counts = {}
+    for _ in range(5000):
+        key = rng.randrange(2000)
+        counts[key] = counts.get(key, 0) + 1
+        sketch.add(key)
+    for key, count in counts.items():
+        assert sketch.estimate(key) >= min(count, 15), f"sketch: {key} estimated under its count {count}"
+
+    # Rows hash independently, a cold key rarely shares a counter with a hot one in every row
+    crowded = CountMinSketch(116)
+    for number in range(HOT_TOPICS):
+        for _ in range(10):
+            crowded.add(number)
+    inflated = sum(1 for number in range(1000) if crowded.estimate(COLD + number) >= 5)
+    assert inflated <= 10, f"sketch: {inflated} of 1000 cold keys look hot"
+
+    aging = CountMinSketch(1024, sample_size=100)
+    for _ in range(12):
+        aging.add(0)
+    for number in range(88):
+        aging.add(COLD + number)
+    # The 100th addition halves every counter
+    assert aging.estimate(0) == 6, f"sketch: aged estimate {aging.estimate(0)}, expected 6"
+    assert aging.additions == 50, f"sketch: {aging.additions} additions after aging"
+
+
+def simulate(cache):
+    """Misses on the hot topics after one bulk pass over every topic"""
+    def request(key):
+        if cache.get(key) is None:
+            cache.put(key, 'x' * LESSON_BYTES)
+            return 1
+        return 0
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        request(rng.randrange(HOT_TOPICS))
+    for number in range(ALL_TOPICS):
+        request(COLD + number)
+    return sum(request(rng.randrange(HOT_TOPICS)) for _ in range(2000))
+
+
+def check_scan_resistance():
+    tinylfu = TinyLFUCache(BUDGET_LESSONS * LESSON_BYTES, size_of=len)
+    misses = simulate(tinylfu)
+    assert misses == 0, f"scan: TinyLFU missed {misses} hot lookups after the bulk pass"
+    assert tinylfu.stats()['rejections'] > 0, "scan: bulk entries were never rejected"
+
+    lru_misses = simulate(LessonCache(maxsize=BUDGET_LESSONS))
+    assert lru_misses >= HOT_TOPICS, f"scan: plain LRU only missed {lru_misses}, the scenario tests nothing"
+
+
+def check_byte_budget():
+    cache = TinyLFUCache(100_000, size_of=len)
+    rng = random.Random(3)
+    for number in range(3000):
+        key = rng.randrange(300)
+        cache.get(key)
+        # Mostly lesson-sized, now and then bigger than the window or the whole budget
+        size = rng.choice([rng.randrange(100, 4000)] * 8 + [rng.randrange(2000, 60_000), 150_000])
+        cache.put(key, 'x' * size)
+        used = cache.stats()['bytes']
+        assert used <= cache.max_bytes, f"budget: {used} bytes held, budget {cache.max_bytes}"
+        assert cache._window_used <= cache.window_bytes, f"budget: window holds {cache._window_used} bytes"
+
+    cache.put('huge', 'x' * (cache.max_bytes + 1))
+    assert cache.get('huge') is None, "budget: entry over max_bytes was kept"
+
+
+def main():
+    for check in (check_sketch, check_scan_resistance, check_byte_budget):
+        try:
+            check()
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# Checks of the lesson word counter
+# Run with: python check_lesson_text.py
+#
+# WordCounter must give the same total as count_words on the joined text,
+# however the text is cut into chunks. Tried on markup edge cases cut at
+# every position, and on every syllabus lesson rendered section by section
+# and cut at random. Exits non-zero on the first failure.
+
+import random
+import sys
+
+from lesson_text import WordCounter, count_words
+
+
+# Words and tags split across chunks, comments, entities and stray '<'
+EDGE_CASES = [
+    'plain words only',
+    '<p>Two words</p><p>more words here</p>',
+    '<div class="lesson-section"><h2>Heading</h2>text</div>',
+    'a<b>b</b>c d',
+    'x < y and y > z',
+    '1 <2 3> 4',
+    'before<!-- a comment with > and < inside -->after',
+    'a<!-- b <!-- c -->d',
+    'one --> two <!-- three > -->four',
+    '<!-- only a comment -->',
+    '&amp; &lt;tag&gt; entities',
+    '<br/>line<br />break',
+    '<img src="a b.png" alt="two words">caption',
+    'tail <',
+    '< lone',
+    '\n\n## Markdown heading\n- item one\n- item two',
+    '',
+]
+
+
+def count_in_chunks(text, cuts):
+    counter = WordCounter()
+    previous = 0
+    for cut in cuts:
+        counter.feed(text[previous:cut])
+        previous = cut
+    counter.feed(text[previous:])
+    return counter.close()
+
+
+def check_edge_cases():
+    for text in EDGE_CASES:
+        expected = count_words(text)
+        for cut in range(len(text) + 1):
+            got = count_in_chunks(text, [cut])
+            assert got == expected, f"{text!r} cut at {cut}: {got} words, count_words says {expected}"
+        got = count_in_chunks(text, range(1, len(text)))
+        assert got == expected, f"{text!r} one character at a time: {got} words, count_words says {expected}"
+
+
+def check_lessons():
+    import app
+
+    rng = random.Random(5)
+    for key in app.syllabus.index:
+        pieces = list(app.iter_lesson(*key))
+        text = ''.join(pieces)
+        expected = count_words(text)
+
+        counter = WordCounter()
+        for piece in pieces:
+            counter.feed(piece)
+        got = counter.close()
+        assert got == expected, f"{key} by section: {got} words, count_words says {expected}"
+
+        cuts = sorted(rng.sample(range(1, len(text)), min(40, len(text) - 1)))
+        got = count_in_chunks(text, cuts)
+        assert got == expected, f"{key} cut at random: {got} words, count_words says {expected}"
+
+
+def main():
+    for check in (check_edge_cases, check_lessons):
+        try:
+            check()
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
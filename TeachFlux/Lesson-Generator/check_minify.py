@@ -0,0 +1,79 @@
+# Checks of lesson HTML minification
+# Run with: python check_minify.py
+#
+# minify_html on hand-written cases (verbatim elements, spaces between
+# inline elements, comments, default and empty attributes), then every
+# syllabus lesson rendered from the authored and from the minified
+# templates: plain text, word counts and section headings must be
+# identical, so padding and section splitting are unchanged. Exits
+# non-zero on the first failure.
+
+import sys
+
+from html_minify import minify_html
+from lesson_sections import split_lesson
+from lesson_text import count_words, strip_tags
+from minify_report import registries
+from lessons import SUBJECT_MODULES
+from syllabus_db import syllabus_db
+
+
+# (authored, minified)
+CASES = [
+    ('<div>\n    <p>  Some   text  </p>\n</div>', '<div><p>Some text</p></div>'),
+    ('<p><b>bold</b> <i>italic</i></p>', '<p><b>bold</b> <i>italic</i></p>'),
+    ('<p>a <!-- note --> b</p>', '<p>a b</p>'),
+    ('<pre>  keep\n    this  </pre>', '<pre>  keep\n    this  </pre>'),
+    ('<textarea>  as   typed </textarea>', '<textarea>  as   typed </textarea>'),
+    ('<script type="text/javascript">if (a  <  b) {}</script>', '<script>if (a  <  b) {}</script>'),
+    ('<style type="text/css">p  { }</style>', '<style>p  { }</style>'),
+    ('<pre class="  code ">  x  </pre>', '<pre class="code">  x  </pre>'),
+    ('<link rel="stylesheet" type="text/css" href="a.css">', '<link rel="stylesheet" href="a.css">'),
+    ('<input type="text" name="q">', '<input name="q">'),
+    ('<form method="GET" action="/s"></form>', '<form action="/s"></form>'),
+    ('<div class="" id="" style=" ">x</div>', '<div>x</div>'),
+    ('<div class="  a   b ">x</div>', '<div class="a b">x</div>'),
+    ('<input disabled>', '<input disabled>'),
+    ('<img src="a.png" />', '<img src="a.png"/>'),
+    ('x < y', 'x < y'),
+]
+
+
+def check_cases():
+    for authored, expected in CASES:
+        minified = minify_html(authored)
+        assert minified == expected, f"{authored!r}: got {minified!r}, expected {expected!r}"
+        assert minify_html(minified) == minified, f"{authored!r}: minifying twice changes it"
+
+
+def check_lessons():
+    authored, minified = registries(False), registries(True)
+    for exam, subjects in syllabus_db.items():
+        for subject, topics in subjects.items():
+            if subject not in SUBJECT_MODULES:
+                continue
+            for topic in topics:
+                label = f"{exam} / {subject} / {topic}"
+                before = authored[subject].render(exam, topic)
+                after = minified[subject].render(exam, topic)
+                assert len(after) <= len(before), f"{label}: minified lesson is larger"
+                assert strip_tags(after) == strip_tags(before), f"{label}: plain text differs"
+                assert count_words(after) == count_words(before), f"{label}: word count differs"
+                headings = [section.heading for section in split_lesson(before)[1]]
+                assert [section.heading for section in split_lesson(after)[1]] == headings, \
+                    f"{label}: section headings differ"
+
+
+def main():
+    for check in (check_cases, check_lessons):
+        try:
+            check()
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# Checks of lesson section splitting
+# Run with: python check_sections.py
+#
+# split_lesson must keep every word of a lesson, in document order: the
+# sections joined back give the lesson's text without its title, their
+# headings follow the <h2>s as they appear, and the Overview only holds
+# what comes before the first section. Tried on a hand-written lesson and
+# on every syllabus lesson. Exits non-zero on the first failure.
+
+import re
+import sys
+
+from lesson_registry import SECTION_START
+from lesson_sections import split_lesson, _TITLE_RE
+from lesson_text import strip_tags
+
+
+# Well-formed <h2>s only, one lesson closes a heading with </h3>
+_HEADING_RE = re.compile(r'<h2\b[^>]*>((?:(?!</?h\d).)*?)</h2\s*>', re.S)
+
+SAMPLE = (
+    '<div class="lesson-container"><h1>Atomic structure</h1>'
+    '<p>Intro paragraph.</p>'
+    f'{SECTION_START}<h2>Fundamental Concepts</h2><p>Protons and neutrons.</p></div>'
+    '<div class="note">A note between sections.</div>'
+    '<div class="practice-section"><h2>Practice Questions</h2><ol><li>Define an isotope.</li></ol></div>'
+    f'{SECTION_START}<p>A section without a heading.</p></div>'
+    '</div>'
+    '\n\n## Detailed Explanation\nPadding text.'
+)
+
+
+def check_note(label, note):
+    title, sections = split_lesson(note)
+    body = _TITLE_RE.sub('', note, count=1)
+    joined = strip_tags(' '.join(section.html for section in sections))
+    assert joined == strip_tags(body), f"{label}: text lost or moved by splitting"
+
+    headings = [strip_tags(heading) for heading in _HEADING_RE.findall(note)]
+    split_headings = [section.heading for section in sections if section.heading in headings]
+    assert split_headings == headings, f"{label}: headings {split_headings}, lesson has {headings}"
+
+    if sections[0].heading == 'Overview':
+        first = note.find(sections[1].html[:40]) if len(sections) > 1 else len(note)
+        assert strip_tags(sections[0].html) == strip_tags(_TITLE_RE.sub('', note[:first], count=1)), \
+            f"{label}: Overview holds more than the content before the first section"
+    return title, sections
+
+
+def check_sample():
+    title, sections = check_note('sample', SAMPLE)
+    assert title == 'Atomic structure', f"sample: title {title!r}"
+    headings = [section.heading for section in sections]
+    expected = ['Overview', 'Fundamental Concepts', 'Practice Questions', 'Section 3', 'Additional Notes']
+    assert headings == expected, f"sample: sections {headings}"
+    assert 'A note between sections.' in sections[1].html, "sample: a plain div left its section"
+
+
+def check_lessons():
+    import app
+
+    for key in app.syllabus.index:
+        check_note(' / '.join(key), app.build_lesson(*key))
+
+
+def main():
+    for check in (check_sample, check_lessons):
+        try:
+            check()
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# Checks of render coalescing
+# Run with: python check_single_flight.py
+#
+# SingleFlight on its own: 40 threads asking for one slow key share one
+# execution and its result or exception. Then through the app, with warm
+# start off so every topic starts cold: concurrent misses of one lesson,
+# streamed or not, cost one render, and a ?stream=1 response nobody reads
+# does not hold up other requests for the same topic. Exits non-zero on
+# the first failure.
+
+import os
+import sys
+import threading
+import time
+
+from single_flight import SingleFlight
+
+
+THREADS = 40
+
+
+def run_together(function, count=THREADS):
+    """[result or exception] of function() called from count threads at once"""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = function()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def check_coalescing():
+    flight = SingleFlight()
+
+    def slow_render():
+        time.sleep(0.05)
+        return object()
+
+    results = run_together(lambda: flight.do('topic', slow_render))
+    stats = flight.stats()
+    assert stats['executions'] == 1, f"coalescing: {stats['executions']} executions"
+    assert stats['coalesced'] == THREADS - 1, f"coalescing: {stats['coalesced']} coalesced"
+    assert stats['in_flight'] == 0, "coalescing: call left in flight"
+    assert all(result is results[0] for result in results), "coalescing: callers got different results"
+
+    # Finished calls are not remembered, the next caller runs afresh
+    assert flight.do('topic', slow_render) is not results[0], "coalescing: finished result reused"
+
+
+def check_errors():
+    flight = SingleFlight()
+
+    def failing_render():
+        time.sleep(0.05)
+        raise ValueError("render failed")
+
+    results = run_together(lambda: flight.do('topic', failing_render))
+    assert all(isinstance(result, ValueError) for result in results), "errors: not raised to every caller"
+    assert flight.stats()['in_flight'] == 0, "errors: call left in flight"
+    assert flight.do('topic', lambda: 'ok') == 'ok', "errors: key stuck after a failure"
+
+
+def check_app():
+    os.environ['LESSON_WARM_START'] = 'off'
+    import app
+
+    keys = iter(app.syllabus.index)
+    client = app.app.test_client()
+    render = app.render_and_cache_lesson
+
+    def slow_render(*key):
+        time.sleep(0.05)
+        return render(*key)
+
+    def post(key, stream):
+        url = '/api/generate_note?stream=1' if stream else '/api/generate_note'
+        response = client.post(url, json=dict(zip(('exam', 'subject', 'topic'), key)))
+        return response.status_code, response.get_data()
+
+    app.render_and_cache_lesson = slow_render
+    try:
+        for stream in (False, True):
+            key = next(keys)
+            before = app.lesson_renders.stats()['executions']
+            results = run_together(lambda: post(key, stream), count=8)
+            executions = app.lesson_renders.stats()['executions'] - before
+            label = 'streamed misses' if stream else 'misses'
+            assert executions == 1, f"{label}: {executions} renders for one lesson"
+            assert all(result == results[0] for result in results), f"{label}: responses differ"
+            assert results[0][0] == 200, f"{label}: status {results[0][0]}"
+    finally:
+        app.render_and_cache_lesson = render
+
+    # A streamed response left unread must not keep the topic's render in flight
+    key = next(keys)
+    unread = client.post('/api/generate_note?stream=1', json=dict(zip(('exam', 'subject', 'topic'), key)), buffered=False)
+    waiter = threading.Thread(target=app.get_lesson, args=key, daemon=True)
+    waiter.start()
+    waiter.join(timeout=2)
+    assert not waiter.is_alive(), "unread stream: get_lesson blocked behind it"
+    assert unread.get_data() == bytes(app.get_lesson(*key).payload.body), "unread stream: body differs"
+
+
+def main():
+    for check in (check_coalescing, check_errors, check_app):
+        try:
+            check()
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# Precompressed response bodies
+# A body is compressed once into gzip (and brotli, when installed) and
+# each request only picks the variant its Accept-Encoding allows.
+
+import gzip
+
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 512
+
+
+def best_encoding(accept_encodings, encodings):
+    """The one of encodings Accept-Encoding rates highest, None if it allows none"""
+    best, best_quality = None, 0
+    for encoding in ('br', 'gzip'):
+        if encoding in encodings:
+            quality = accept_encodings.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+    return best
+
+
+class CompressedBody:
+    """A response body together with its compressed variants"""
+
+    def __init__(self, body):
+        self.body = body
+        self.variants = {}
+        if len(body) < MIN_COMPRESS_SIZE:
+            return
+        compressed = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed['br'] = brotli.compress(body, quality=11)
+        for encoding, data in compressed.items():
+            if len(data) < len(body):
+                self.variants[encoding] = data
+
+    def negotiate(self, accept_encodings):
+        """(encoding, bytes) best matching Accept-Encoding, encoding is None for identity"""
+        best = best_encoding(accept_encodings, self.variants)
+        if best is None:
+            return None, self.body
+        return best, self.variants[best]
+
+
+def compressed_response(compressed, etag=None, last_modified=None, status=200, mimetype='application/json'):
+    """Response for a CompressedBody, or an empty 304 if the client already has it"""
+    encoding, body = compressed.negotiate(request.accept_encodings)
+    if etag and encoding:
+        etag = f"{etag}-{encoding}"
+
+    if (etag or last_modified) and not is_resource_modified(
+            request.environ, etag=etag, last_modified=last_modified):
+        response = Response(status=304)
+    else:
+        # WSGI servers only accept bytes, a mapped memoryview body is copied here
+        response = Response(bytes(body), status=status, mimetype=mimetype)
+        if encoding:
+            response.content_encoding = encoding
+    if etag:
+        response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.vary.add('Accept-Encoding')
+    return response
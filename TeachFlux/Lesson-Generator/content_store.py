@@ -0,0 +1,130 @@
+# SQLite lesson content store
+# Lesson templates live in a local SQLite database (WAL mode) keyed by
+# subject and topic, each with a content hash, so an edit can go live
+# without redeploying or restarting workers.
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lessons (
+    subject TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    body TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (subject, topic)
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    subject TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    PRIMARY KEY (subject, alias)
+);
+"""
+
+# Topic under which a subject's placeholder lesson is stored
+FALLBACK_TOPIC = ''
+
+
+def content_hash(body):
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+class ContentStore:
+    """Lesson templates and aliases in a SQLite database"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+        self._open_poll_connection()
+        # A worker forked from a preloading master must not reuse its connections
+        os.register_at_fork(after_in_child=self._reopen)
+
+    def _open_poll_connection(self):
+        # data_version is only comparable between calls on the same connection
+        self._poll_conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._poll_lock = threading.Lock()
+
+    def _reopen(self):
+        self._local = threading.local()
+        self._open_poll_connection()
+
+    def _connection(self):
+        # One connection per thread, sqlite3 connections are not shareable
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            self._local.conn = conn
+        return conn
+
+    def put(self, subject, topic, body):
+        """Store a lesson body, returns True if its content actually changed"""
+        digest = content_hash(body)
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT hash FROM lessons WHERE subject = ? AND topic = ?', (subject, topic)
+            ).fetchone()
+            if row and row[0] == digest:
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO lessons (subject, topic, body, hash, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (subject, topic, body, digest, time.time()),
+            )
+        return True
+
+    def put_alias(self, subject, alias, topic):
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO aliases (subject, alias, topic) VALUES (?, ?, ?)',
+                (subject, alias, topic),
+            )
+
+    def subject_content(self, subject):
+        """(notes, fallback, aliases, hashes) for one subject, or None if it has no lessons"""
+        conn = self._connection()
+        notes, hashes, fallback = {}, {}, None
+        for topic, body, digest in conn.execute(
+                'SELECT topic, body, hash FROM lessons WHERE subject = ?', (subject,)):
+            hashes[topic] = digest
+            if topic == FALLBACK_TOPIC:
+                fallback = body
+            else:
+                notes[topic] = body
+        if fallback is None:
+            return None
+        aliases = dict(conn.execute('SELECT alias, topic FROM aliases WHERE subject = ?', (subject,)))
+        return notes, fallback, aliases, hashes
+
+    def aliases(self):
+        """{subject: {alias: topic}} for every stored alias"""
+        result = {}
+        for subject, alias, topic in self._connection().execute('SELECT subject, alias, topic FROM aliases'):
+            result.setdefault(subject, {})[alias] = topic
+        return result
+
+    def hashes(self):
+        """{subject: {topic: hash}} for every stored lesson"""
+        result = {}
+        for subject, topic, digest in self._connection().execute('SELECT subject, topic, hash FROM lessons'):
+            result.setdefault(subject, {})[topic] = digest
+        return result
+
+    def data_version(self):
+        """Changes whenever another connection commits, cheap enough to poll"""
+        with self._poll_lock:
+            return self._poll_conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def last_modified(self):
+        updated_at = self._connection().execute('SELECT MAX(updated_at) FROM lessons').fetchone()[0]
+        if updated_at is None:
+            return None
+        return datetime.fromtimestamp(int(updated_at), timezone.utc)
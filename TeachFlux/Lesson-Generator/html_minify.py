@@ -0,0 +1,84 @@
+# Lesson HTML minification
+# The lesson templates are indented f-strings, most of their whitespace is
+# indentation around block elements that a browser never renders. Removing
+# it, comments and attributes that only restate the default leaves markup
+# that renders identically in fewer bytes.
+
+import re
+
+
+# Elements whose content is shown or executed exactly as written
+_VERBATIM_RE = re.compile(r'(<(pre|textarea|script|style)\b[^>]*>)(.*?</\2\s*>)', re.S | re.I)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.S)
+_SPACE_RE = re.compile(r'\s+')
+# Whitespace next to these tags is not rendered, unlike between inline ones
+_BLOCK_TAG_RE = re.compile(
+    r'\s*(</?(?:div|p|h[1-6]|ul|ol|li|dl|dt|dd|table|thead|tbody|tfoot|tr|th|td|caption'
+    r'|section|article|header|footer|nav|blockquote|figure|figcaption|hr|br)\b[^>]*>)\s*',
+    re.I,
+)
+_TAG_RE = re.compile(r'<([A-Za-z][\w-]*)((?:\s+[^\s=<>/]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'<>]+))?)*)\s*(/?)>')
+_ATTRIBUTE_RE = re.compile(r'([^\s=<>/]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s"\'<>]+))?')
+
+# (tag, attribute, value) that browsers assume when the attribute is missing
+DEFAULT_ATTRIBUTES = frozenset([
+    ('script', 'type', 'text/javascript'),
+    ('style', 'type', 'text/css'),
+    ('link', 'type', 'text/css'),
+    ('input', 'type', 'text'),
+    ('form', 'method', 'get'),
+])
+
+# Attributes that change nothing when they are empty
+EMPTY_ATTRIBUTES = frozenset(['class', 'id', 'style'])
+
+
+def _attribute(tag, name, value):
+    """name=value as it should be written, or None if it is redundant"""
+    if not value:
+        # A bare attribute (disabled, required), findall gives '' for its value
+        return name
+    quote = value[0] if value[0] in '"\'' else ''
+    text = value[1:-1] if quote else value
+    key = name.lower()
+    if (tag, key, text.strip().lower()) in DEFAULT_ATTRIBUTES:
+        return None
+    if key in EMPTY_ATTRIBUTES and not text.strip():
+        return None
+    if key == 'class':
+        # Class lists are whitespace separated, the amount does not matter
+        text = ' '.join(text.split())
+    return f"{name}={quote}{text}{quote}"
+
+
+def _tag(match):
+    tag, attributes, slash = match.groups()
+    kept = [
+        written for written in (
+            _attribute(tag.lower(), name, value) for name, value in _ATTRIBUTE_RE.findall(attributes)
+        ) if written is not None
+    ]
+    return '<' + ' '.join([tag] + kept) + slash + '>'
+
+
+def _minify_text(html):
+    html = _COMMENT_RE.sub('', html)
+    html = _TAG_RE.sub(_tag, html)
+    return _BLOCK_TAG_RE.sub(r'\1', _SPACE_RE.sub(' ', html))
+
+
+def minify_html(html):
+    """html with insignificant whitespace, comments and default attributes removed
+
+    The content of <pre>, <textarea>, <script> and <style> elements is left
+    untouched, only their opening tag is tidied.
+    """
+    parts = _VERBATIM_RE.split(html)
+    # split() yields text, opening tag, tag name, content and closing tag, text, ...
+    out = []
+    for position in range(0, len(parts), 4):
+        out.append(_minify_text(parts[position]))
+        if position + 1 < len(parts):
+            out.append(_TAG_RE.sub(_tag, parts[position + 1]))
+            out.append(parts[position + 3])
+    return ''.join(out).strip()
@@ -0,0 +1,55 @@
+# Import lesson content into the SQLite content store
+# Run with:
+#   python import_lessons.py lessons.db              # every lessons/<subject>.py module
+#   python import_lessons.py lessons.db --subject Chemistry --topic "Organic Chemistry" --file note.html
+#
+# Serve from the store with LESSON_DB=lessons.db. Running workers pick up
+# edits within LESSON_POLL_SECONDS, unchanged lessons are not rewritten.
+
+import argparse
+import importlib
+import sys
+
+from content_store import ContentStore, FALLBACK_TOPIC
+from lessons import SUBJECT_MODULES
+
+
+def import_modules(store, subjects):
+    """Copy NOTES, FALLBACK and ALIASES of each subject module into the store"""
+    changed = 0
+    for subject in subjects:
+        module = importlib.import_module(SUBJECT_MODULES[subject])
+        changed += store.put(subject, FALLBACK_TOPIC, module.FALLBACK)
+        for topic, body in module.NOTES.items():
+            changed += store.put(subject, topic, body)
+        for alias, topic in module.ALIASES.items():
+            store.put_alias(subject, alias, topic)
+        print(f"{subject}: {len(module.NOTES)} lessons, {len(module.ALIASES)} aliases")
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import lesson content into a SQLite content store")
+    parser.add_argument('database')
+    parser.add_argument('--subject', choices=sorted(SUBJECT_MODULES))
+    parser.add_argument('--topic', help="topic to update, the subject's placeholder lesson when empty")
+    parser.add_argument('--file', help="HTML template for --topic")
+    args = parser.parse_args()
+
+    store = ContentStore(args.database)
+    if args.file:
+        if not args.subject or args.topic is None:
+            parser.error("--file needs --subject and --topic")
+        with open(args.file, encoding='utf-8') as f:
+            body = f.read()
+        changed = store.put(args.subject, args.topic, body)
+        print(f"{args.subject} / {args.topic or '(placeholder)'}: {'updated' if changed else 'unchanged'}")
+    else:
+        subjects = [args.subject] if args.subject else list(SUBJECT_MODULES)
+        changed = import_modules(store, subjects)
+        print(f"{changed} lessons written to {args.database}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# Memory-mapped lesson bundle
+# build_bundle.py writes every rendered lesson payload (identity, gzip and
+# brotli variants) into one read-only file. Workers mmap it and keep
+# memoryview slices, so all workers share a single page-cache copy instead
+# of each holding its own strings, and nothing has to be rendered at startup.
+# A payload is only copied to bytes for the response being written.
+#
+# Layout: MAGIC, then index offset and length (little-endian uint64), then
+# the payload bytes, then a JSON index of
+# [exam, subject, topic, etag, last_modified, {encoding: [offset, length]}].
+
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+from compression import CompressedBody
+
+
+MAGIC = b'TFLBNDL1'
+_HEADER = struct.Struct('<8sQQ')
+
+
+class MappedBody(CompressedBody):
+    """CompressedBody whose bytes are memoryview slices of a bundle"""
+
+    def __init__(self, body, variants):
+        self.body = body
+        self.variants = variants
+
+
+class BundledLesson:
+    """A lesson served straight from the bundle, shaped like CachedLesson"""
+
+    __slots__ = ('etag', 'last_modified', 'payload')
+
+    def __init__(self, etag, last_modified, payload):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.payload = payload
+
+    @property
+    def note(self):
+        # Only search indexing and section splitting need the text, decode on demand
+        return json.loads(bytes(self.payload.body))['note']
+
+
+def write_bundle(path, lessons, meta):
+    """Write {(exam, subject, topic): CachedLesson} to path, atomically replacing it"""
+    temporary = f"{path}.tmp"
+    entries = []
+    with open(temporary, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, 0, 0))
+        for (exam, subject, topic), lesson in lessons.items():
+            variants = {}
+            for encoding, data in [('identity', lesson.payload.body)] + sorted(lesson.payload.variants.items()):
+                variants[encoding] = [f.tell(), len(data)]
+                f.write(data)
+            modified = int(lesson.last_modified.timestamp()) if lesson.last_modified else None
+            entries.append([exam, subject, topic, lesson.etag, modified, variants])
+        index = json.dumps({'meta': meta, 'lessons': entries}, ensure_ascii=False).encode('utf-8')
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, index_offset, len(index)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return len(entries)
+
+
+class LessonBundle:
+    """Read-only view of a bundle file, lessons keyed by (exam, subject, topic)"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_offset, index_length = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a lesson bundle")
+        index = json.loads(self._map[index_offset:index_offset + index_length])
+        self.meta = index['meta']
+        self.size = len(self._map)
+
+        view = memoryview(self._map)
+        lessons = {}
+        for exam, subject, topic, etag, modified, variants in index['lessons']:
+            slices = {encoding: view[offset:offset + length] for encoding, (offset, length) in variants.items()}
+            body = slices.pop('identity')
+            last_modified = datetime.fromtimestamp(modified, timezone.utc) if modified is not None else None
+            lessons[(exam, subject, topic)] = BundledLesson(etag, last_modified, MappedBody(body, slices))
+        self.lessons = MappingProxyType(lessons)
+
+    def __len__(self):
+        return len(self.lessons)
+
+    def get(self, key):
+        return self.lessons.get(key)
+
+    def discard(self, keys):
+        """Stop serving lessons that changed since the bundle was built"""
+        lessons = {key: lesson for key, lesson in self.lessons.items() if key not in keys}
+        # Swapped in one assignment, like LessonStore
+        self.lessons = MappingProxyType(lessons)
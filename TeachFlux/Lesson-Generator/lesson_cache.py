@@ -0,0 +1,293 @@
+# Rendered lesson cache
+# Lessons are a pure function of (exam, subject, topic), so the rendered
+# note is kept in a bounded cache together with its ETag. LessonCache is a
+# plain LRU; TinyLFUCache adds frequency-aware admission so a one-off bulk
+# download cannot flush the topics students keep coming back to.
+
+import hashlib
+import threading
+from collections import Counter, OrderedDict, namedtuple
+
+
+# payload is the precompressed JSON response body for the lesson
+CachedLesson = namedtuple('CachedLesson', ['note', 'etag', 'last_modified', 'payload'])
+
+
+def lesson_size(lesson):
+    """Bytes a CachedLesson holds: its note plus every compressed variant of its payload"""
+    payload = lesson.payload
+    return len(lesson.note) + len(payload.body) + sum(len(data) for data in payload.variants.values())
+
+
+def make_etag(*parts):
+    """Strong ETag (unquoted) for the given strings"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:32]
+
+
+class LessonCache:
+    """Bounded, thread-safe LRU cache with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def discard_where(self, predicate):
+        """Drop every entry whose key matches predicate, returns how many"""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# Odd 64-bit multipliers, one per sketch row
+_ROW_MULTIPLIERS = (
+    0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB, 0xD6E8FEB86659FD93,
+    0xA0761D6478BD642F, 0xE7037ED1A0B428DB, 0x8EBC6AF09C88C6E3, 0x589965CC75374CC3,
+)
+_UINT64 = (1 << 64) - 1
+
+
+class CountMinSketch:
+    """Approximate access counts in fixed memory
+
+    Counters saturate at 15 and are all halved once sample_size accesses
+    have been recorded, so popularity from last exam season fades out.
+    """
+
+    def __init__(self, width, depth=4, sample_size=None):
+        if not 1 <= depth <= len(_ROW_MULTIPLIERS):
+            raise ValueError(f"depth must be between 1 and {len(_ROW_MULTIPLIERS)}")
+        self.width = 1 << max(width - 1, 15).bit_length()
+        self.depth = depth
+        self.sample_size = sample_size or 10 * self.width
+        self.additions = 0
+        self._shift = 64 - (self.width.bit_length() - 1)
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+
+    def _slots(self, key):
+        digest = hash(key) & _UINT64
+        # Multiplicative hashing: the top bits of each product depend on every
+        # bit of the digest, so a collision in one row says nothing about the next
+        for row in range(self.depth):
+            yield self._rows[row], ((digest * _ROW_MULTIPLIERS[row]) & _UINT64) >> self._shift
+
+    def add(self, key):
+        slots = list(self._slots(key))
+        # Conservative update: only the smallest counters grow, which keeps estimates tight
+        least = min(row[index] for row, index in slots)
+        if least < 15:
+            for row, index in slots:
+                if row[index] == least:
+                    row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key):
+        return min(row[index] for row, index in self._slots(key))
+
+    def _age(self):
+        for row in range(self.depth):
+            self._rows[row] = bytearray(count >> 1 for count in self._rows[row])
+        self.additions //= 2
+
+
+class TinyLFUCache:
+    """Thread-safe cache bounded in bytes, with TinyLFU admission
+
+    New entries land in a small LRU window (window_fraction of the budget).
+    An entry pushed out of the window only enters the main LRU if the
+    count-min sketch says it is requested more often than every main entry
+    it would evict; otherwise it is dropped. Every get is recorded in the
+    sketch. Per-topic popularity across all lesson tiers is TopicStats' job.
+    """
+
+    def __init__(self, max_bytes, size_of=lesson_size, window_fraction=0.01, average_size=8192):
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.window_bytes = max(int(max_bytes * window_fraction), 1)
+        self.main_bytes = max_bytes - self.window_bytes
+        self.sketch = CountMinSketch(4 * max(max_bytes // average_size, 1))
+        self._window = OrderedDict()
+        self._main = OrderedDict()
+        self._sizes = {}
+        self._window_used = 0
+        self._main_used = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    def __len__(self):
+        return len(self._window) + len(self._main)
+
+    def get(self, key):
+        with self._lock:
+            self.sketch.add(key)
+            for segment in (self._main, self._window):
+                if key in segment:
+                    segment.move_to_end(key)
+                    self.hits += 1
+                    return segment[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        size = self.size_of(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                self.rejections += 1
+                return
+            self._sizes[key] = size
+            if size > self.window_bytes:
+                # Never fits the window, it competes for main straight away
+                self._admit(key, value)
+                return
+            self._window[key] = value
+            self._window_used += size
+            # Whatever overflows the window competes with main's LRU end for a place
+            while self._window_used > self.window_bytes:
+                candidate, candidate_value = self._window.popitem(last=False)
+                self._window_used -= self._sizes[candidate]
+                self._admit(candidate, candidate_value)
+
+    def _admit(self, key, value):
+        size = self._sizes[key]
+        if size > self.main_bytes:
+            self._reject(key)
+            return
+        frequency = self.sketch.estimate(key)
+        victims, freed = [], 0
+        for victim in self._main:
+            if self._main_used - freed + size <= self.main_bytes:
+                break
+            if self.sketch.estimate(victim) >= frequency:
+                self._reject(key)
+                return
+            victims.append(victim)
+            freed += self._sizes[victim]
+        for victim in victims:
+            del self._main[victim]
+            self._main_used -= self._sizes.pop(victim)
+            self.evictions += 1
+        self._main[key] = value
+        self._main_used += size
+
+    def _reject(self, key):
+        del self._sizes[key]
+        self.rejections += 1
+
+    def _remove(self, key):
+        if key in self._window:
+            del self._window[key]
+            self._window_used -= self._sizes.pop(key)
+        elif key in self._main:
+            del self._main[key]
+            self._main_used -= self._sizes.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._window.clear()
+            self._main.clear()
+            self._sizes.clear()
+            self._window_used = self._main_used = 0
+
+    def discard_where(self, predicate):
+        """Drop every entry whose key matches predicate, returns how many"""
+        with self._lock:
+            stale = [key for segment in (self._window, self._main) for key in segment if predicate(key)]
+            for key in stale:
+                self._remove(key)
+            return len(stale)
+
+    def estimate(self, key):
+        """How often key was looked up lately, as the admission sketch sees it"""
+        with self._lock:
+            return self.sketch.estimate(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._window) + len(self._main),
+                'bytes': self._window_used + self._main_used,
+                'max_bytes': self.max_bytes,
+                'window': len(self._window),
+                'main': len(self._main),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'rejections': self.rejections,
+            }
+
+
+class TopicStats:
+    """Per-key lookup counts by the tier that answered them, None for a miss"""
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, key, tier):
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = Counter()
+            counts[tier or 'misses'] += 1
+
+    def totals(self):
+        """{tier: lookups, 'misses': lookups} over every key"""
+        with self._lock:
+            return dict(sum(self._counts.values(), Counter()))
+
+    def top(self, limit=20):
+        """[(key, {tier: lookups}), ...] for the most requested keys"""
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: -sum(item[1].values()))[:limit]
+            return [(key, dict(counts)) for key, counts in ranked]
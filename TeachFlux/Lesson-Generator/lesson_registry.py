@@ -0,0 +1,176 @@
+# Precompiled lesson templates
+# Lesson bodies are minified and parsed once at import time so a request
+# only has to fill in {exam}/{topic} for the single lesson it asked for.
+
+import re
+import threading
+from string import Formatter
+
+from html_minify import minify_html
+
+
+# Streamed lessons are cut before each of these so sections go out one by one
+SECTION_START = '<div class="lesson-section">'
+
+
+def normalize_topic(topic):
+    """Matching key for a topic name, ignoring case, punctuation, 'and' and plurals"""
+    words = []
+    for word in re.findall(r'[a-z0-9]+', topic.casefold()):
+        if word == 'and':
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        words.append(word)
+    return ' '.join(words)
+
+
+class LessonTemplate:
+    """A lesson body split into literal chunks and placeholder names
+
+    The body is minified first, every render then starts from the smaller markup.
+    """
+
+    __slots__ = ('literals', 'fields', 'pieces')
+
+    def __init__(self, source, minify=True):
+        if minify:
+            source = minify_html(source)
+        literals = ['']
+        fields = []
+        for literal, field, _, _ in Formatter().parse(source):
+            literals[-1] += literal
+            if field is not None:
+                fields.append(field)
+                literals.append('')
+        self.literals = tuple(literals)
+        self.fields = tuple(fields)
+
+        # (text, None) for literal pieces, (None, field) for placeholders
+        pieces = []
+        for index, literal in enumerate(self.literals):
+            if index:
+                pieces.append((None, self.fields[index - 1]))
+            start = 0
+            while True:
+                cut = literal.find(SECTION_START, start + 1)
+                if cut == -1:
+                    break
+                pieces.append((literal[start:cut], None))
+                start = cut
+            if literal[start:]:
+                pieces.append((literal[start:], None))
+        self.pieces = tuple(pieces)
+
+    def render(self, **values):
+        if not self.fields:
+            return self.literals[0]
+        parts = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            parts.append(values[field])
+            parts.append(literal)
+        return ''.join(parts)
+
+    def iter_render(self, **values):
+        """Yield the rendered lesson section by section"""
+        for text, field in self.pieces:
+            yield values[field] if field is not None else text
+
+
+class LessonRegistry:
+    """Compiled lessons for one subject, keyed by topic
+
+    aliases maps other syllabus names onto the topic whose lesson covers them.
+    minify=False keeps the markup exactly as authored.
+    """
+
+    def __init__(self, notes, fallback, aliases=None, minify=True):
+        self.templates = {topic: LessonTemplate(body, minify) for topic, body in notes.items()}
+        self.fallback = LessonTemplate(fallback, minify)
+        self.index = {normalize_topic(topic): topic for topic in self.templates}
+        for alias, topic in (aliases or {}).items():
+            self.index[normalize_topic(alias)] = topic
+
+    def __contains__(self, topic):
+        return self.find(topic) is not None
+
+    def topic_for(self, topic):
+        """Authored topic whose lesson covers this one, or None"""
+        if topic in self.templates:
+            return topic
+        return self.index.get(normalize_topic(topic))
+
+    def find(self, topic):
+        """Authored template for a topic, or None"""
+        return self.templates.get(self.topic_for(topic))
+
+    def render(self, exam, topic):
+        template = self.find(topic) or self.fallback
+        return template.render(exam=exam, topic=topic)
+
+
+class TopicIndex:
+    """Every (exam, subject, topic) of a syllabus resolved to its lesson template
+
+    registry_for(subject) returns the subject's LessonRegistry. Each subject
+    is resolved the first time one of its topics is looked up, so building
+    the index does not load any lesson content.
+    """
+
+    def __init__(self, syllabus, registry_for):
+        self.registry_for = registry_for
+        self.keys = {}
+        self.subjects = {}
+        for exam, subjects in syllabus.items():
+            for subject, topics in subjects.items():
+                for topic in topics:
+                    key = (exam, subject, topic)
+                    self.keys[key] = None
+                    self.subjects.setdefault(subject, []).append(key)
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _templates(self, subject):
+        templates = self._resolved.get(subject)
+        if templates is None:
+            with self._lock:
+                templates = self._resolved.get(subject)
+                if templates is None:
+                    registry = self.registry_for(subject)
+                    templates = {
+                        key: registry.find(key[2]) if registry else None
+                        for key in self.subjects[subject]
+                    }
+                    self._resolved[subject] = templates
+        return templates
+
+    def invalidate(self, subject):
+        """Forget a subject's resolved templates after its registry changed"""
+        with self._lock:
+            self._resolved.pop(subject, None)
+
+    def lookup(self, exam, subject, topic):
+        if subject not in self.subjects:
+            return None
+        return self._templates(subject).get((exam, subject, topic))
+
+    def has_lesson(self, exam, subject, topic):
+        return self.lookup(exam, subject, topic) is not None
+
+    def coverage(self):
+        """Counts of authored topics plus every topic still on the placeholder"""
+        missing = [key for key in self.keys if not self.has_lesson(*key)]
+        return {
+            'total': len(self.keys),
+            'covered': len(self.keys) - len(missing),
+            'missing': [{'exam': exam, 'subject': subject, 'topic': topic} for exam, subject, topic in missing],
+        }
@@ -0,0 +1,109 @@
+# Lesson sections
+# A rendered lesson is split once into its lesson-section divs, each with
+# its <h2> heading, so a client can show the table of contents straight
+# away and fetch sections one at a time as they are opened.
+
+import json
+import re
+from collections import namedtuple
+
+from compression import CompressedBody
+from lesson_registry import SECTION_START
+from lesson_text import count_words, strip_tags
+
+
+CONTAINER_START = '<div class="lesson-container">'
+
+_DIV_RE = re.compile(r'<div\b[^>]*>|</div\s*>')
+_TITLE_RE = re.compile(r'<h1\b[^>]*>(.*?)</h1\s*>', re.S)
+_HEADING_RE = re.compile(r'<h2\b[^>]*>(.*?)</h2\s*>', re.S)
+
+Section = namedtuple('Section', ['heading', 'html', 'words'])
+
+
+def div_end(html, start):
+    """Index just past the </div> closing the div that opens at start"""
+    depth = 0
+    for match in _DIV_RE.finditer(html, start):
+        depth += -1 if match.group().startswith('</') else 1
+        if depth == 0:
+            return match.end()
+    return len(html)
+
+
+def _section(heading, html):
+    return Section(heading, html, count_words(html))
+
+
+def split_lesson(note):
+    """(title, [Section, ...]) for a rendered lesson note
+
+    Every lesson-section div, and every other top-level div with an <h2>
+    (the practice questions), becomes a section in document order. Other
+    content joins the section before it, content ahead of the first section
+    becomes an overview and text after the container (the length padding)
+    comes last, so no content is lost or moved.
+    """
+    title = ''
+    match = _TITLE_RE.search(note)
+    if match:
+        title = strip_tags(match.group(1))
+
+    start = note.find(CONTAINER_START)
+    if start == -1:
+        inner_start, inner_end, tail = 0, len(note), ''
+    else:
+        end = div_end(note, start)
+        inner_start, inner_end, tail = start + len(CONTAINER_START), note.rfind('</div', start, end), note[end:]
+
+    # [heading, [html, ...]] per section, overview collects what comes first
+    parts, overview, position = [], [], inner_start
+    while True:
+        match = _DIV_RE.search(note, position, inner_end)
+        if match is None or match.group().startswith('</'):
+            break
+        end = div_end(note, match.start())
+        html = note[match.start():end]
+        heading = _HEADING_RE.search(html)
+        current = parts[-1][1] if parts else overview
+        current.append(note[position:match.start()])
+        if heading or match.group() == SECTION_START:
+            parts.append([strip_tags(heading.group(1)) if heading else f"Section {len(parts) + 1}", [html]])
+        else:
+            current.append(html)
+        position = end
+    (parts[-1][1] if parts else overview).append(note[position:inner_end])
+
+    sections = [_section(heading, ''.join(html).strip()) for heading, html in parts]
+    overview = _TITLE_RE.sub('', ''.join(overview), count=1).strip()
+    if strip_tags(overview):
+        sections.insert(0, _section('Overview', overview))
+    if strip_tags(tail):
+        sections.append(_section('Additional Notes', tail.strip()))
+    if not sections:
+        sections.append(_section(title or 'Lesson', note))
+    return title, sections
+
+
+class LessonSections:
+    """A lesson's table of contents and sections as precompressed JSON bodies"""
+
+    def __init__(self, key, note, etag, last_modified, section_url):
+        exam, subject, topic = key
+        self.etag = etag
+        self.last_modified = last_modified
+        self.title, self.sections = split_lesson(note)
+        header = {'exam': exam, 'subject': subject, 'topic': topic}
+        self.toc = CompressedBody(json.dumps(dict(header, title=self.title, sections=[
+            {'index': index, 'heading': section.heading, 'words': section.words, 'url': section_url(index)}
+            for index, section in enumerate(self.sections)
+        ]), ensure_ascii=False).encode('utf-8'))
+        self.payloads = [
+            CompressedBody(json.dumps(dict(
+                header, index=index, count=len(self.sections), heading=section.heading, html=section.html,
+            ), ensure_ascii=False).encode('utf-8'))
+            for index, section in enumerate(self.sections)
+        ]
+
+    def __len__(self):
+        return len(self.sections)
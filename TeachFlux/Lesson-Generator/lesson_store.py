@@ -0,0 +1,53 @@
+# Warm-start lesson store
+# Every syllabus lesson is rendered once at startup and frozen, so serving
+# a lesson is a lock-free dict lookup returning pre-serialized bytes.
+
+import threading
+import time
+from types import MappingProxyType
+
+
+class LessonStore:
+    """Immutable map of (exam, subject, topic) to rendered lessons"""
+
+    def __init__(self):
+        self.lessons = MappingProxyType({})
+        self.ready = threading.Event()
+        self.warmup_seconds = None
+
+    def __len__(self):
+        return len(self.lessons)
+
+    def get(self, key):
+        return self.lessons.get(key)
+
+    def warm(self, keys, render):
+        """Render every key with render(exam, subject, topic) and freeze the results"""
+        started = time.perf_counter()
+        lessons = {}
+        for key in keys:
+            lesson = render(*key)
+            if lesson is not None:
+                lessons[key] = lesson
+        # Swap in the finished map in one assignment, readers never see a partial store
+        self.lessons = MappingProxyType(lessons)
+        self.warmup_seconds = time.perf_counter() - started
+        self.ready.set()
+        return self.warmup_seconds
+
+    def update(self, lessons):
+        """Swap in a copy with some lessons replaced, a None value removes the key"""
+        updated = dict(self.lessons)
+        for key, lesson in lessons.items():
+            if lesson is None:
+                updated.pop(key, None)
+            else:
+                updated[key] = lesson
+        self.lessons = MappingProxyType(updated)
+
+    def status(self):
+        return {
+            'ready': self.ready.is_set(),
+            'lessons': len(self.lessons),
+            'warmup_seconds': self.warmup_seconds,
+        }
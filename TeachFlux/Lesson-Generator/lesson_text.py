@@ -0,0 +1,64 @@
+# Text helpers for rendered lesson HTML
+
+import html
+import re
+
+
+# Tags and comments are skipped, everything else between whitespace is a word
+_TOKEN_RE = re.compile(r'<!--.*?-->|</?[A-Za-z!][^>]*>|((?:[^\s<]|<(?![!/A-Za-z]))+)', re.S)
+
+
+def count_words(text):
+    """Count the words in an HTML fragment in a single pass, ignoring markup"""
+    count = 0
+    for match in _TOKEN_RE.finditer(text):
+        if match.group(1):
+            count += 1
+    return count
+
+
+def strip_tags(text):
+    """Plain text of an HTML fragment, words separated by single spaces"""
+    return html.unescape(' '.join(match.group(1) for match in _TOKEN_RE.finditer(text) if match.group(1)))
+
+
+class WordCounter:
+    """count_words over text that arrives in chunks
+
+    A word or tag that may continue into the next chunk is held back until
+    it is complete, so the total matches count_words on the joined text.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._tail = ''
+
+    def feed(self, chunk):
+        text = self._tail + chunk
+        cut = len(text)
+        open_tag = text.rfind('<')
+        if open_tag > text.rfind('>'):
+            cut = open_tag
+        # A comment may contain '>', it is only complete once '-->' arrives
+        position = 0
+        while True:
+            open_comment = text.find('<!--', position, cut)
+            if open_comment == -1:
+                break
+            position = text.find('-->', open_comment + 4) + 3
+            if position == 2:
+                cut = open_comment
+                break
+        for match in _TOKEN_RE.finditer(text, 0, cut):
+            if match.end() == cut:
+                cut = match.start()
+                break
+            if match.group(1):
+                self.count += 1
+        self._tail = text[cut:]
+
+    def close(self):
+        """Count whatever is still held back and return the total"""
+        self.count += count_words(self._tail)
+        self._tail = ''
+        return self.count
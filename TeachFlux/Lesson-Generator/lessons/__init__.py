@@ -0,0 +1,143 @@
+# Per-subject lesson content
+# Each subject's notes live in their own module and are imported on first
+# use, so a worker only pays for the subjects it actually serves. With
+# use_store() the same content is read from a SQLite ContentStore instead
+# and refresh() picks up edits without a restart.
+
+import hashlib
+import importlib
+import os
+import threading
+from datetime import datetime, timezone
+
+from lesson_registry import LessonRegistry
+
+
+SUBJECT_MODULES = {
+    "Mathematics": "lessons.mathematics",
+    "English": "lessons.english",
+    "Physics": "lessons.physics",
+    "Chemistry": "lessons.chemistry",
+    "Biology": "lessons.biology",
+}
+
+_registries = {}
+_lock = threading.Lock()
+
+# Content store state: the hashes and aliases each loaded registry was built from
+_store = None
+_store_version = None
+_hashes = {}
+_aliases = {}
+
+
+def use_store(store):
+    """Read lesson content from a ContentStore instead of the subject modules"""
+    global _store, _store_version
+    with _lock:
+        _store = store
+        _store_version = store.data_version()
+        _registries.clear()
+        _hashes.clear()
+        _aliases.clear()
+
+
+def _load(subject):
+    if _store is None:
+        module = importlib.import_module(SUBJECT_MODULES[subject])
+        return LessonRegistry(module.NOTES, module.FALLBACK, module.ALIASES)
+    content = _store.subject_content(subject)
+    if content is None:
+        return None
+    notes, fallback, aliases, hashes = content
+    _hashes[subject] = hashes
+    _aliases[subject] = aliases
+    return LessonRegistry(notes, fallback, aliases)
+
+
+def get_registry(subject):
+    """Compiled LessonRegistry for a subject, loading its content on first use
+
+    Returns None for subjects without lesson content.
+    """
+    registry = _registries.get(subject)
+    if registry is None and subject in SUBJECT_MODULES:
+        with _lock:
+            registry = _registries.get(subject)
+            if registry is None:
+                registry = _load(subject)
+                if registry is not None:
+                    _registries[subject] = registry
+    return registry
+
+
+def refresh():
+    """Rebuild loaded subjects whose content changed in the store
+
+    Returns {subject: (old_registry, new_registry, changed_topics)}, empty
+    when nothing was committed since the last call. Subjects that were never
+    loaded are left alone, they read current content on first use anyway.
+    """
+    global _store_version
+    if _store is None:
+        return {}
+    version = _store.data_version()
+    if version == _store_version:
+        return {}
+    with _lock:
+        _store_version = version
+        hashes = _store.hashes()
+        aliases = _store.aliases()
+        changes = {}
+        for subject, old in list(_registries.items()):
+            old_hashes, new_hashes = _hashes.get(subject, {}), hashes.get(subject, {})
+            changed = {
+                topic for topic in old_hashes.keys() | new_hashes.keys()
+                if old_hashes.get(topic) != new_hashes.get(topic)
+            }
+            if not changed and _aliases.get(subject, {}) == aliases.get(subject, {}):
+                continue
+            new = _load(subject)
+            if new is None:
+                del _registries[subject]
+            else:
+                _registries[subject] = new
+            changes[subject] = (old, new, changed)
+        return changes
+
+
+def loaded_subjects():
+    return sorted(_registries)
+
+
+def content_version():
+    """Hash of the current lesson content, unlike last_modified it ignores file times"""
+    digest = hashlib.sha256()
+    if _store is not None:
+        for subject, hashes in sorted(_store.hashes().items()):
+            for topic, content in sorted(hashes.items()):
+                digest.update(f"{subject}\0{topic}\0{content}\0".encode('utf-8'))
+        for subject, aliases in sorted(_store.aliases().items()):
+            for alias, topic in sorted(aliases.items()):
+                digest.update(f"{subject}\0{alias}\0{topic}\0".encode('utf-8'))
+    else:
+        directory = os.path.dirname(__file__)
+        for subject, module in sorted(SUBJECT_MODULES.items()):
+            with open(os.path.join(directory, module.rsplit('.', 1)[1] + '.py'), 'rb') as f:
+                digest.update(f"{subject}\0".encode('utf-8'))
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def last_modified():
+    """When any subject's lesson content last changed, without loading it"""
+    if _store is not None:
+        modified = _store.last_modified()
+        if modified is not None:
+            return modified
+    directory = os.path.dirname(__file__)
+    mtime = max(
+        os.path.getmtime(os.path.join(directory, module.rsplit('.', 1)[1] + '.py'))
+        for module in SUBJECT_MODULES.values()
+    )
+    return datetime.fromtimestamp(int(mtime), timezone.utc)
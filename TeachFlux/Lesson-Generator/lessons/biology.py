@@ -0,0 +1,398 @@
+# Biology lesson notes
+# Imported on first use through lessons.get_registry
+
+NOTES = {
+    "Cell Biology": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Cell Structure and Function ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-microscope"></i> Cell Theory</h2>
+        <div class="theory-principles">
+            <div class="principle-card">
+                <div class="number-circle">1</div>
+                <p>All living organisms are composed of cells</p>
+            </div>
+            <div class="principle-card">
+                <div class="number-circle">2</div>
+                <p>Cells are the basic unit of life</p>
+            </div>
+            <div class="principle-card">
+                <div class="number-circle">3</div>
+                <p>New cells arise from pre-existing cells</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-border-style"></i> Cell Types Comparison</h2>
+        <table class="cell-comparison">
+            <thead>
+                <tr>
+                    <th>Feature</th>
+                    <th>Prokaryotic</th>
+                    <th>Eukaryotic</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Nucleus</td>
+                    <td class="no">Absent</td>
+                    <td class="yes">Present</td>
+                </tr>
+                <tr>
+                    <td>Organelles</td>
+                    <td class="no">Few</td>
+                    <td class="yes">Membrane-bound</td>
+                </tr>
+                <tr>
+                    <td>Example</td>
+                    <td>Bacteria</td>
+                    <td>Plant/Animal cells</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-puzzle-piece"></i> Organelle Functions</h2>
+        <div class="organelle-grid">
+            <div class="organelle-card">
+                <div class="organelle-icon nucleus"></div>
+                <h3>Nucleus</h3>
+                <p>Controls cell activities, contains DNA</p>
+            </div>
+            <div class="organelle-card">
+                <div class="organelle-icon mitochondria"></div>
+                <h3>Mitochondria</h3>
+                <p>Powerhouse of cell (ATP production)</p>
+            </div>
+            <div class="organelle-card">
+                <div class="organelle-icon chloroplast"></div>
+                <h3>Chloroplast</h3>
+                <p>Site of photosynthesis (plant cells)</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-flask"></i> Practice Questions</h2>
+        <div class="question">
+            <p><strong>JAMB 2023:</strong> Which organelle contains digestive enzymes?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Lysosome</div>
+        </div>
+    </div>
+</div>
+""",
+    "Genetics": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Genetics and Inheritance ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-dna"></i> Mendelian Genetics</h2>
+        <div class="genetics-principles">
+            <div class="law-card">
+                <h3>Law of Segregation</h3>
+                <p>Alleles separate during gamete formation</p>
+            </div>
+            <div class="law-card">
+                <h3>Law of Independent Assortment</h3>
+                <p>Genes for different traits sort independently</p>
+            </div>
+        </div>
+        
+        <div class="punnett-square-example">
+            <h3>Monohybrid Cross (Tt × Tt)</h3>
+            <div class="punnett-grid">
+                <div class="grid-header">T</div>
+                <div class="grid-header">t</div>
+                <div class="grid-header">T</div>
+                <div class="genotype">TT</div>
+                <div class="genotype">Tt</div>
+                <div class="grid-header">t</div>
+                <div class="genotype">Tt</div>
+                <div class="genotype">tt</div>
+            </div>
+            <p class="ratio">Phenotypic ratio: 3:1 (Tall:Short)</p>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-helix-dna"></i> DNA Structure</h2>
+        <div class="dna-model">
+            <div class="dna-diagram">
+                <!-- DNA double helix diagram would go here -->
+            </div>
+            <div class="dna-components">
+                <h3>Key Components:</h3>
+                <ul>
+                    <li><strong>Phosphate group</strong></li>
+                    <li><strong>Deoxyribose sugar</strong></li>
+                    <li><strong>Nitrogenous bases:</strong> A,T,C,G</li>
+                </ul>
+                <p class="pairing">Base Pairing: A-T, C-G</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Ecology": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Ecology and Ecosystems ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-tree"></i> Ecosystem Components</h2>
+        <div class="ecosystem-pyramid">
+            <div class="pyramid-level producers">
+                <h3>Producers</h3>
+                <p>Plants, algae (autotrophs)</p>
+            </div>
+            <div class="pyramid-level consumers">
+                <h3>Consumers</h3>
+                <p>Herbivores, carnivores, omnivores</p>
+            </div>
+            <div class="pyramid-level decomposers">
+                <h3>Decomposers</h3>
+                <p>Bacteria, fungi</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-recycle"></i> Nutrient Cycles</h2>
+        <div class="cycle-tabs">
+            <div class="tab active" data-tab="carbon">Carbon Cycle</div>
+            <div class="tab" data-tab="nitrogen">Nitrogen Cycle</div>
+        </div>
+        
+        <div class="cycle-content active" id="carbon">
+            <div class="cycle-diagram">
+                <!-- Carbon cycle diagram would go here -->
+            </div>
+            <div class="cycle-key">
+                <p><strong>Key Processes:</strong></p>
+                <ul>
+                    <li>Photosynthesis (CO₂ → organic compounds)</li>
+                    <li>Respiration (organic compounds → CO₂)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Human Physiology": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Human Body Systems ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-heartbeat"></i> Circulatory System</h2>
+        <div class="system-diagram">
+            <!-- Heart and blood vessels diagram would go here -->
+        </div>
+        <div class="blood-components">
+            <h3>Blood Composition:</h3>
+            <ul>
+                <li><strong>Red blood cells:</strong> Carry oxygen (hemoglobin)</li>
+                <li><strong>White blood cells:</strong> Immune defense</li>
+                <li><strong>Platelets:</strong> Blood clotting</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-lungs"></i> Respiratory System</h2>
+        <div class="gas-exchange">
+            <div class="exchange-step">
+                <div class="step-number">1</div>
+                <p>Oxygen inhaled → alveoli</p>
+            </div>
+            <div class="exchange-step">
+                <div class="step-number">2</div>
+                <p>Diffuses into blood (high to low concentration)</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Plant Biology": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Plant Structure and Function ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-leaf"></i> Photosynthesis</h2>
+        <div class="photo-equation">
+            <p class="chemical-equation">6CO₂ + 6H₂O + light → C₆H₁₂O₆ + 6O₂</p>
+            <div class="photo-factors">
+                <h3>Factors Affecting Rate:</h3>
+                <ul>
+                    <li>Light intensity</li>
+                    <li>CO₂ concentration</li>
+                    <li>Temperature</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-seedling"></i> Plant Transport</h2>
+        <div class="transport-comparison">
+            <div class="vessel-card">
+                <h3>Xylem</h3>
+                <p>Transports water and minerals (upward)</p>
+            </div>
+            <div class="vessel-card">
+                <h3>Phloem</h3>
+                <p>Transports sugars (bidirectional)</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Reproduction": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Reproduction and Development ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-dna"></i> Asexual vs Sexual</h2>
+        <table class="reproduction-table">
+            <thead>
+                <tr>
+                    <th>Type</th>
+                    <th>Advantages</th>
+                    <th>Disadvantages</th>
+                    <th>Examples</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Asexual</td>
+                    <td>Rapid, no mate needed</td>
+                    <td>No genetic variation</td>
+                    <td>Bacteria, some plants</td>
+                </tr>
+                <tr>
+                    <td>Sexual</td>
+                    <td>Genetic diversity</td>
+                    <td>Energy intensive</td>
+                    <td>Most animals, flowering plants</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-baby"></i> Human Reproduction</h2>
+        <div class="reproductive-systems">
+            <div class="system-card male">
+                <h3>Male System</h3>
+                <ul>
+                    <li>Testes produce sperm</li>
+                    <li>Testosterone production</li>
+                </ul>
+            </div>
+            <div class="system-card female">
+                <h3>Female System</h3>
+                <ul>
+                    <li>Ovaries produce eggs</li>
+                    <li>Menstrual cycle (~28 days)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Evolution": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Evolution and Biodiversity ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-fish"></i> Evidence for Evolution</h2>
+        <div class="evidence-cards">
+            <div class="evidence-card">
+                <h3>Fossil Record</h3>
+                <p>Shows transitional forms (e.g., Archaeopteryx)</p>
+            </div>
+            <div class="evidence-card">
+                <h3>Comparative Anatomy</h3>
+                <p>Homologous vs analogous structures</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-dove"></i> Natural Selection</h2>
+        <div class="selection-steps">
+            <div class="step">
+                <div class="step-number">1</div>
+                <p>Variation exists in populations</p>
+            </div>
+            <div class="step">
+                <div class="step-number">2</div>
+                <p>Competition for limited resources</p>
+            </div>
+            <div class="step">
+                <div class="step-number">3</div>
+                <p>Best adapted survive and reproduce</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Health and Disease": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Human Health and Diseases ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-virus"></i> Disease Types</h2>
+        <div class="disease-types">
+            <div class="disease-card infectious">
+                <h3>Infectious Diseases</h3>
+                <ul>
+                    <li>Caused by pathogens</li>
+                    <li>Example: Malaria (Plasmodium)</li>
+                </ul>
+            </div>
+            <div class="disease-card non-infectious">
+                <h3>Non-infectious Diseases</h3>
+                <ul>
+                    <li>Not caused by pathogens</li>
+                    <li>Example: Diabetes</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-shield-virus"></i> Immune System</h2>
+        <div class="immunity-types">
+            <div class="immunity-card">
+                <h3>Active Immunity</h3>
+                <p>Body produces antibodies (vaccination)</p>
+            </div>
+            <div class="immunity-card">
+                <h3>Passive Immunity</h3>
+                <p>Antibodies transferred (mother to baby)</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+}
+
+FALLBACK = """
+<div class="lesson-container">
+    <h1 class="lesson-title">{topic} - Biology ({exam})</h1>
+    <div class="lesson-content">
+        <p>Comprehensive biology notes for {topic} are currently being developed.</p>
+        <p>Please check back soon or select another biology topic.</p>
+    </div>
+</div>
+"""
+
+# Syllabus names covered by an authored biology lesson
+ALIASES = {
+    "Cell structure": "Cell Biology",
+    "Human health": "Health and Disease",
+    "Photosynthesis": "Plant Biology"
+}
@@ -0,0 +1,705 @@
+# Chemistry lesson notes
+# Imported on first use through lessons.get_registry
+
+NOTES = {
+    "Atomic Structure": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Atomic Structure - Complete Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-atom"></i> Fundamental Concepts</h2>
+        <div class="concept-box">
+            <h3>Subatomic Particles</h3>
+            <table class="particle-table">
+                <thead>
+                    <tr>
+                        <th>Particle</th>
+                        <th>Charge</th>
+                        <th>Mass (amu)</th>
+                        <th>Location</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td>Proton</td>
+                        <td>+1</td>
+                        <td>1</td>
+                        <td>Nucleus</td>
+                    </tr>
+                    <tr>
+                        <td>Neutron</td>
+                        <td>0</td>
+                        <td>1</td>
+                        <td>Nucleus</td>
+                    </tr>
+                    <tr>
+                        <td>Electron</td>
+                        <td>-1</td>
+                        <td>0.0005</td>
+                        <td>Orbitals</td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+        
+        <div class="concept-box">
+            <h3>Electron Configuration Rules</h3>
+            <div class="rule-cards">
+                <div class="rule-card">
+                    <div class="rule-number">1</div>
+                    <h4>Aufbau Principle</h4>
+                    <p>Orbitals fill from lowest to highest energy</p>
+                </div>
+                <div class="rule-card">
+                    <div class="rule-number">2</div>
+                    <h4>Pauli Exclusion</h4>
+                    <p>Max 2 electrons per orbital with opposite spins</p>
+                </div>
+                <div class="rule-card">
+                    <div class="rule-number">3</div>
+                    <h4>Hund's Rule</h4>
+                    <p>Degenerate orbitals fill singly before pairing</p>
+                </div>
+            </div>
+            
+            <div class="example-box">
+                <h4>Example Configurations:</h4>
+                <ul>
+                    <li>Oxygen (8e⁻): 1s² 2s² 2p⁴</li>
+                    <li>Iron (26e⁻): 1s² 2s² 2p⁶ 3s² 3p⁶ 4s² 3d⁶</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-atom"></i> Quantum Mechanical Model</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Key Concepts</h3>
+                <ul class="concept-list">
+                    <li>Schrödinger's wave equation (ψ² = probability density)</li>
+                    <li>Orbital shapes: s (spherical), p (dumbbell), d (cloverleaf)</li>
+                    <li>Quantum numbers: n, l, mₗ, mₛ</li>
+                    <li>Heisenberg Uncertainty Principle</li>
+                </ul>
+            </div>
+            <div class="column">
+                <div class="orbital-diagram">
+                    <!-- Orbital shapes diagram would go here -->
+                    <div class="orbital s-orbital"></div>
+                    <div class="orbital p-orbital"></div>
+                    <div class="orbital d-orbital"></div>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-flask"></i> {exam} Exam Focus</h2>
+        <div class="exam-focus-box">
+            <ul>
+                <li>Writing configurations for ions (Fe³⁺ = [Ar]3d⁵)</li>
+                <li>Calculating subatomic particles</li>
+                <li>Interpreting emission spectra</li>
+                <li>Comparing atomic models' limitations</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>How many unpaired electrons in ground state oxygen?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">2 unpaired electrons (2p⁴ configuration)</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Explain three evidences for quantum mechanical model</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Chemical Bonding": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Chemical Bonding Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-link"></i> Bond Types</h2>
+        <table class="bond-table">
+            <thead>
+                <tr>
+                    <th>Bond Type</th>
+                    <th>Formation</th>
+                    <th>Properties</th>
+                    <th>Examples</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Ionic</td>
+                    <td>Electron transfer</td>
+                    <td>High MP/BP, conducts when molten</td>
+                    <td>NaCl</td>
+                </tr>
+                <tr>
+                    <td>Covalent</td>
+                    <td>Electron sharing</td>
+                    <td>Low MP/BP, poor conductor</td>
+                    <td>H₂O</td>
+                </tr>
+                <tr>
+                    <td>Metallic</td>
+                    <td>Delocalized e⁻</td>
+                    <td>Malleable, excellent conductor</td>
+                    <td>Cu</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-shapes"></i> Molecular Geometry</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>VSEPR Theory</h3>
+                <p>Predicts shapes based on electron pair repulsion:</p>
+                <ul class="geometry-list">
+                    <li>Linear (180°): CO₂</li>
+                    <li>Trigonal planar (120°): BF₃</li>
+                    <li>Tetrahedral (109.5°): CH₄</li>
+                    <li>Octahedral (90°): SF₆</li>
+                </ul>
+            </div>
+            <div class="column">
+                <div class="molecule-diagram">
+                    <!-- Molecular geometry diagrams would go here -->
+                    <div class="molecule linear"></div>
+                    <div class="molecule tetrahedral"></div>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-water"></i> Intermolecular Forces</h2>
+        <div class="forces-cards">
+            <div class="force-card">
+                <h3>Hydrogen Bonding</h3>
+                <p>Between H and F/O/N</p>
+                <p>Strongest IMF</p>
+            </div>
+            <div class="force-card">
+                <h3>Dipole-Dipole</h3>
+                <p>Between polar molecules</p>
+                <p>Medium strength</p>
+            </div>
+            <div class="force-card">
+                <h3>London Dispersion</h3>
+                <p>Between all molecules</p>
+                <p>Weakest IMF</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023</div>
+            <p>Why does ice float on water?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Hydrogen bonding creates open lattice structure with lower density</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC</div>
+            <p>Predict the shape of NH₃</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Trigonal pyramidal (107° bond angle)</div>
+        </div>
+    </div>
+</div>
+""",
+
+    "Stoichiometry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Stoichiometry Complete Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-balance-scale"></i> Key Laws</h2>
+        <div class="law-cards">
+            <div class="law-card">
+                <h3>Conservation of Mass</h3>
+                <p>2H₂ + O₂ → 2H₂O</p>
+                <p>4g + 32g → 36g</p>
+            </div>
+            <div class="law-card">
+                <h3>Definite Proportions</h3>
+                <p>H₂O always 1:8 H:O mass ratio</p>
+            </div>
+            <div class="law-card">
+                <h3>Multiple Proportions</h3>
+                <p>CO vs CO₂ (1:1 vs 1:2 O ratios)</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-calculator"></i> Calculations</h2>
+        <div class="concept-box">
+            <h3>Mole Roadmap</h3>
+            <div class="mole-roadmap">
+                <div class="roadmap-step">Mass</div>
+                <div class="roadmap-arrow">↔</div>
+                <div class="roadmap-step">Moles</div>
+                <div class="roadmap-arrow">↔</div>
+                <div class="roadmap-step">Particles</div>
+                <div class="roadmap-arrow">↔</div>
+                <div class="roadmap-step">Volume (gas at STP)</div>
+            </div>
+        </div>
+        
+        <div class="formula-box">
+            <h3>Titration Formula</h3>
+            <p class="formula">M₁V₁/n₁ = M₂V₂/n₂</p>
+        </div>
+        
+        <div class="formula-box">
+            <h3>Yield Calculations</h3>
+            <p class="formula">% Yield = (Actual/Theoretical) × 100</p>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-flask"></i> {exam} Problems</h2>
+        <div class="problem-types">
+            <div class="problem-card">
+                <h3>Limiting Reactant</h3>
+                <p>Identify which reactant runs out first</p>
+            </div>
+            <div class="problem-card">
+                <h3>Empirical Formula</h3>
+                <p>Determine simplest ratio of elements</p>
+            </div>
+            <div class="problem-card">
+                <h3>Gas Volume</h3>
+                <p>Calculate volumes at STP or other conditions</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB</div>
+            <p>What mass of CaO from 50g CaCO₃?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">28g (CaCO₃ → CaO + CO₂, molar mass ratio 100:56)</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Explain stoichiometric calculations in industry</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "States of Matter": """
+<div class="lesson-container">
+    <h1 class="lesson-title">States of Matter Compendium ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-solid fa-ice-cream"></i> Characteristics</h2>
+        <table class="states-table">
+            <thead>
+                <tr>
+                    <th>State</th>
+                    <th>Shape</th>
+                    <th>Volume</th>
+                    <th>Particle Motion</th>
+                    <th>Examples</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Solid</td>
+                    <td>Fixed</td>
+                    <td>Fixed</td>
+                    <td>Vibrational</td>
+                    <td>Ice</td>
+                </tr>
+                <tr>
+                    <td>Liquid</td>
+                    <td>Variable</td>
+                    <td>Fixed</td>
+                    <td>Rotational/Translational</td>
+                    <td>Water</td>
+                </tr>
+                <tr>
+                    <td>Gas</td>
+                    <td>Variable</td>
+                    <td>Variable</td>
+                    <td>Free random motion</td>
+                    <td>Steam</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-exchange-alt"></i> Phase Changes</h2>
+        <div class="phase-change-diagram">
+            <!-- Phase change diagram would go here -->
+            <div class="phase-change melting">
+                <p>Melting: Solid → Liquid (Endothermic)</p>
+            </div>
+            <div class="phase-change vaporization">
+                <p>Vaporization: Liquid → Gas (Endothermic)</p>
+            </div>
+            <div class="phase-change sublimation">
+                <p>Sublimation: Solid → Gas (Endothermic)</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO</div>
+            <p>Why does steam cause worse burns than boiling water?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Additional heat of vaporization released when steam condenses</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC (5 marks)</div>
+            <p>Sketch the heating curve for ice to steam</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Acids, bases and salts": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Acid-Base Chemistry Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-vial"></i> Theories</h2>
+        <div class="theory-cards">
+            <div class="theory-card">
+                <h3>Arrhenius</h3>
+                <ul>
+                    <li>Acids release H⁺</li>
+                    <li>Bases release OH⁻</li>
+                </ul>
+            </div>
+            <div class="theory-card">
+                <h3>Bronsted-Lowry</h3>
+                <ul>
+                    <li>Acids donate H⁺</li>
+                    <li>Bases accept H⁺</li>
+                </ul>
+            </div>
+            <div class="theory-card">
+                <h3>Lewis</h3>
+                <ul>
+                    <li>Acids accept e⁻ pairs</li>
+                    <li>Bases donate e⁻ pairs</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-chart-line"></i> pH Calculations</h2>
+        <div class="formula-box">
+            <p class="formula">pH = -log[H⁺]</p>
+            <p class="formula">pOH = -log[OH⁻]</p>
+            <p class="formula">pH + pOH = 14 (at 25°C)</p>
+        </div>
+        
+        <div class="concept-box">
+            <h3>Buffer Systems</h3>
+            <ul>
+                <li>Weak acid + conjugate base</li>
+                <li>Resist pH change</li>
+                <li>Example: CH₃COOH/CH₃COO⁻</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB</div>
+            <p>Calculate pH of 0.01M HCl</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">pH = -log(0.01) = 2</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Compare three acid-base theories</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Redox reactions": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Redox Chemistry Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-exchange-alt"></i> Fundamentals</h2>
+        <div class="redox-concepts">
+            <div class="concept-card">
+                <h3>Oxidation</h3>
+                <ul>
+                    <li>Loss of electrons</li>
+                    <li>Increase in oxidation number</li>
+                </ul>
+            </div>
+            <div class="concept-card">
+                <h3>Reduction</h3>
+                <ul>
+                    <li>Gain of electrons</li>
+                    <li>Decrease in oxidation number</li>
+                </ul>
+            </div>
+        </div>
+        
+        <div class="example-box">
+            <h3>Oxidizing Agents</h3>
+            <ul>
+                <li>Accept electrons (get reduced)</li>
+                <li>Examples: KMnO₄, K₂Cr₂O₇</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-balance-scale"></i> Balancing</h2>
+        <div class="step-box">
+            <h3>Half-Reaction Method</h3>
+            <ol>
+                <li>Split into oxidation/reduction</li>
+                <li>Balance atoms then charges</li>
+                <li>Equalize electron transfer</li>
+                <li>Combine half-reactions</li>
+            </ol>
+        </div>
+        
+        <div class="example-box">
+            <h4>Example:</h4>
+            <p>MnO₄⁻ + Fe²⁺ → Mn²⁺ + Fe³⁺ (acidic)</p>
+            <p>Balanced: MnO₄⁻ + 5Fe²⁺ + 8H⁺ → Mn²⁺ + 5Fe³⁺ + 4H₂O</p>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO</div>
+            <p>Balance: MnO₄⁻ + Fe²⁺ → Mn²⁺ + Fe³⁺ (acidic)</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">MnO₄⁻ + 5Fe²⁺ + 8H⁺ → Mn²⁺ + 5Fe³⁺ + 4H₂O</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC</div>
+            <p>Calculate E°cell for Zn|Zn²⁺||Cu²⁺|Cu</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">+1.10V (E°Cu - E°Zn = 0.34 - (-0.76))</div>
+        </div>
+    </div>
+</div>
+""",
+
+    "Organic chemistry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Organic Chemistry Compendium ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-oil-can"></i> Hydrocarbon Classes</h2>
+        <div class="hydrocarbon-types">
+            <div class="type-card">
+                <h3>Alkanes</h3>
+                <ul>
+                    <li>General formula: CₙH₂ₙ₊₂</li>
+                    <li>sp³ hybridization</li>
+                    <li>Example: CH₄ (methane)</li>
+                </ul>
+            </div>
+            <div class="type-card">
+                <h3>Arenes</h3>
+                <ul>
+                    <li>Benzene rings</li>
+                    <li>Delocalized π-electrons</li>
+                    <li>Example: C₆H₆</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-atom"></i> Functional Groups</h2>
+        <table class="functional-groups">
+            <thead>
+                <tr>
+                    <th>Group</th>
+                    <th>Prefix/Suffix</th>
+                    <th>Example</th>
+                    <th>Properties</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Alcohol</td>
+                    <td>-ol</td>
+                    <td>CH₃CH₂OH</td>
+                    <td>Hydrogen bonding</td>
+                </tr>
+                <tr>
+                    <td>Carboxylic acid</td>
+                    <td>-oic acid</td>
+                    <td>CH₃COOH</td>
+                    <td>Acidic</td>
+                </tr>
+                <tr>
+                    <td>Ester</td>
+                    <td>-yl -oate</td>
+                    <td>CH₃COOCH₃</td>
+                    <td>Fruity smells</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB</div>
+            <p>Name CH₃CH₂CH₂CH₂OH</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Butan-1-ol</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Compare addition and substitution reactions</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Environmental chemistry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Environmental Chemistry Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-smog"></i> Pollution Types</h2>
+        <div class="pollution-types">
+            <div class="pollution-card">
+                <h3>Air Pollution</h3>
+                <ul>
+                    <li>Greenhouse gases (CO₂, CH₄)</li>
+                    <li>Acid rain (SO₂, NOₓ)</li>
+                    <li>Ozone depletion (CFCs)</li>
+                </ul>
+            </div>
+            <div class="pollution-card">
+                <h3>Water Pollution</h3>
+                <ul>
+                    <li>Eutrophication (PO₄³⁻)</li>
+                    <li>Heavy metals (Pb²⁺, Hg²⁺)</li>
+                    <li>Oil spills</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-leaf"></i> Green Chemistry</h3>
+        <div class="principles-box">
+            <p>12 Principles including:</p>
+            <ul>
+                <li>Atom economy</li>
+                <li>Renewable feedstocks</li>
+                <li>Catalysis over stoichiometric reagents</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO</div>
+            <p>Explain two effects of acid rain</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Corrodes buildings, kills aquatic life</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Discuss three green chemistry principles</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Industrial chemistry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Industrial Chemistry Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-industry"></i> Major Processes</h2>
+        <div class="process-cards">
+            <div class="process-card">
+                <h3>Haber Process</h3>
+                <p>N₂ + 3H₂ ⇌ 2NH₃</p>
+                <ul>
+                    <li>Fe catalyst</li>
+                    <li>450°C, 200atm</li>
+                    <li>Ammonia production</li>
+                </ul>
+            </div>
+            <div class="process-card">
+                <h3>Contact Process</h3>
+                <p>2SO₂ + O₂ ⇌ 2SO₃ → H₂SO₄</p>
+                <ul>
+                    <li>V₂O₅ catalyst</li>
+                    <li>Sulfuric acid production</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB</div>
+            <p>Why 450°C in Haber process?</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Balance rate/yield (compromise conditions)</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (6 marks)</div>
+            <p>Compare batch vs continuous processes</p>
+        </div>
+    </div>
+</div>
+""",
+}
+
+FALLBACK = """
+<div class="lesson-container">
+    <h1 class="lesson-title">{topic} - Chemistry ({exam})</h1>
+    <div class="lesson-content">
+        <p>Comprehensive chemistry notes for {topic} are currently being developed.</p>
+        <p>Please check back soon or select another chemistry topic.</p>
+    </div>
+</div>
+"""
+
+# Syllabus names covered by an authored chemistry lesson
+ALIASES = {
+    "Chemistry in industry": "Industrial chemistry",
+    "Environmental pollution": "Environmental chemistry"
+}
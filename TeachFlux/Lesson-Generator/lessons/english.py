@@ -0,0 +1,564 @@
+# English lesson notes
+# Imported on first use through lessons.get_registry
+
+NOTES = {
+    "Reading comprehension": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Reading Comprehension Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-book-reader"></i> Comprehension Strategies</h2>
+        <div class="strategy-cards">
+            <div class="strategy-card">
+                <h3>Active Reading Techniques</h3>
+                <ul>
+                    <li><strong>Skimming</strong>: Quickly identify main ideas</li>
+                    <li><strong>Scanning</strong>: Locate specific information</li>
+                    <li><strong>Close Reading</strong>: Analyze details and language</li>
+                    <li><strong>Context Clues</strong>: Infer meaning from surrounding text</li>
+                </ul>
+            </div>
+            <div class="strategy-card">
+                <h3>Question Types</h3>
+                <ul>
+                    <li><strong>Literal</strong>: Direct answers in text</li>
+                    <li><strong>Inferential</strong>: Require interpretation</li>
+                    <li><strong>Evaluative</strong>: Judge author's purpose</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-highlighter"></i> Passage Analysis</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Structure Elements</h3>
+                <ul class="structure-list">
+                    <li><strong>Introduction</strong>: Thesis/main idea</li>
+                    <li><strong>Body</strong>: Supporting arguments/examples</li>
+                    <li><strong>Conclusion</strong>: Summary/final thoughts</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Language Devices</h3>
+                <ul class="devices-list">
+                    <li>Figurative language (simile, metaphor)</li>
+                    <li>Tone (author's attitude)</li>
+                    <li>Diction (word choice)</li>
+                    <li>Syntax (sentence structure)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
+        <div class="focus-box">
+            <ul>
+                <li>Main idea identification</li>
+                <li>Vocabulary-in-context questions</li>
+                <li>Author's purpose analysis</li>
+                <li>Passage organization</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024 Example</div>
+            <p>"What is the dominant tone in the passage?"</p>
+            <div class="options">
+                <p>a) Sarcastic</p>
+                <p>b) Nostalgic</p>
+                <p>c) Humorous</p>
+                <p>d) Indifferent</p>
+            </div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>"Analyze how the author uses imagery to convey mood in the passage"</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Summary writing": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Summary Writing Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-file-contract"></i> Effective Techniques</h2>
+        <div class="step-box">
+            <h3>The 5-Step Process</h3>
+            <ol>
+                <li>Read for overall understanding</li>
+                <li>Identify key points (usually 5-7 per paragraph)</li>
+                <li>Paraphrase using your own words</li>
+                <li>Maintain logical flow</li>
+                <li>Adhere to word limit</li>
+            </ol>
+        </div>
+        
+        <div class="warning-box">
+            <h3>Common Mistakes</h3>
+            <ul>
+                <li>Including examples/illustrations</li>
+                <li>Copying verbatim from passage</li>
+                <li>Adding personal opinions</li>
+                <li>Exceeding word count</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-clipboard-check"></i> {exam} Requirements</h2>
+        <div class="exam-cards">
+            <div class="exam-card">
+                <h3>JAMB</h3>
+                <ul>
+                    <li>60-70 word limit</li>
+                    <li>Objective summary style</li>
+                    <li>Focus on main points only</li>
+                </ul>
+            </div>
+            <div class="exam-card">
+                <h3>WAEC/NECO</h3>
+                <ul>
+                    <li>90-100 word limit</li>
+                    <li>May require section summaries</li>
+                    <li>Often needs paragraph organization</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Exercises</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023 Format</div>
+            <p>"Summarize the writer's arguments for renewable energy in 90 words"</p>
+        </div>
+        <div class="self-check">
+            <h3>Self-Check Rubric</h3>
+            <ul>
+                <li><input type="checkbox"> Covers all main points</li>
+                <li><input type="checkbox"> Uses own words</li>
+                <li><input type="checkbox"> Within word limit</li>
+                <li><input type="checkbox"> Cohesive flow</li>
+            </ul>
+        </div>
+    </div>
+</div>
+""",
+
+    "Lexis and structure": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Lexis & Structure Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-book-open"></i> Vocabulary Building</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Word Formation Processes</h3>
+                <ul>
+                    <li><strong>Affixation</strong>: prefixes/suffixes</li>
+                    <li><strong>Compounding</strong>: blackboard</li>
+                    <li><strong>Conversion</strong>: verbing nouns</li>
+                    <li><strong>Borrowing</strong>: linguistic loans</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Contextual Usage</h3>
+                <ul>
+                    <li>Denotation vs connotation</li>
+                    <li>Register (formal/informal)</li>
+                    <li>Collocations (natural word pairings)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-spell-check"></i> Grammar Essentials</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Common Error Areas</h3>
+                <ul>
+                    <li>Subject-verb agreement</li>
+                    <li>Pronoun reference</li>
+                    <li>Tense consistency</li>
+                    <li>Modifier placement</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Sentence Types</h3>
+                <ul>
+                    <li><strong>Simple</strong>: one independent clause</li>
+                    <li><strong>Compound</strong>: two+ independent clauses</li>
+                    <li><strong>Complex</strong>: independent + dependent clause</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB Example</div>
+            <p>"Choose the word opposite in meaning: 'EPHEMERAL'"</p>
+            <div class="options">
+                <p>a) Eternal</p>
+                <p>b) Fragile</p>
+                <p>c) Temporary</p>
+                <p>d) Partial</p>
+            </div>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">a) Eternal</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Exercise</div>
+            <p>"Identify and correct five errors in the given paragraph"</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Essay writing": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Essay Writing Compendium ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-edit"></i> Essay Types</h2>
+        <table class="essay-types">
+            <thead>
+                <tr>
+                    <th>Type</th>
+                    <th>Purpose</th>
+                    <th>Structure</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Narrative</td>
+                    <td>Tell a story</td>
+                    <td>Chronological order</td>
+                </tr>
+                <tr>
+                    <td>Descriptive</td>
+                    <td>Paint a picture</td>
+                    <td>Spatial/sensory details</td>
+                </tr>
+                <tr>
+                    <td>Argumentative</td>
+                    <td>Persuade</td>
+                    <td>Thesis-evidence-conclusion</td>
+                </tr>
+                <tr>
+                    <td>Expository</td>
+                    <td>Explain</td>
+                    <td>Definition-examples</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-pen-fancy"></i> Writing Process</h2>
+        <div class="process-steps">
+            <div class="process-step">
+                <h3>Pre-Writing</h3>
+                <ul>
+                    <li>Brainstorming techniques</li>
+                    <li>Outline creation</li>
+                    <li>Thesis formulation</li>
+                </ul>
+            </div>
+            <div class="process-step">
+                <h3>Drafting</h3>
+                <ul>
+                    <li>Introduction (hook, thesis)</li>
+                    <li>Body paragraphs (topic sentence, evidence)</li>
+                    <li>Conclusion (summary, final thought)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-clipboard-list"></i> {exam} Requirements</h2>
+        <div class="marking-scheme">
+            <h3>WAEC/NECO Marking Scheme</h3>
+            <ul>
+                <li>Content (10 marks)</li>
+                <li>Organization (5 marks)</li>
+                <li>Accuracy (5 marks)</li>
+                <li>Mechanical Accuracy (5 marks)</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-tasks"></i> Practice Prompts</h2>
+        <div class="prompt-cards">
+            <div class="prompt-card">
+                <h3>Argumentative</h3>
+                <p>"Should school uniforms be mandatory? Discuss"</p>
+            </div>
+            <div class="prompt-card">
+                <h3>Descriptive</h3>
+                <p>"Describe your most memorable childhood experience"</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+
+    "Oral English": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Oral English Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-volume-up"></i> Phonetics & Phonology</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Sound Patterns</h3>
+                <ul>
+                    <li>Vowels (monophthongs/diphthongs)</li>
+                    <li>Consonants (plosives, fricatives)</li>
+                    <li>Stress patterns (word/sentence)</li>
+                    <li>Intonation (rising/falling)</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Pronunciation Challenges</h3>
+                <ul>
+                    <li>/θ/ vs /ð/ (thin vs then)</li>
+                    <li>/ɪ/ vs /i:/ (ship vs sheep)</li>
+                    <li>/æ/ vs /ɑ:/ (cat vs cart)</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-comments"></i> Speech Features</h2>
+        <div class="speech-features">
+            <div class="feature-card">
+                <h3>Conversational Devices</h3>
+                <ul>
+                    <li>Turn-taking cues</li>
+                    <li>Back-channeling ("uh-huh")</li>
+                    <li>Discourse markers ("well", "so")</li>
+                </ul>
+            </div>
+            <div class="feature-card">
+                <h3>Public Speaking</h3>
+                <ul>
+                    <li>Audience engagement</li>
+                    <li>Pace and pausing</li>
+                    <li>Body language</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-microphone-alt"></i> Practice</h2>
+        <div class="question">
+            <div class="question-header">JAMB Example</div>
+            <p>"Which word has a different stress pattern?"</p>
+            <div class="options">
+                <p>a) REcord</p>
+                <p>b) preSENT</p>
+                <p>c) PROgress</p>
+                <p>d) CONduct</p>
+            </div>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">a) REcord (others have stress on second syllable)</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Oral Test</div>
+            <p>"Read the passage aloud observing correct stress and intonation"</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Literature analysis": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Literature Analysis Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-book"></i> Literary Devices</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Language Techniques</h3>
+                <ul>
+                    <li><strong>Imagery</strong>: sensory language</li>
+                    <li><strong>Symbolism</strong>: deeper meanings</li>
+                    <li><strong>Irony</strong>: contrast between expectation/reality</li>
+                    <li><strong>Foreshadowing</strong>: hints of future events</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Narrative Elements</h3>
+                <ul>
+                    <li><strong>Plot structure</strong>: exposition to resolution</li>
+                    <li><strong>Characterization</strong>: direct/indirect</li>
+                    <li><strong>Point of view</strong>: 1st/3rd person</li>
+                    <li><strong>Setting</strong>: time and place</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-search"></i> Textual Analysis</h2>
+        <div class="analysis-types">
+            <div class="analysis-card">
+                <h3>Poetry Analysis</h3>
+                <ul>
+                    <li>Form (sonnet, ballad)</li>
+                    <li>Meter (iambic pentameter)</li>
+                    <li>Rhyme scheme</li>
+                    <li>Poetic devices</li>
+                </ul>
+            </div>
+            <div class="analysis-card">
+                <h3>Prose Analysis</h3>
+                <ul>
+                    <li>Theme identification</li>
+                    <li>Character development</li>
+                    <li>Social context</li>
+                    <li>Author's style</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-quote-right"></i> Practice</h2>
+        <div class="question">
+            <div class="question-header">NECO Example</div>
+            <p>"Analyze the use of metaphor in the given poem"</p>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>"Compare the themes of love and betrayal in two prescribed texts"</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Report writing": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Report Writing Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-file-alt"></i> Report Structure</h2>
+        <div class="report-structure">
+            <ol>
+                <li><strong>Title</strong></li>
+                <li><strong>Introduction</strong>: purpose/scope</li>
+                <li><strong>Methodology</strong>: how information was gathered</li>
+                <li><strong>Findings</strong>: main results</li>
+                <li><strong>Conclusion</strong>: summary</li>
+                <li><strong>Recommendations</strong>: suggested actions</li>
+            </ol>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-language"></i> Language Features</h2>
+        <div class="language-features">
+            <h3>Characteristics</h3>
+            <ul>
+                <li>Formal tone</li>
+                <li>Objective presentation</li>
+                <li>Passive voice usage</li>
+                <li>Technical vocabulary</li>
+                <li>Bullet points/numbering</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-tasks"></i> Practice</h2>
+        <div class="question">
+            <div class="question-header">School Report</div>
+            <p>"Write a report on the recent science fair"</p>
+        </div>
+        <div class="question">
+            <div class="question-header">Official Report</div>
+            <p>"Report on the causes of poor performance in English"</p>
+        </div>
+    </div>
+</div>
+""",
+
+    "Formal letter writing": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Formal Letter Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-envelope"></i> Letter Structure</h2>
+        <div class="letter-structure">
+            <ol>
+                <li><strong>Sender's Address</strong></li>
+                <li><strong>Date</strong></li>
+                <li><strong>Recipient's Address</strong></li>
+                <li><strong>Salutation</strong></li>
+                <li><strong>Subject Line</strong></li>
+                <li><strong>Body</strong> (introduction, main content, conclusion)</li>
+                <li><strong>Complimentary Close</strong></li>
+                <li><strong>Signature</strong></li>
+            </ol>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-keyboard"></i> Language Register</h2>
+        <div class="register-features">
+            <h3>Formal Features</h3>
+            <ul>
+                <li>Polite tone</li>
+                <li>Complex sentence structures</li>
+                <li>Avoid contractions</li>
+                <li>Precise vocabulary</li>
+                <li>Passive constructions</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-edit"></i> Practice</h2>
+        <div class="question">
+            <div class="question-header">WAEC Example</div>
+            <p>"Write a letter to the editor about environmental pollution"</p>
+        </div>
+        <div class="question">
+            <div class="question-header">NECO Format</div>
+            <p>"Apply for a teaching position at a secondary school"</p>
+        </div>
+    </div>
+</div>
+""",
+}
+
+FALLBACK = """
+<div class="lesson-container">
+    <h1 class="lesson-title">{topic} - English ({exam})</h1>
+    <div class="lesson-content">
+        <p>Comprehensive English notes for {topic} are currently being developed.</p>
+        <p>Please check back soon or select another English topic.</p>
+    </div>
+</div>
+"""
+
+# Syllabus names covered by an authored English lesson
+ALIASES = {
+    "Comprehension": "Reading comprehension",
+    "Summary": "Summary writing"
+}
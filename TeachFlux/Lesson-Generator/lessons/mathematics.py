@@ -0,0 +1,771 @@
+# Mathematics lesson notes
+# Imported on first use through lessons.get_registry
+
+NOTES = {
+    "Number bases": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Number Bases - Complete Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-calculator"></i> Base Systems</h2>
+        <p>Number bases represent numbers using different radix values:</p>
+        
+        <table class="concept-table">
+            <thead>
+                <tr>
+                    <th>Base</th>
+                    <th>Name</th>
+                    <th>Digits</th>
+                    <th>Example</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>2</td>
+                    <td>Binary</td>
+                    <td>0-1</td>
+                    <td>101₁₂ = 5₁₀</td>
+                </tr>
+                <tr>
+                    <td>8</td>
+                    <td>Octal</td>
+                    <td>0-7</td>
+                    <td>12₈ = 10₁₀</td>
+                </tr>
+                <tr>
+                    <td>10</td>
+                    <td>Decimal</td>
+                    <td>0-9</td>
+                    <td>15₁₀</td>
+                </tr>
+                <tr>
+                    <td>16</td>
+                    <td>Hexadecimal</td>
+                    <td>0-F</td>
+                    <td>1F₁₆ = 31₁₀</td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <div class="concept-box">
+            <h3>Conversion Methods</h3>
+            <ol class="concept-list">
+                <li><strong>Other base → Decimal</strong>: Expand using place values
+                    <div class="example">101₁₂ = 1×2² + 0×2¹ + 1×2⁰ = 5₁₀</div>
+                </li>
+                <li><strong>Decimal → Other base</strong>: Division-remainder method
+                    <div class="example">25 ÷ 2 = 12 R1 → 11001₂</div>
+                </li>
+                <li><strong>Between non-decimal bases</strong>: Use decimal as intermediate</li>
+            </ol>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-plus-circle"></i> Operations in Different Bases</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Addition</h3>
+                <p>Same as decimal but with base-specific carrying</p>
+                <div class="math-example">
+                    <p>Binary Example:</p>
+                    <pre>
+  1011₂
++ 1101₂
+--------
+ 11000₂
+                    </pre>
+                </div>
+            </div>
+            <div class="column">
+                <h3>Subtraction</h3>
+                <p>Borrowing based on the base value</p>
+                <div class="math-example">
+                    <p>Hexadecimal Example:</p>
+                    <pre>
+  1A5₁₆
+-  F7₁₆
+--------
+   AE₁₆
+                    </pre>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="exam-focus">
+        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
+        <ul class="focus-list">
+            <li>Converting between bases (especially binary ↔ decimal ↔ hexadecimal)</li>
+            <li>Solving equations in different bases</li>
+            <li>Performing arithmetic operations in non-decimal bases</li>
+            <li>Applications in computing and digital systems</li>
+        </ul>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>Convert 37₁₀ to base 5</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">122₅</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (6 marks)</div>
+            <p>Explain how to perform multiplication in base 8 with examples</p>
+        </div>
+    </div>
+</div>
+""",
+    "Algebra": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Algebra Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-superscript"></i> Polynomial Operations</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Addition/Subtraction</h3>
+                <p>Combine like terms</p>
+                <div class="math-example">
+                    <p>(3x² + 2x - 5) + (x² - 4x + 7) = 4x² - 2x + 2</p>
+                </div>
+            </div>
+            <div class="column">
+                <h3>Multiplication</h3>
+                <p>Use distributive property</p>
+                <div class="math-example">
+                    <p>(x + 3)(2x - 5) = 2x² - 5x + 6x - 15 = 2x² + x - 15</p>
+                </div>
+            </div>
+        </div>
+        
+        <div class="concept-box">
+            <h3>Factorization Techniques</h3>
+            <ul class="concept-list">
+                <li><strong>Common factor</strong>: 6x² + 9x = 3x(2x + 3)</li>
+                <li><strong>Difference of squares</strong>: a² - b² = (a+b)(a-b)</li>
+                <li><strong>Quadratic trinomials</strong>: x² + 5x + 6 = (x+2)(x+3)</li>
+                <li><strong>Grouping method</strong>: ax + ay + bx + by = a(x+y) + b(x+y) = (a+b)(x+y)</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-equals"></i> Equations and Inequalities</h2>
+        <div class="formula-highlight">
+            <h3>Quadratic Formula</h3>
+            <p class="formula">x = <div class="fraction"><span>-b ± √(b² - 4ac)</span><span>2a</span></div></p>
+        </div>
+        
+        <div class="columns">
+            <div class="column">
+                <h3>Linear Equations</h3>
+                <p>Solve for x: 3(x + 5) = 2x - 7</p>
+                <div class="step-by-step">
+                    <p>3x + 15 = 2x - 7</p>
+                    <p>3x - 2x = -7 - 15</p>
+                    <p>x = -22</p>
+                </div>
+            </div>
+            <div class="column">
+                <h3>Inequalities</h3>
+                <p>Solve: 2x - 5 < 7</p>
+                <div class="step-by-step">
+                    <p>2x < 12</p>
+                    <p>x < 6</p>
+                </div>
+                <p class="note">Remember to reverse inequality when multiplying/dividing by negative</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023</div>
+            <p>Factorize completely: 2x³ - 8x² - 10x</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">2x(x² - 4x - 5) = 2x(x - 5)(x + 1)</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Solve the quadratic equation 2x² - 5x - 3 = 0 using three different methods</p>
+        </div>
+    </div>
+</div>
+""",
+    "Geometry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Geometry Complete Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-shapes"></i> Plane Geometry</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Circle Theorems</h3>
+                <div class="theorem-box">
+                    <div class="theorem-diagram">[Diagram]</div>
+                    <p><strong>Theorem 1:</strong> Angle at center = 2 × angle at circumference</p>
+                </div>
+                <div class="theorem-box">
+                    <div class="theorem-diagram">[Diagram]</div>
+                    <p><strong>Theorem 2:</strong> Angles in same segment are equal</p>
+                </div>
+            </div>
+            <div class="column">
+                <h3>Triangle Properties</h3>
+                <ul class="concept-list">
+                    <li><strong>Area</strong>: ½ × base × height</li>
+                    <li><strong>Pythagoras</strong>: a² + b² = c² (right triangles)</li>
+                    <li><strong>Similarity</strong>: AA, SAS, SSS conditions</li>
+                    <li><strong>Congruency</strong>: SSS, SAS, ASA, RHS</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-cube"></i> Solid Geometry</h2>
+        <table class="solid-geometry-table">
+            <thead>
+                <tr>
+                    <th>Shape</th>
+                    <th>Volume</th>
+                    <th>Surface Area</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Cube</td>
+                    <td>V = s³</td>
+                    <td>SA = 6s²</td>
+                </tr>
+                <tr>
+                    <td>Cylinder</td>
+                    <td>V = πr²h</td>
+                    <td>SA = 2πr² + 2πrh</td>
+                </tr>
+                <tr>
+                    <td>Sphere</td>
+                    <td>V = ⁴⁄₃πr³</td>
+                    <td>SA = 4πr²</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="exam-focus">
+        <h2><i class="fas fa-bullseye"></i> {exam} Focus Areas</h2>
+        <ul class="focus-list">
+            <li>Circle theorem proofs and applications</li>
+            <li>3D geometry problems involving volume and surface area</li>
+            <li>Geometric constructions with compass and straightedge</li>
+            <li>Coordinate geometry problems</li>
+        </ul>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>Calculate the volume of a cone with radius 7cm and height 12cm</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">V = ⅓πr²h = ⅓ × ²²⁄₇ × 7² × 12 = 616cm³</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Prove that the angle in a semicircle is a right angle and state two applications of this theorem</p>
+        </div>
+    </div>
+</div>
+""",
+    "Trigonometry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Trigonometry Compendium ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-project-diagram"></i> Fundamental Concepts</h2>
+        <div class="trig-ratios">
+            <div class="ratio-box">
+                <h3>sinθ = <div class="fraction"><span>opposite</span><span>hypotenuse</span></div></h3>
+            </div>
+            <div class="ratio-box">
+                <h3>cosθ = <div class="fraction"><span>adjacent</span><span>hypotenuse</span></div></h3>
+            </div>
+            <div class="ratio-box">
+                <h3>tanθ = <div class="fraction"><span>opposite</span><span>adjacent</span></div></h3>
+            </div>
+        </div>
+        
+        <div class="identity-box">
+            <h3>Pythagorean Identities</h3>
+            <ol class="concept-list">
+                <li>sin²θ + cos²θ = 1</li>
+                <li>1 + tan²θ = sec²θ</li>
+                <li>1 + cot²θ = cosec²θ</li>
+            </ol>
+        </div>
+        
+        <table class="special-angles">
+            <thead>
+                <tr>
+                    <th>θ</th>
+                    <th>sinθ</th>
+                    <th>cosθ</th>
+                    <th>tanθ</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>0°</td>
+                    <td>0</td>
+                    <td>1</td>
+                    <td>0</td>
+                </tr>
+                <tr>
+                    <td>30°</td>
+                    <td>½</td>
+                    <td>√3/2</td>
+                    <td>√3/3</td>
+                </tr>
+                <tr>
+                    <td>45°</td>
+                    <td>√2/2</td>
+                    <td>√2/2</td>
+                    <td>1</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-ruler-combined"></i> Applications</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Solving Triangles</h3>
+                <p><strong>Sine Rule:</strong> <div class="fraction"><span>a</span><span>sinA</span></div> = <div class="fraction"><span>b</span><span>sinB</span></div> = <div class="fraction"><span>c</span><span>sinC</span></div></p>
+                <p><strong>Cosine Rule:</strong> a² = b² + c² - 2bc cosA</p>
+            </div>
+            <div class="column">
+                <h3>Real-world Problems</h3>
+                <ul class="concept-list">
+                    <li>Height of buildings (angle of elevation)</li>
+                    <li>Navigation problems (bearings)</li>
+                    <li>Waveform analysis</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023</div>
+            <p>If sinθ = 3/5, find tanθ</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">tanθ = sinθ/cosθ = (3/5)/(4/5) = 3/4</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Solve the equation 2cos²x - 3cosx + 1 = 0 for 0° ≤ x ≤ 360°</p>
+        </div>
+    </div>
+</div>
+""",
+    "Calculus": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Calculus Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-function"></i> Differentiation</h2>
+        <table class="rules-table">
+            <thead>
+                <tr>
+                    <th>Function</th>
+                    <th>Derivative</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>xⁿ</td>
+                    <td>nxⁿ⁻¹</td>
+                </tr>
+                <tr>
+                    <td>sinx</td>
+                    <td>cosx</td>
+                </tr>
+                <tr>
+                    <td>eˣ</td>
+                    <td>eˣ</td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <div class="columns">
+            <div class="column">
+                <h3>Applications</h3>
+                <ul class="concept-list">
+                    <li>Tangent/normal equations</li>
+                    <li>Maxima/minima problems</li>
+                    <li>Rates of change</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Example</h3>
+                <p>Find the derivative of y = (2x + 1)³</p>
+                <div class="step-by-step">
+                    <p>Let u = 2x + 1 ⇒ y = u³</p>
+                    <p>dy/du = 3u², du/dx = 2</p>
+                    <p>dy/dx = dy/du × du/dx = 3(2x+1)² × 2 = 6(2x+1)²</p>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-integral"></i> Integration</h2>
+        <table class="rules-table">
+            <thead>
+                <tr>
+                    <th>Function</th>
+                    <th>Integral</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>xⁿ (n≠-1)</td>
+                    <td>xⁿ⁺¹/(n+1) + C</td>
+                </tr>
+                <tr>
+                    <td>cosx</td>
+                    <td>sinx + C</td>
+                </tr>
+                <tr>
+                    <td>1/x</td>
+                    <td>ln|x| + C</td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <div class="application-box">
+            <h3>Area Under Curve</h3>
+            <p>∫<sub>a</sub><sup>b</sup> f(x) dx = F(b) - F(a)</p>
+            <div class="example">
+                <p>Find area between y = x² and x-axis from x=0 to x=2</p>
+                <p>∫<sub>0</sub><sup>2</sup> x² dx = [x³/3]<sub>0</sub><sup>2</sup> = 8/3 - 0 = 8/3 units²</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>Find the derivative of y = x² sinx</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Using product rule: dy/dx = 2x sinx + x² cosx</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Find the area bounded by the curve y = x³ - 4x and the x-axis between x=0 and x=2</p>
+        </div>
+    </div>
+</div>
+""",
+    "Statistics": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Statistics Complete Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-chart-bar"></i> Data Analysis</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Measures of Central Tendency</h3>
+                <ul class="concept-list">
+                    <li><strong>Mean</strong>: Σx/n</li>
+                    <li><strong>Median</strong>: Middle value when ordered</li>
+                    <li><strong>Mode</strong>: Most frequent value</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Measures of Dispersion</h3>
+                <ul class="concept-list">
+                    <li><strong>Range</strong>: Max - Min</li>
+                    <li><strong>Variance</strong>: Σ(x - x̄)²/n</li>
+                    <li><strong>Standard Deviation</strong>: √Variance</li>
+                </ul>
+            </div>
+        </div>
+        
+        <div class="example-box">
+            <h3>Example Calculation</h3>
+            <p>Data: 2, 4, 6, 8, 10</p>
+            <p>Mean = (2+4+6+8+10)/5 = 6</p>
+            <p>Standard Deviation = √[(16+4+0+4+16)/5] = √8 ≈ 2.83</p>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-dice"></i> Probability</h2>
+        <div class="probability-box">
+            <h3>Basic Rules</h3>
+            <ul class="concept-list">
+                <li>0 ≤ P(A) ≤ 1</li>
+                <li>P(A') = 1 - P(A)</li>
+                <li>P(A∪B) = P(A) + P(B) - P(A∩B)</li>
+            </ul>
+        </div>
+        
+        <div class="columns">
+            <div class="column">
+                <h3>Binomial Distribution</h3>
+                <p>P(X=r) = <sup>n</sup>C<sub>r</sub> pʳ qⁿ⁻ʳ</p>
+                <p>Where p = success probability, q = 1-p</p>
+            </div>
+            <div class="column">
+                <h3>Normal Distribution</h3>
+                <div class="normal-curve">[Bell curve diagram]</div>
+                <p>68-95-99.7 rule</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023</div>
+            <p>Find the median of: 12, 7, 15, 10, 18, 5, 21</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">Ordered: 5,7,10,12,15,18,21 → Median = 12</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Explain three uses of standard deviation in statistical analysis</p>
+        </div>
+    </div>
+</div>
+""",
+    "Vectors": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Vectors Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-arrow-alt-circle-right"></i> Vector Operations</h2>
+        <div class="vector-representation">
+            <div class="vector-notation">
+                <h3>Notation</h3>
+                <p>a = (x₁, y₁) or xi + yj</p>
+                <p>|a| = √(x² + y²) (magnitude)</p>
+            </div>
+            <div class="vector-diagram">[Vector diagram]</div>
+        </div>
+        
+        <table class="vector-ops-table">
+            <thead>
+                <tr>
+                    <th>Operation</th>
+                    <th>Formula</th>
+                    <th>Example</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Addition</td>
+                    <td>a + b = (x₁+x₂, y₁+y₂)</td>
+                    <td>(2,3) + (1,-1) = (3,2)</td>
+                </tr>
+                <tr>
+                    <td>Scalar Multiplication</td>
+                    <td>ka = (kx, ky)</td>
+                    <td>3(1,2) = (3,6)</td>
+                </tr>
+                <tr>
+                    <td>Dot Product</td>
+                    <td>a·b = |a||b|cosθ = x₁x₂ + y₁y₂</td>
+                    <td>(1,2)·(3,4) = 1×3 + 2×4 = 11</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-location-arrow"></i> Applications</h2>
+        <div class="columns">
+            <div class="column">
+                <h3>Physics Applications</h3>
+                <ul class="concept-list">
+                    <li>Force resolution</li>
+                    <li>Relative velocity</li>
+                    <li>Displacement problems</li>
+                </ul>
+            </div>
+            <div class="column">
+                <h3>Geometry Proofs</h3>
+                <ul class="concept-list">
+                    <li>Proving parallel lines</li>
+                    <li>Collinearity proofs</li>
+                    <li>Geometric theorems</li>
+                </ul>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>If a = 2i + 3j and b = 5i - j, find a + b</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">(2+5)i + (3-1)j = 7i + 2j</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Prove that the diagonals of a parallelogram bisect each other using vectors</p>
+        </div>
+    </div>
+</div>
+""",
+    "Coordinate geometry": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Coordinate Geometry Masterclass ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-map-marked-alt"></i> Key Concepts</h2>
+        <div class="formula-grid">
+            <div class="formula-card">
+                <h3>Distance Formula</h3>
+                <p>d = √[(x₂ - x₁)² + (y₂ - y₁)²]</p>
+            </div>
+            <div class="formula-card">
+                <h3>Midpoint Formula</h3>
+                <p>M = ((x₁+x₂)/2, (y₁+y₂)/2)</p>
+            </div>
+            <div class="formula-card">
+                <h3>Gradient</h3>
+                <p>m = (y₂ - y₁)/(x₂ - x₁)</p>
+            </div>
+        </div>
+        
+        <div class="line-equations">
+            <h3>Line Equation Forms</h3>
+            <ul class="concept-list">
+                <li><strong>Point-slope</strong>: y - y₁ = m(x - x₁)</li>
+                <li><strong>General form</strong>: ax + by + c = 0</li>
+                <li><strong>Two-point form</strong>: (y-y₁)/(y₂-y₁) = (x-x₁)/(x₂-x₁)</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-shapes"></i> Conic Sections</h2>
+        <div class="conic-sections">
+            <div class="conic-card">
+                <h3>Circle</h3>
+                <p>(x - h)² + (y - k)² = r²</p>
+                <div class="conic-diagram">[Circle diagram]</div>
+            </div>
+            <div class="conic-card">
+                <h3>Parabola</h3>
+                <p>y² = 4ax</p>
+                <div class="conic-diagram">[Parabola diagram]</div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">NECO 2023</div>
+            <p>Find the distance between (1,2) and (4,6)</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">√[(4-1)² + (6-2)²] = √(9 + 16) = 5 units</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (8 marks)</div>
+            <p>Find the equation of the perpendicular bisector of the line joining (2,3) and (4,7)</p>
+        </div>
+    </div>
+</div>
+""",
+    "Financial mathematics": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Financial Mathematics Guide ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-coins"></i> Interest Calculations</h2>
+        <div class="interest-types">
+            <div class="interest-card">
+                <h3>Simple Interest</h3>
+                <p>I = PRT/100</p>
+                <p>A = P(1 + RT/100)</p>
+                <div class="example">
+                    <p>₦5000 at 8% for 3 years:</p>
+                    <p>I = (5000×8×3)/100 = ₦1200</p>
+                </div>
+            </div>
+            <div class="interest-card">
+                <h3>Compound Interest</h3>
+                <p>A = P(1 + r/n)<sup>nt</sup></p>
+                <div class="example">
+                    <p>₦5000 at 8% compounded quarterly for 3 years:</p>
+                    <p>A = 5000(1 + 0.08/4)<sup>12</sup> ≈ ₦6341</p>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-chart-line"></i> Annuities and Amortization</h2>
+        <div class="formula-box">
+            <h3>Future Value of Annuity</h3>
+            <p>FV = PMT[((1 + r)ⁿ - 1)/r]</p>
+        </div>
+        <div class="formula-box">
+            <h3>Present Value</h3>
+            <p>PV = FV/(1 + r)ⁿ</p>
+        </div>
+        
+        <div class="example-box">
+            <h3>Loan Repayment Example</h3>
+            <p>₦1,000,000 loan at 12% for 5 years:</p>
+            <p>Monthly payment = ₦22,244</p>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-pencil-alt"></i> Practice Questions</h2>
+        <div class="question">
+            <div class="question-header">JAMB 2024</div>
+            <p>Calculate the simple interest on ₦8000 at 5% for 4 years</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">I = (8000×5×4)/100 = ₦1600</div>
+        </div>
+        <div class="question">
+            <div class="question-header">WAEC Essay (10 marks)</div>
+            <p>Compare simple and compound interest with examples and explain which is better for investments</p>
+        </div>
+    </div>
+</div>
+""",
+}
+
+FALLBACK = """
+<div class="lesson-container">
+    <h1 class="lesson-title">{topic} - Mathematics ({exam})</h1>
+    <div class="lesson-content">
+        <p>Detailed lesson notes for {topic} are currently being developed.</p>
+        <p>Please check back later or try another topic.</p>
+    </div>
+</div>
+"""
+
+# Syllabus names covered by an authored mathematics lesson
+ALIASES = {
+    "Algebraic expressions": "Algebra",
+    "Geometry theorems": "Geometry",
+    "Trigonometric identities": "Trigonometry",
+    "Differentiation": "Calculus",
+    "Integration": "Calculus"
+}
@@ -0,0 +1,343 @@
+# Physics lesson notes
+# Imported on first use through lessons.get_registry
+
+NOTES = {
+    "Measurements and units": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Measurements and Units ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-ruler"></i> Fundamental Quantities</h2>
+        <table class="units-table">
+            <thead>
+                <tr>
+                    <th>Quantity</th>
+                    <th>SI Unit</th>
+                    <th>Symbol</th>
+                    <th>Measuring Instrument</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Length</td>
+                    <td>meter</td>
+                    <td>m</td>
+                    <td>Ruler, micrometer</td>
+                </tr>
+                <tr>
+                    <td>Time</td>
+                    <td>second</td>
+                    <td>s</td>
+                    <td>Stopwatch</td>
+                </tr>
+                <tr>
+                    <td>Current</td>
+                    <td>ampere</td>
+                    <td>A</td>
+                    <td>Ammeter</td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <div class="concept-box">
+            <h3>Derived Quantities</h3>
+            <ul class="derived-units">
+                <li><strong>Velocity</strong>: m/s (meters per second)</li>
+                <li><strong>Force</strong>: N (newton) = kg·m/s²</li>
+                <li><strong>Energy</strong>: J (joule) = N·m</li>
+            </ul>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-balance-scale"></i> Measurement Tools</h2>
+        <div class="instrument-cards">
+            <div class="instrument-card">
+                <h3>Vernier Calipers</h3>
+                <p>Measures small lengths (0.1mm precision)</p>
+                <div class="reading-example">
+                    <p>Main scale: 1.2 cm</p>
+                    <p>Vernier scale: 0.05 cm</p>
+                    <p class="result">Total: 1.25 cm</p>
+                </div>
+            </div>
+            <div class="instrument-card">
+                <h3>Micrometer Screw Gauge</h3>
+                <p>Measures very small lengths (0.01mm precision)</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="practice-section">
+        <h2><i class="fas fa-question-circle"></i> Practice Questions</h2>
+        <div class="question">
+            <p><strong>WAEC 2023:</strong> Convert 72 km/h to m/s</p>
+            <button class="show-answer">Show Answer</button>
+            <div class="answer">20 m/s (72 × 1000/3600)</div>
+        </div>
+    </div>
+</div>
+""",
+    "Motion": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Motion and Mechanics ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-running"></i> Kinematic Equations</h2>
+        <div class="formula-grid">
+            <div class="formula-card">
+                <p class="formula">v = u + at</p>
+                <p>Final velocity</p>
+            </div>
+            <div class="formula-card">
+                <p class="formula">s = ut + ½at²</p>
+                <p>Displacement</p>
+            </div>
+        </div>
+        
+        <div class="example-problem">
+            <h3>Sample Problem</h3>
+            <p>A car accelerates from rest at 3 m/s² for 5 seconds. Calculate its final velocity.</p>
+            <div class="solution-steps">
+                <p>Given: u = 0, a = 3 m/s², t = 5 s</p>
+                <p>Using v = u + at</p>
+                <p>v = 0 + (3 × 5) = 15 m/s</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-project-diagram"></i> Projectile Motion</h2>
+        <div class="projectile-diagram">
+            <!-- Diagram would be inserted here -->
+            <p class="diagram-caption">Projectile trajectory showing maximum height and range</p>
+        </div>
+        
+        <div class="formula-box">
+            <h3>Key Equations</h3>
+            <ul>
+                <li>Time of flight: <span class="formula">t = (2u sinθ)/g</span></li>
+                <li>Maximum height: <span class="formula">H = (u² sin²θ)/2g</span></li>
+                <li>Range: <span class="formula">R = (u² sin2θ)/g</span></li>
+            </ul>
+        </div>
+    </div>
+</div>
+""",
+    "Forces": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Forces and Dynamics ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-weight-hanging"></i> Newton's Laws</h2>
+        <div class="law-cards">
+            <div class="law-card">
+                <h3>First Law (Inertia)</h3>
+                <p>An object remains at rest or in uniform motion unless acted upon by a net force</p>
+            </div>
+            <div class="law-card">
+                <h3>Second Law (F=ma)</h3>
+                <p>Force equals mass times acceleration</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-bolt"></i> Types of Forces</h2>
+        <table class="forces-table">
+            <tr>
+                <th>Force Type</th>
+                <th>Description</th>
+                <th>Example</th>
+            </tr>
+            <tr>
+                <td>Gravitational</td>
+                <td>Attraction between masses</td>
+                <td>Weight of objects</td>
+            </tr>
+            <tr>
+                <td>Frictional</td>
+                <td>Opposes motion</td>
+                <td>Sliding a book</td>
+            </tr>
+        </table>
+    </div>
+</div>
+""",
+    "Energy": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Work, Energy and Power ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-battery-three-quarters"></i> Energy Forms</h2>
+        <div class="energy-types">
+            <div class="energy-card kinetic">
+                <h3>Kinetic Energy</h3>
+                <p class="formula">KE = ½mv²</p>
+            </div>
+            <div class="energy-card potential">
+                <h3>Potential Energy</h3>
+                <p class="formula">PE = mgh</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-tachometer-alt"></i> Power Calculations</h2>
+        <p class="formula">Power = Work/Time = Energy/Time</p>
+        <div class="example-problem">
+            <p>A 60kg student climbs 3m in 5 seconds. Calculate power output.</p>
+            <div class="solution-steps">
+                <p>Work = mgh = 60 × 10 × 3 = 1800J</p>
+                <p>Power = 1800J/5s = 360W</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Waves": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Waves and Optics ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-water"></i> Wave Properties</h2>
+        <div class="wave-diagram">
+            <!-- Wave diagram would go here -->
+            <p class="diagram-label">Amplitude (A), Wavelength (λ), Frequency (f)</p>
+        </div>
+        
+        <div class="formula-box">
+            <h3>Wave Equation</h3>
+            <p class="formula">v = fλ</p>
+            <p>Where: v = velocity, f = frequency, λ = wavelength</p>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-lightbulb"></i> Light Waves</h2>
+        <div class="light-spectrum">
+            <div class="spectrum-color" style="background-color: #ff0000;">Red (700nm)</div>
+            <div class="spectrum-color" style="background-color: #0000ff;">Violet (400nm)</div>
+        </div>
+    </div>
+</div>
+""",
+    "Electricity": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Electricity and Circuits ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-bolt"></i> Ohm's Law</h2>
+        <div class="formula-highlight">
+            <p class="formula">V = IR</p>
+            <p>Where: V = voltage, I = current, R = resistance</p>
+        </div>
+        
+        <div class="circuit-diagram">
+            <!-- Circuit diagram would go here -->
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-sitemap"></i> Circuit Types</h2>
+        <div class="circuit-comparison">
+            <div class="circuit-type">
+                <h3>Series</h3>
+                <p>Same current through all components</p>
+                <p class="formula">R<sub>total</sub> = R<sub>1</sub> + R<sub>2</sub> + ...</p>
+            </div>
+            <div class="circuit-type">
+                <h3>Parallel</h3>
+                <p>Same voltage across all components</p>
+                <p class="formula">1/R<sub>total</sub> = 1/R<sub>1</sub> + 1/R<sub>2</sub> + ...</p>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "Magnetism": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Magnetism and Electromagnetism ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-magnet"></i> Magnetic Fields</h2>
+        <div class="magnetic-field-diagram">
+            <!-- Field line diagram would go here -->
+        </div>
+        
+        <div class="concept-box">
+            <h3>Right-Hand Rules</h3>
+            <ol>
+                <li>Grip rule for solenoid field direction</li>
+                <li>Fleming's rules for motors/generators</li>
+            </ol>
+        </div>
+    </div>
+</div>
+""",
+    "Modern Physics": """
+<div class="lesson-container">
+    <h1 class="lesson-title">Modern Physics ({exam})</h1>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-atom"></i> Quantum Physics</h2>
+        <div class="quantum-concepts">
+            <div class="concept-card">
+                <h3>Photoelectric Effect</h3>
+                <p class="formula">E = hf</p>
+                <p>Where h = Planck's constant</p>
+            </div>
+            <div class="concept-card">
+                <h3>Wave-Particle Duality</h3>
+                <p>Light exhibits both wave and particle properties</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="lesson-section">
+        <h2><i class="fas fa-radiation"></i> Nuclear Physics</h2>
+        <table class="radiation-table">
+            <tr>
+                <th>Radiation Type</th>
+                <th>Symbol</th>
+                <th>Penetration</th>
+            </tr>
+            <tr>
+                <td>Alpha</td>
+                <td>α</td>
+                <td>Low (paper stops it)</td>
+            </tr>
+            <tr>
+                <td>Beta</td>
+                <td>β</td>
+                <td>Medium (aluminum stops it)</td>
+            </tr>
+        </table>
+    </div>
+</div>
+""",
+}
+
+FALLBACK = """
+<div class="lesson-container">
+    <h1 class="lesson-title">{topic} - Physics ({exam})</h1>
+    <div class="lesson-content">
+        <p>Comprehensive lesson notes for {topic} are currently being developed.</p>
+        <p>Please check back soon or select another physics topic.</p>
+    </div>
+</div>
+"""
+
+# Syllabus names covered by an authored physics lesson
+ALIASES = {
+    "Measurement": "Measurements and units",
+    "Physical quantities and units": "Measurements and units",
+    "Kinematics": "Motion",
+    "Dynamics": "Forces",
+    "Work, energy, and power": "Energy",
+    "Force and energy": "Energy",
+    "Waves and sound": "Waves",
+    "Light and optics": "Waves",
+    "Optics": "Waves",
+    "Atomic and nuclear physics": "Modern Physics"
+}
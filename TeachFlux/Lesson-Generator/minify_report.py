@@ -0,0 +1,64 @@
+# Byte savings of lesson minification
+# Run with: python minify_report.py [--quiet]
+#
+# Renders every syllabus lesson from the authored and from the minified
+# templates and prints both sizes, plain and gzipped, per lesson and for
+# the whole corpus. Padding added by padding_parts is left out, it is
+# not template markup.
+
+import argparse
+import gzip
+import importlib
+
+from lesson_registry import LessonRegistry
+from lessons import SUBJECT_MODULES
+from syllabus_db import syllabus_db
+
+
+def registries(minify):
+    registries = {}
+    for subject, module_name in SUBJECT_MODULES.items():
+        module = importlib.import_module(module_name)
+        registries[subject] = LessonRegistry(module.NOTES, module.FALLBACK, module.ALIASES, minify=minify)
+    return registries
+
+
+def sizes(note):
+    body = note.encode('utf-8')
+    return len(body), len(gzip.compress(body, compresslevel=9, mtime=0))
+
+
+def saving(before, after):
+    return f"{(before - after) / before:>6.1%}" if before else f"{'-':>6}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the bytes saved by minifying lessons")
+    parser.add_argument('--quiet', action='store_true', help="only print the corpus totals")
+    args = parser.parse_args()
+
+    authored, minified = registries(False), registries(True)
+    totals = [0, 0, 0, 0]
+    if not args.quiet:
+        print(f"{'lesson':<58} {'bytes':>7} {'min':>7} {'saved':>6} {'gzip':>6} {'min':>6} {'saved':>6}")
+    for exam, subjects in syllabus_db.items():
+        for subject, topics in subjects.items():
+            if subject not in SUBJECT_MODULES:
+                continue
+            for topic in topics:
+                raw, raw_gzip = sizes(authored[subject].render(exam, topic))
+                small, small_gzip = sizes(minified[subject].render(exam, topic))
+                for index, value in enumerate((raw, small, raw_gzip, small_gzip)):
+                    totals[index] += value
+                if not args.quiet:
+                    name = f"{exam} / {subject} / {topic}"[:58]
+                    print(f"{name:<58} {raw:>7} {small:>7} {saving(raw, small)} "
+                          f"{raw_gzip:>6} {small_gzip:>6} {saving(raw_gzip, small_gzip)}")
+
+    raw, small, raw_gzip, small_gzip = totals
+    print(f"Corpus: {raw} -> {small} bytes ({saving(raw, small).strip()} saved), "
+          f"gzipped {raw_gzip} -> {small_gzip} bytes ({saving(raw_gzip, small_gzip).strip()} saved)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# Background pollers
+# A function run every interval seconds on a daemon thread of its own, so
+# the requests of a worker never wait for the reload it triggers.
+
+import logging
+import os
+import threading
+import time
+
+
+class Poller:
+    """Calls function() every interval seconds from one thread per process"""
+
+    def __init__(self, function, interval, name='poller', logger=None):
+        self.function = function
+        self.interval = interval
+        self.name = name
+        self.logger = logger or logging.getLogger(__name__)
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start polling in this process, cheap enough to call on every request"""
+        pid = os.getpid()
+        if self._pid == pid or self.interval <= 0:
+            return
+        with self._lock:
+            # Threads do not survive a fork, so each worker starts its own
+            if self._pid != pid:
+                self._pid = pid
+                threading.Thread(target=self._run, name=self.name, daemon=True).start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.function()
+            except Exception:
+                self.logger.exception(f"{self.name} failed, will retry in {self.interval:g} s")
@@ -0,0 +1,131 @@
+# Full-text lesson search
+# An in-memory inverted index over the tag-stripped text of every rendered
+# lesson, ranked with BM25. Lessons are added, replaced or removed one at a
+# time, so an edited lesson never forces a full rebuild.
+
+import html
+import math
+import re
+import threading
+from collections import Counter
+
+
+_TERM_RE = re.compile(r"[^\W_]+")
+
+# Too common in lessons and questions to say anything about relevance
+STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how in is it its of on or s the
+this to what when where which who why with
+""".split())
+
+# Words of context on each side of the best match in a snippet
+SNIPPET_WORDS = 12
+
+
+def terms(text):
+    """Searchable terms of plain text with their (start, end) offsets"""
+    for match in _TERM_RE.finditer(text):
+        term = match.group().casefold()
+        if term not in STOPWORDS:
+            yield term, match.start(), match.end()
+
+
+class SearchIndex:
+    """BM25-ranked inverted index of documents keyed by any hashable key"""
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings = {}
+        self._docs = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        return key in self._docs
+
+    def update(self, key, text):
+        """Index or re-index one document's plain text"""
+        found = list(terms(text))
+        frequencies = Counter(term for term, _, _ in found)
+        with self._lock:
+            self._remove(key)
+            for term, frequency in frequencies.items():
+                self._postings.setdefault(term, {})[key] = frequency
+            self._docs[key] = (text, found)
+            self._total_length += len(found)
+
+    def remove(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        text, found = doc
+        for term in {term for term, _, _ in found}:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= len(found)
+
+    def search(self, query, limit=10):
+        """(total matches, [(key, score, snippet_html), ...]) best first"""
+        query_terms = list(dict.fromkeys(term for term, _, _ in terms(query)))
+        with self._lock:
+            if not query_terms or not self._docs:
+                return 0, []
+            count = len(self._docs)
+            average_length = self._total_length / count
+            scores = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    length = len(self._docs[key][1])
+                    norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                    scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+            results = [(key, score, self._snippet(key, set(query_terms))) for key, score in ranked]
+        return len(scores), results
+
+    def _snippet(self, key, query_terms):
+        """Window of text around the densest cluster of query terms, matches in <mark>"""
+        text, found = self._docs[key]
+        hits = [index for index, (term, _, _) in enumerate(found) if term in query_terms]
+        if not hits:
+            return ''
+        # Slide a window over the hits, centre on the one with the most distinct query terms
+        best, best_terms = hits[0], 0
+        window, low = Counter(), 0
+        for hit in hits:
+            window[found[hit][0]] += 1
+            while hit - hits[low] > 2 * SNIPPET_WORDS:
+                term = found[hits[low]][0]
+                window[term] -= 1
+                if not window[term]:
+                    del window[term]
+                low += 1
+            if len(window) > best_terms:
+                best, best_terms = (hits[low] + hit) // 2, len(window)
+        first = max(best - SNIPPET_WORDS, 0)
+        last = min(best + SNIPPET_WORDS, len(found) - 1)
+        start, end = found[first][1], found[last][2]
+
+        parts, position = [], start
+        for term, term_start, term_end in found[first:last + 1]:
+            if term in query_terms:
+                parts.append(html.escape(text[position:term_start], quote=False))
+                parts.append('<mark>' + html.escape(text[term_start:term_end], quote=False) + '</mark>')
+                position = term_end
+        parts.append(html.escape(text[position:end], quote=False))
+        prefix = '... ' if start > 0 else ''
+        suffix = ' ...' if end < len(text) else ''
+        return prefix + ''.join(parts) + suffix
@@ -1,111 +1,106 @@
 # Syllabus database based on JAMB, WAEC and NECO requirements
 # Sources: :cite[1]:cite[2]:cite[4]
+# Topics live in syllabus.json (or SYLLABUS_FILE) so they can be edited
+# without a deploy, running workers reload it when the file changes.
 
-syllabus_db = {
-    "JAMB": {
-        "Mathematics": [
-            "Number bases", "Fractions, decimals, and approximations", 
-            "Indices and logarithms", "Sets", "Polynomials", 
-            "Variation", "Inequalities", "Progression", 
-            "Binary operations", "Matrices and determinants",
-            "Coordinate geometry", "Differentiation", "Integration"
-        ],
-        "English": [
-            "Synonyms and antonyms", "Sentence interpretation",
-            "Reading comprehension", "Lexis and structure",
-            "Summary writing", "Essay writing", 
-            "Oral English", "Grammatical accuracy"
-        ],
-        "Physics": [
-            "Measurements and units", "Motion", "Forces", 
-            "Work, energy, and power", "Waves", 
-            "Electricity and magnetism", "Modern physics",
-            "Thermodynamics", "Optics", "Fluid mechanics"
-        ],
-        "Chemistry": [
-            "Atomic structure", "Chemical bonding", 
-            "Stoichiometry", "States of matter", 
-            "Energy changes", "Acids, bases and salts",
-            "Redox reactions", "Organic chemistry",
-            "Environmental chemistry", "Industrial chemistry"
-        ],
-        "Biology": [
-            "Cell biology", "Genetics", 
-            "Ecology", "Evolution", 
-            "Plant and animal physiology", 
-            "Reproduction", "Classification",
-            "Health and diseases", "Biotechnology"
-        ]
-    },
-    "WAEC": {
-        "Mathematics": [
-            "Algebra", "Geometry", "Trigonometry", 
-            "Calculus", "Statistics", 
-            "Vectors", "Coordinate geometry", 
-            "Probability", "Logic", "Financial mathematics"
-        ],
-        "English": [
-            "Comprehension", "Summary", 
-            "Lexis and structure", "Oral English",
-            "Essay writing", "Literature analysis",
-            "Report writing", "Formal letter writing"
-        ],
-        "Physics": [
-            "Physical quantities and units", "Kinematics", 
-            "Dynamics", "Heat and thermodynamics", 
-            "Light and optics", "Electricity", 
-            "Magnetism", "Atomic and nuclear physics",
-            "Waves and sound", "Modern physics"
-        ],
-        "Chemistry": [
-            "Atomic structure", "Periodic table", 
-            "Chemical reactions", "Stoichiometry", 
-            "States of matter", "Chemical energetics",
-            "Acids, bases and salts", "Organic chemistry", 
-            "Environmental pollution", "Chemistry in industry"
-        ],
-        "Biology": [
-            "Classification of organisms", "Cell structure", 
-            "Photosynthesis", "Respiration", 
-            "Reproduction", "Genetics", 
-            "Ecology", "Evolution", 
-            "Human health", "Plant and animal nutrition"
-        ]
-    },
-    "NECO": {
-        "Mathematics": [
-            "Algebraic expressions", "Quadratic equations", 
-            "Geometry theorems", "Trigonometric identities", 
-            "Calculus", "Statistics", 
-            "Probability", "Vectors", 
-            "Matrices", "Logic"
-        ],
-        "English": [
-            "Reading comprehension", "Summary writing", 
-            "Vocabulary development", "Oral English", 
-            "Essay writing", "Grammar", 
-            "Punctuation", "Literary devices"
-        ],
-        "Physics": [
-            "Measurement", "Motion", 
-            "Force and energy", "Waves", 
-            "Electricity", "Magnetism", 
-            "Thermal physics", "Modern physics", 
-            "Astrophysics", "Solid state physics"
-        ],
-        "Chemistry": [
-            "Atomic structure", "Chemical bonding", 
-            "Stoichiometry", "Redox reactions", 
-            "Chemical kinetics", "Organic chemistry", 
-            "Analytical chemistry", "Industrial chemistry", 
-            "Environmental chemistry", "Nuclear chemistry"
-        ],
-        "Biology": [
-            "Cell biology", "Genetics", 
-            "Ecology", "Evolution", 
-            "Plant and animal physiology", 
-            "Reproduction", "Classification",
-            "Health and diseases", "Biotechnology"
-        ]
-    }
-}
\ No newline at end of file
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+SYLLABUS_FILE = os.environ.get(
+    'SYLLABUS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'syllabus.json'))
+
+
+def syllabus_stamp(path=SYLLABUS_FILE):
+    """(mtime, size) of the syllabus file, None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_syllabus(path=SYLLABUS_FILE):
+    """{exam: {subject: [topic, ...]}} read from a JSON file
+
+    Raises ValueError if the file is not shaped like a syllabus, so a bad
+    edit never replaces a good syllabus.
+    """
+    with open(path, encoding='utf-8') as f:
+        syllabus = json.load(f)
+    if not isinstance(syllabus, dict):
+        raise ValueError("Syllabus must map exam bodies to subjects")
+    for exam, subjects in syllabus.items():
+        if not isinstance(subjects, dict):
+            raise ValueError(f"{exam}: subjects must map to topic lists")
+        for subject, topics in subjects.items():
+            if not isinstance(topics, list) or not all(isinstance(topic, str) and topic for topic in topics):
+                raise ValueError(f"{exam} {subject}: topics must be a list of names")
+    return syllabus
+
+
+class FrozenSyllabus(Mapping):
+    """Read-only syllabus with shared topic strings and constant-time membership
+
+    Behaves like {exam: {subject: (topic, ...)}}. Each distinct topic name is
+    interned, stored once and given an integer id, every (exam, subject)
+    keeps a frozenset of its topic ids, so has_topic() is a couple of hash
+    lookups however long the topic lists get. Subjects with identical topic
+    lists (the same syllabus across exam bodies or years) share one tuple
+    and one frozenset.
+    """
+
+    __slots__ = ('names', 'topic_ids', 'version', '_ids', '_exams', '_members')
+
+    def __init__(self, tree):
+        ids, names, exams, members, shared = {}, [], {}, {}, {}
+        digest = hashlib.sha256()
+        for exam, subjects in tree.items():
+            exam = sys.intern(exam)
+            exams[exam] = {}
+            for subject, topics in subjects.items():
+                subject = sys.intern(subject)
+                ordered = []
+                for topic in topics:
+                    topic_id = ids.get(topic)
+                    if topic_id is None:
+                        topic_id = ids[topic] = len(names)
+                        names.append(sys.intern(topic))
+                    ordered.append(topic_id)
+                    digest.update(f"{exam}\0{subject}\0{topic}\n".encode('utf-8'))
+                ordered = tuple(ordered)
+                if ordered not in shared:
+                    shared[ordered] = (tuple(names[topic_id] for topic_id in ordered), frozenset(ordered))
+                exams[exam][subject], members[(exam, subject)] = shared[ordered]
+        self.names = tuple(names)
+        self.topic_ids = MappingProxyType(ids)
+        self.version = digest.hexdigest()[:16]
+        self._ids = ids
+        self._exams = MappingProxyType({exam: MappingProxyType(subjects) for exam, subjects in exams.items()})
+        self._members = members
+
+    def __getitem__(self, exam):
+        return self._exams[exam]
+
+    def __iter__(self):
+        return iter(self._exams)
+
+    def __len__(self):
+        return len(self._exams)
+
+    def topic_id(self, topic):
+        """Integer id shared by every exam and subject listing this topic, or None"""
+        return self._ids.get(topic)
+
+    def has_topic(self, exam, subject, topic):
+        members = self._members.get((exam, subject))
+        return members is not None and self._ids.get(topic, -1) in members
+
+
+# Stamp first, an edit landing while we read is then picked up by the next poll
+SYLLABUS_STAMP = syllabus_stamp()
+syllabus_db = FrozenSyllabus(load_syllabus())
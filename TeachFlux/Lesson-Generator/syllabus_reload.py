@@ -0,0 +1,58 @@
+# Syllabus hot reload
+# Each worker polls the syllabus file from a background thread, builds the
+# next snapshot there and swaps it in with one assignment, so a request sees
+# either the old syllabus or the new one and never a mix of both.
+
+from collections import namedtuple
+
+from lesson_registry import TopicIndex
+from poller import Poller
+from syllabus_db import FrozenSyllabus, load_syllabus, syllabus_stamp
+from topic_suggest import TopicSuggester
+
+
+# A FrozenSyllabus together with everything derived from it
+Syllabus = namedtuple('Syllabus', ['tree', 'index', 'canonical', 'version', 'suggester'])
+
+
+def build_syllabus(tree, registry_for):
+    """Snapshot of a syllabus tree with its topic index, case-insensitive lookup and autocomplete"""
+    if not isinstance(tree, FrozenSyllabus):
+        tree = FrozenSyllabus(tree)
+    canonical = {
+        (exam.casefold(), subject.casefold(), topic.casefold()): (exam, subject, topic)
+        for exam, subjects in tree.items()
+        for subject, topics in subjects.items()
+        for topic in topics
+    }
+    return Syllabus(tree, TopicIndex(tree, registry_for), canonical, tree.version, TopicSuggester(tree))
+
+
+class SyllabusWatcher(Poller):
+    """Reloads the syllabus file whenever its mtime or size changes
+
+    build(tree) turns a freshly loaded tree into a snapshot and swap(snapshot)
+    installs it, both on the watcher thread. Every process runs its own
+    watcher, so with several gunicorn workers the file itself is the
+    invalidation signal they all pick up within one interval.
+    """
+
+    def __init__(self, path, stamp, build, swap, interval=5.0, logger=None):
+        super().__init__(self.check, interval, name='syllabus-watcher', logger=logger)
+        self.path = path
+        self.stamp = stamp
+        self.build = build
+        self.swap = swap
+        self.reloads = 0
+
+    def check(self):
+        """Reload if the file changed since the last check, returns True on a swap"""
+        stamp = syllabus_stamp(self.path)
+        if stamp is None or stamp == self.stamp:
+            return False
+        # Recorded before loading, a half-written file is retried once its writer finishes
+        self.stamp = stamp
+        snapshot = self.build(load_syllabus(self.path))
+        self.swap(snapshot)
+        self.reloads += 1
+        return True
@@ -0,0 +1,170 @@
+# teachflux-render: pre-render every lesson to static files
+# Run with: python teachflux_render.py site/ [--processes N] [--force]
+#
+# Writes, for every syllabus topic, a minified standalone page and the
+# exact bytes /api/lessons serves (body and compressed variants, from
+# app.render_lesson), each next to its .gz (and .br, when brotli is
+# installed) for nginx's gzip_static / brotli_static:
+#
+#   site/lessons/<exam>/<subject>/<topic>.html
+#   site/api/lessons/<exam>/<subject>/<topic>
+#   site/manifest.json    {"exam/subject/topic": {"hash": ..., "files": [...]}}
+#
+# The JSON files sit at the lesson's /api/lessons path with the names as
+# written, no suffix. nginx matches $uri after percent-decoding, so
+# /api/lessons/JAMB/Chemistry/Atomic%20structure finds
+# site/api/lessons/JAMB/Chemistry/Atomic structure with:
+#
+#   location /api/lessons/ {
+#       root site;
+#       default_type application/json;
+#       gzip_static on;
+#       try_files $uri @app;
+#   }
+#
+# The manifest hash is the lesson's ETag. Re-runs render everything again
+# (it is cheap) but only rewrite lessons whose hash differs from the
+# manifest, and delete files that are no longer written, such as those of
+# topics that left the syllabus.
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+# Rendering needs the registries, not a warm store or a bundle
+os.environ['LESSON_WARM_START'] = 'off'
+os.environ.pop('LESSON_BUNDLE', None)
+
+import app
+from compression import CompressedBody
+from syllabus_db import syllabus_db
+
+
+MANIFEST = 'manifest.json'
+
+PAGE = (
+    '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+    '<meta name="viewport" content="width=device-width, initial-scale=1">'
+    '<title>{title}</title></head><body>{note}</body></html>'
+)
+
+
+def _file_name(name):
+    # Names become path segments, never let one add a directory
+    return name.replace('/', '-').replace(os.sep, '-')
+
+
+def lesson_files(exam, subject, topic):
+    """Relative paths of the page and JSON written for a lesson"""
+    parts = [_file_name(exam), _file_name(subject), _file_name(topic)]
+    return (
+        '/'.join(['lessons'] + parts) + '.html',
+        '/'.join(['api', 'lessons'] + parts),
+    )
+
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def render_key(task):
+    """Render one lesson in a pool process: (key, hash, files) with files None if unchanged"""
+    key, old_hash, output = task
+    exam, subject, topic = key
+    # Packaged exactly as the API does, so the files and /api/lessons agree byte for byte
+    lesson = app.render_lesson(exam, subject, topic)
+    if lesson is None:
+        return key, None, None
+    page_path, json_path = lesson_files(exam, subject, topic)
+    if lesson.etag == old_hash and all(os.path.exists(os.path.join(output, path)) for path in (page_path, json_path)):
+        return key, lesson.etag, None
+
+    files = []
+    # Lesson templates are minified when they are compiled, the note already is
+    page = PAGE.format(title=html.escape(f"{topic} - {exam} {subject}"), note=lesson.note).encode('utf-8')
+    for path, compressed in ((page_path, CompressedBody(page)), (json_path, lesson.payload)):
+        body = compressed.body
+        write_file(os.path.join(output, path), body)
+        files.append(path)
+        for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+            variant = os.path.join(output, path + suffix)
+            if encoding in compressed.variants:
+                write_file(variant, compressed.variants[encoding])
+                files.append(path + suffix)
+            elif os.path.exists(variant):
+                # No longer worth compressing, a stale variant must not be served
+                os.remove(variant)
+    return key, lesson.etag, files
+
+
+def load_manifest(output):
+    try:
+        with open(os.path.join(output, MANIFEST), encoding='utf-8') as f:
+            return json.load(f)['lessons']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render every lesson to static, precompressed files")
+    parser.add_argument('output')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help="render processes (one per CPU)")
+    parser.add_argument('--force', action='store_true', help="rewrite every lesson, even unchanged ones")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    old = {} if args.force else load_manifest(args.output)
+    keys = [
+        (exam, subject, topic)
+        for exam, subjects in syllabus_db.items()
+        for subject, topics in subjects.items()
+        for topic in topics
+    ]
+    tasks = [(key, old.get('/'.join(key), {}).get('hash'), args.output) for key in keys]
+
+    lessons, written, failed = {}, 0, 0
+    with multiprocessing.Pool(args.processes) as pool:
+        for key, digest, files in pool.imap_unordered(render_key, tasks, chunksize=8):
+            name = '/'.join(key)
+            if digest is None:
+                print(f"Skipped {name}: could not be rendered", file=sys.stderr)
+                failed += 1
+                continue
+            if files is None:
+                files = old[name]['files']
+            else:
+                written += 1
+            lessons[name] = {'hash': digest, 'files': files}
+
+    removed = 0
+    for name, entry in old.items():
+        # Whole topics that left the syllabus, and files a lesson no longer has
+        current = set(lessons[name]['files']) if name in lessons else set()
+        for path in set(entry.get('files', [])) - current:
+            try:
+                os.remove(os.path.join(args.output, path))
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+    manifest = {
+        'syllabus_version': syllabus_db.version,
+        'lessons': dict(sorted(lessons.items())),
+    }
+    write_file(os.path.join(args.output, MANIFEST), json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+    seconds = time.perf_counter() - start
+    print(f"{len(lessons)} lessons in {seconds:.2f} s: {written} written, "
+          f"{len(lessons) - written} unchanged, {removed} stale files removed, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# Cross-exam topic equivalence
+# Topics of the same subject in different exam bodies are scored against
+# each other once, from the words of their names and the text of their
+# lessons, so "which WAEC topic is JAMB's Motion?" is a dict lookup.
+
+import math
+from collections import Counter
+
+from lesson_registry import normalize_topic
+from search_index import terms
+
+
+# Pairs scoring below this are not worth listing as equivalents
+MIN_EQUIVALENT_SCORE = 0.3
+
+# Topics known to cover the same material under names with no word in common,
+# which nothing can score when they are on the placeholder lesson.
+# {subject: [{topic, ...}, ...]}, any two topics of a group in different exam
+# bodies are equivalents with a score of 1.
+CURATED_EQUIVALENTS = {
+    'Mathematics': [
+        {'Indices and logarithms', 'Algebraic expressions'},
+    ],
+}
+
+
+def name_words(topic):
+    return frozenset(normalize_topic(topic).split())
+
+
+def name_similarity(a, b, weights):
+    """Weighted Jaccard overlap of two sets of name words"""
+    union = sum(weights[word] for word in a | b)
+    if not union:
+        return 0.0
+    return sum(weights[word] for word in a & b) / union
+
+
+class TopicEquivalents:
+    """Sparse similarity matrix between topics of one subject across exam bodies
+
+    lesson_text(key) returns the plain text of a topic's authored lesson, or
+    None for topics on the placeholder (its text says nothing about the
+    topic). A pair scores the higher of its name overlap and the TF-IDF
+    cosine of the two lessons, so "Motion" and "Kinematics" match through
+    their shared lesson while "Stoichiometry" matches on its name alone.
+    Name words are weighted by how rare they are within the subject, so
+    "chemistry" in "Organic chemistry" and "Nuclear chemistry" counts for little.
+    Pairs neither can find come from curated, see CURATED_EQUIVALENTS.
+    """
+
+    def __init__(self, keys, lesson_text, curated=CURATED_EQUIVALENTS, min_score=MIN_EQUIVALENT_SCORE):
+        keys = list(keys)
+        counts = {}
+        for key in keys:
+            text = lesson_text(key)
+            if text:
+                counts[key] = Counter(term for term, _, _ in terms(text))
+        vectors = self._tfidf(counts)
+
+        subjects = {}
+        for key in keys:
+            subjects.setdefault(key[1], []).append(key)
+        self.matches = {key: [] for key in keys}
+        for subject, subject_keys in subjects.items():
+            groups = {}
+            for number, group in enumerate(curated.get(subject, ())):
+                for topic in group:
+                    groups[normalize_topic(topic)] = number
+            curated_group = {key: groups.get(normalize_topic(key[2])) for key in subject_keys}
+            names = {key: name_words(key[2]) for key in subject_keys}
+            documents = Counter(word for words in names.values() for word in words)
+            weights = {word: math.log(len(subject_keys) / count) for word, count in documents.items()}
+            for position, a in enumerate(subject_keys):
+                for b in subject_keys[position + 1:]:
+                    if a[0] == b[0]:
+                        continue
+                    score = name_similarity(names[a], names[b], weights)
+                    if a in vectors and b in vectors:
+                        score = max(score, self._cosine(vectors[a], vectors[b]))
+                    if curated_group[a] is not None and curated_group[a] == curated_group[b]:
+                        score = 1.0
+                    if score >= min_score:
+                        self.matches[a].append((b, score))
+                        self.matches[b].append((a, score))
+        for found in self.matches.values():
+            found.sort(key=lambda match: (-match[1], match[0]))
+
+    @staticmethod
+    def _tfidf(counts):
+        """Unit-length TF-IDF vectors, terms found in every lesson carry no weight"""
+        documents = Counter()
+        for frequencies in counts.values():
+            documents.update(frequencies.keys())
+        vectors = {}
+        for key, frequencies in counts.items():
+            vector = {}
+            for term, frequency in frequencies.items():
+                weight = (1 + math.log(frequency)) * math.log(len(counts) / documents[term])
+                if weight:
+                    vector[term] = weight
+            norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+            vectors[key] = {term: weight / norm for term, weight in vector.items()} if norm else {}
+        return vectors
+
+    @staticmethod
+    def _cosine(a, b):
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+    def equivalents(self, key):
+        """[(key, score), ...] for other exam bodies' versions of a topic, best first"""
+        return self.matches.get(key, [])
@@ -0,0 +1,48 @@
+# Topic autocomplete
+# Topic names from every exam body are kept in sorted arrays, so a prefix
+# lookup is one bisect plus a walk over the matches, whatever the syllabus size.
+
+import re
+from bisect import bisect_left
+
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+class TopicSuggester:
+    """Prefix search over topic names, case-insensitive
+
+    Topics whose name starts with the prefix come first, then topics with a
+    later word starting with it ("log" finds "Indices and logarithms").
+    """
+
+    def __init__(self, syllabus):
+        names, words = [], []
+        for exam, subjects in syllabus.items():
+            for subject, topics in subjects.items():
+                for topic in topics:
+                    key = (exam, subject, topic)
+                    folded = topic.casefold()
+                    names.append((folded, key))
+                    for match in _WORD_RE.finditer(folded):
+                        if match.start():
+                            words.append((folded[match.start():], key))
+        names.sort()
+        words.sort()
+        self._names = [name for name, _ in names]
+        self._name_keys = [key for _, key in names]
+        self._words = [word for word, _ in words]
+        self._word_keys = [key for _, key in words]
+
+    def suggest(self, prefix, limit=10, exam=None, subject=None):
+        """Up to limit (exam, subject, topic) keys matching prefix, best first"""
+        prefix = prefix.casefold()
+        found = {}
+        for names, keys in ((self._names, self._name_keys), (self._words, self._word_keys)):
+            position = bisect_left(names, prefix)
+            while position < len(names) and names[position].startswith(prefix) and len(found) < limit:
+                key = keys[position]
+                if (exam is None or key[0] == exam) and (subject is None or key[1] == subject):
+                    found.setdefault(key, None)
+                position += 1
+        return list(found)
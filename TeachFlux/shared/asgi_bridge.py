@@ -0,0 +1,214 @@
+# Serve a WSGI app over ASGI
+# Shared by Lesson-Generator and Auto_grading, whose asgi.py put this
+# directory on sys.path.
+#
+# The event loop owns the sockets: request bodies are read and responses
+# written there, so thousands of idle or slow clients cost no threads. The
+# unchanged Flask handlers run in a bounded thread pool, which is also where
+# their blocking work (CSV writes, SQLite reads) happens, off the loop.
+# The loop drives the response: a pool thread is only taken to call the app
+# or produce its next chunk, never to wait for a client to read one, so a
+# slow reader of a streamed response holds no thread. One chunk is produced
+# ahead of the client, and a response whose client went away is closed.
+
+import asyncio
+import contextvars
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Largest request body read into memory, larger ones are answered with 413
+MAX_BODY_SIZE = 1024 * 1024
+
+
+def build_environ(scope, body):
+    """WSGI environ for an ASGI http scope and its buffered request body"""
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        # The whole body is buffered, chunked uploads included, so its length is known
+        'wsgi.input_terminated': True,
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+        environ['REMOTE_PORT'] = str(scope['client'][1])
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_LENGTH':
+            continue
+        if name != 'CONTENT_TYPE':
+            name = f"HTTP_{name}"
+        # Repeated headers are joined, as a WSGI server would
+        environ[name] = f"{environ[name]},{value}" if name in environ else value
+    return environ
+
+
+class WSGIResponse:
+    """The WSGI side of one request, advanced a step at a time in pool threads"""
+
+    def __init__(self, wsgi_app, environ):
+        self.wsgi_app = wsgi_app
+        self.environ = environ
+        self.status = None
+        self.headers = None
+        self.started = False
+        self.finished = False
+        self.chunks = []
+        self.result = None
+        self.iterator = None
+
+    def start_response(self, status, headers, exc_info=None):
+        if exc_info and self.started:
+            raise exc_info[1].with_traceback(exc_info[2])
+        self.status = int(status.split(' ', 1)[0])
+        self.headers = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+        return self.write
+
+    def write(self, data):
+        """The PEP 3333 write() callable, its data is sent like any other chunk"""
+        if self.status is None:
+            raise AssertionError("write() called before start_response()")
+        if data:
+            self.chunks.append(bytes(data))
+
+    def step(self):
+        """Call the app, or advance its result, until a chunk is ready or it ends"""
+        if self.result is None:
+            self.result = self.wsgi_app(self.environ, self.start_response)
+            self.iterator = iter(self.result)
+        while not self.chunks:
+            chunk = next(self.iterator, None)
+            if chunk is None:
+                self.finished = True
+                return
+            if chunk:
+                self.chunks.append(bytes(chunk))
+
+    def take(self):
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+    def close(self):
+        if hasattr(self.result, 'close'):
+            self.result.close()
+
+
+class WSGIBridge:
+    """ASGI application running a WSGI app in a thread pool of max_threads"""
+
+    def __init__(self, wsgi_app, max_threads=8, max_body_size=MAX_BODY_SIZE):
+        self.wsgi_app = wsgi_app
+        self.max_body_size = max_body_size
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='wsgi')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise ValueError(f"Unsupported ASGI scope type '{scope['type']}'")
+
+        body = await self._read_body(scope, receive)
+        if body is None:
+            await self._send_error(send, 413, b'Request Entity Too Large')
+            return
+        if body is False:
+            return
+
+        disconnected = asyncio.Event()
+        watcher = asyncio.ensure_future(self._watch_disconnect(receive, disconnected))
+        try:
+            await self._respond(WSGIResponse(self.wsgi_app, build_environ(scope, body)), send, disconnected)
+        finally:
+            watcher.cancel()
+
+    async def _read_body(self, scope, receive):
+        """The request body, None when it is over max_body_size, False on disconnect"""
+        for name, value in scope['headers']:
+            if name == b'content-length' and value.isdigit() and int(value) > self.max_body_size:
+                return None
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return False
+            body += message.get('body', b'')
+            if len(body) > self.max_body_size:
+                return None
+            if not message.get('more_body'):
+                return bytes(body)
+
+    async def _respond(self, response, send, disconnected):
+        loop = asyncio.get_running_loop()
+        # Steps run one after another on different pool threads, in the request's own context
+        context = contextvars.copy_context()
+        step = loop.run_in_executor(self.executor, context.run, response.step)
+        try:
+            while True:
+                try:
+                    await step
+                except Exception:
+                    if not response.started and not disconnected.is_set():
+                        await self._send_error(send, 500, b'Internal Server Error')
+                    raise
+                chunks = response.take()
+                if not response.finished:
+                    # The next chunk is produced while this one is written
+                    step = loop.run_in_executor(self.executor, context.run, response.step)
+                if disconnected.is_set():
+                    return
+                try:
+                    if not response.started:
+                        response.started = True
+                        await send({'type': 'http.response.start', 'status': response.status, 'headers': response.headers})
+                    for chunk in chunks:
+                        await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                    if response.finished:
+                        await send({'type': 'http.response.body', 'body': b''})
+                        return
+                except OSError:
+                    disconnected.set()
+                    return
+        finally:
+            # A step still running has to finish before the result is closed
+            if not step.done():
+                await asyncio.wait([step])
+            await loop.run_in_executor(self.executor, context.run, response.close)
+
+    @staticmethod
+    async def _send_error(send, status, body):
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    async def _watch_disconnect(receive, disconnected):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
@@ -0,0 +1,186 @@
+# Checks of the WSGI to ASGI bridge
+# Run with: python check_asgi_bridge.py
+#
+# Drives WSGIBridge directly on an event loop with simulated clients (no
+# server or Flask needed): slow readers of streamed responses must not hold
+# pool threads, a handler stays at most a chunk or two ahead of its client
+# and is closed when the client goes away, oversized bodies get 413 and the
+# write() callable works. Exits non-zero on the first failure.
+
+import asyncio
+import sys
+import time
+
+from asgi_bridge import WSGIBridge
+
+
+def scope(method='GET', path='/', headers=()):
+    return {
+        'type': 'http', 'method': method, 'path': path, 'query_string': b'',
+        'http_version': '1.1', 'headers': list(headers),
+    }
+
+
+class Client:
+    """ASGI receive/send pair for one request, reading each chunk after delay seconds"""
+
+    def __init__(self, body_parts=(b'',), delay=0, disconnect_after=None):
+        self.body_parts = list(body_parts)
+        self.delay = delay
+        self.disconnect_after = disconnect_after
+        self.gone = asyncio.Event()
+        self.status = None
+        self.chunks = []
+        self.complete = False
+
+    async def receive(self):
+        if self.body_parts:
+            part = self.body_parts.pop(0)
+            return {'type': 'http.request', 'body': part, 'more_body': bool(self.body_parts)}
+        await self.gone.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        if message['type'] == 'http.response.start':
+            self.status = message['status']
+            return
+        if message['body']:
+            self.chunks.append(message['body'])
+            await asyncio.sleep(self.delay)
+            if self.disconnect_after is not None and len(self.chunks) >= self.disconnect_after:
+                self.gone.set()
+        if not message.get('more_body'):
+            self.complete = True
+
+    @property
+    def body(self):
+        return b''.join(self.chunks)
+
+
+class StreamingApp:
+    """WSGI app streaming numbered chunks from /stream, answering anything else at once"""
+
+    def __init__(self, chunks=20):
+        self.chunks = chunks
+        self.produced = 0
+        self.ahead = 0
+        self.closed = 0
+
+    def __call__(self, environ, start_response):
+        path = environ['PATH_INFO']
+        if path == '/fail':
+            raise RuntimeError("handler failed")
+        if path == '/echo':
+            body = environ['wsgi.input'].read(int(environ['CONTENT_LENGTH']))
+            start_response('200 OK', [('Content-Type', 'application/octet-stream')])
+            return [body]
+        if path == '/write':
+            write = start_response('200 OK', [('Content-Type', 'text/plain')])
+            write(b'written ')
+            return [b'returned']
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        if path == '/stream':
+            return self.stream(environ.get('check.client'))
+        return [b'quick']
+
+    def stream(self, client):
+        try:
+            for number in range(self.chunks):
+                self.produced += 1
+                if client is not None:
+                    self.ahead = max(self.ahead, self.produced - len(client.chunks))
+                yield f"{number}\n".encode('ascii')
+        finally:
+            self.closed += 1
+
+
+async def call(bridge, client, **kwargs):
+    request = scope(**kwargs)
+    await bridge(request, client.receive, client.send)
+    return client
+
+
+async def check_slow_clients_hold_no_threads():
+    bridge = WSGIBridge(StreamingApp(chunks=20), max_threads=2)
+    # Ten clients reading a chunk every 50 ms, on a pool of two threads
+    slow = [Client(delay=0.05) for _ in range(10)]
+    streams = []
+    for client in slow:
+        streams.append(asyncio.ensure_future(
+            bridge(scope(path='/stream'), client.receive, client.send)))
+    await asyncio.sleep(0.1)
+    started = time.perf_counter()
+    quick = await call(bridge, Client(), path='/')
+    waited = time.perf_counter() - started
+    assert quick.body == b'quick', f"quick request: body {quick.body!r}"
+    assert waited < 0.5, f"quick request waited {waited:.2f}s behind slow clients"
+    await asyncio.gather(*streams)
+    assert all(client.complete for client in slow), "slow clients: response not completed"
+
+
+async def check_backpressure():
+    client = Client(delay=0.01)
+    wsgi_app = StreamingApp(chunks=30)
+    bridge = WSGIBridge(lambda environ, start: wsgi_app(dict(environ, **{'check.client': client}), start), max_threads=2)
+    await call(bridge, client, path='/stream')
+    assert client.body == b''.join(f"{n}\n".encode('ascii') for n in range(30)), "stream: body differs"
+    assert wsgi_app.ahead <= 2, f"stream: handler ran {wsgi_app.ahead} chunks ahead of its client"
+    assert wsgi_app.closed == 1, "stream: result not closed"
+
+
+async def check_disconnect():
+    client = Client(delay=0.01, disconnect_after=3)
+    wsgi_app = StreamingApp(chunks=1000)
+    bridge = WSGIBridge(lambda environ, start: wsgi_app(dict(environ, **{'check.client': client}), start), max_threads=2)
+    await call(bridge, client, path='/stream')
+    assert wsgi_app.produced < 10, f"disconnect: handler produced {wsgi_app.produced} chunks"
+    assert wsgi_app.closed == 1, "disconnect: result not closed"
+
+
+async def check_request_bodies():
+    bridge = WSGIBridge(StreamingApp(), max_threads=2, max_body_size=1000)
+
+    client = await call(bridge, Client([b'a' * 300, b'b' * 300, b'']), method='POST', path='/echo')
+    assert client.status == 200 and client.body == b'a' * 300 + b'b' * 300, "chunked body: not passed on"
+
+    client = await call(bridge, Client([b'x' * 600, b'x' * 600]), method='POST', path='/echo')
+    assert client.status == 413, f"chunked oversized body: status {client.status}"
+
+    client = await call(bridge, Client([b'']), method='POST', path='/echo', headers=[(b'content-length', b'5000')])
+    assert client.status == 413, f"declared oversized body: status {client.status}"
+
+
+async def check_write_and_errors():
+    bridge = WSGIBridge(StreamingApp(), max_threads=2)
+
+    client = await call(bridge, Client(), path='/write')
+    assert client.body == b'written returned', f"write(): body {client.body!r}"
+
+    client = Client()
+    try:
+        await call(bridge, client, path='/fail')
+    except RuntimeError:
+        pass
+    assert client.status == 500, f"failing handler: status {client.status}"
+
+
+def main():
+    checks = [
+        check_slow_clients_hold_no_threads,
+        check_backpressure,
+        check_disconnect,
+        check_request_bodies,
+        check_write_and_errors,
+    ]
+    for check in checks:
+        try:
+            asyncio.run(check())
+        except AssertionError as e:
+            print(f"FAIL: {e}")
+            return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
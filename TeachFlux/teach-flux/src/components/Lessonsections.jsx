@@ -0,0 +1,79 @@
+import React, { useEffect, useRef, useState } from "react";
+
+const API_BASE = "http://127.0.0.1:5000";
+
+// Shows a lesson's table of contents with the first section open, the
+// other sections are only downloaded when the student opens them.
+const Lessonsections = ({ exam, subject, topic }) => {
+  const [toc, setToc] = useState(null);
+  const [sections, setSections] = useState({});
+  const [open, setOpen] = useState(0);
+  const [error, setError] = useState("");
+  const requested = useRef(new Set());
+
+  const lessonUrl =
+    API_BASE +
+    "/api/lessons/" +
+    [exam, subject, topic].map(encodeURIComponent).join("/");
+
+  const loadSection = (index) => {
+    if (requested.current.has(index)) return;
+    requested.current.add(index);
+    fetch(`${lessonUrl}/sections/${index}`)
+      .then((res) => (res.ok ? res.json() : Promise.reject(res.status)))
+      .then((section) =>
+        setSections((loaded) => ({ ...loaded, [index]: section.html }))
+      )
+      .catch(() => {
+        requested.current.delete(index);
+        setError("Could not load this section. Please try again.");
+      });
+  };
+
+  useEffect(() => {
+    setToc(null);
+    setSections({});
+    setOpen(0);
+    setError("");
+    requested.current = new Set();
+    // Contents and the first section load together
+    loadSection(0);
+    fetch(`${lessonUrl}/toc`)
+      .then((res) => (res.ok ? res.json() : Promise.reject(res.status)))
+      .then(setToc)
+      .catch(() => setError("Could not load this lesson. Please try again."));
+  }, [lessonUrl]);
+
+  const toggle = (index) => {
+    setOpen((current) => (current === index ? null : index));
+    loadSection(index);
+  };
+
+  if (error && !toc) return <p className="error-message">{error}</p>;
+  if (!toc) return <p>Loading lesson...</p>;
+
+  return (
+    <div className="lesson-sections">
+      <h3>{toc.title}</h3>
+      {error && <p className="error-message">{error}</p>}
+      {toc.sections.map((section) => (
+        <div className="lesson-section-item" key={section.index}>
+          <button type="button" onClick={() => toggle(section.index)}>
+            {section.heading}
+          </button>
+          {open === section.index &&
+            (sections[section.index] !== undefined ? (
+              <div
+                className="note-content"
+                dangerouslySetInnerHTML={{ __html: sections[section.index] }}
+              />
+            ) : (
+              <p>Loading section...</p>
+            ))}
+        </div>
+      ))}
+    </div>
+  );
+};
+
+export default Lessonsections;
@@ -1,9 +1,16 @@
 import React from "react";
+import { useSearchParams } from "react-router-dom";
 import book from "../assets/book.png";
 import Generatelessonform from "./Generatelessonform";
 import Generatelessonresult from "./Generatelessonresult.jsx";
+import Lessonsections from "./Lessonsections.jsx";
 import Signuptext from "./Signuptext.jsx";
 const Lessoncontent = () => {
+  // /lesson?exam=JAMB&subject=Physics&topic=Motion opens that lesson section by section
+  const [params] = useSearchParams();
+  const exam = params.get("exam");
+  const subject = params.get("subject");
+  const topic = params.get("topic");
   return (
     <div className="lesson-content">
       <Signuptext></Signuptext>
@@ -13,7 +20,13 @@ const Lessoncontent = () => {
       </div>
       <div className="interaction">
         <Generatelessonform />
-        <Generatelessonresult></Generatelessonresult>
+        {exam && subject && topic ? (
+          <div className="lesson-result">
+            <Lessonsections exam={exam} subject={subject} topic={topic} />
+          </div>
+        ) : (
+          <Generatelessonresult></Generatelessonresult>
+        )}
       </div>
     </div>
   );